@@ -214,6 +214,10 @@ GENERATE_FILE_OUTPUTS = True      # Whether to generate Excel/JSON output files
 SCENARIO_TESTING = False          # Whether to run scenario testing
 APPLY_WEATHER_ADJUSTMENT = True   # Whether to apply weather-based forecast adjustments
 
+# Stream Excel summary rows to disk as they are written (xlsxwriter constant_memory).
+# Set XLSX_CONSTANT_MEMORY=0 to disable, e.g. if a writer needs to revisit earlier rows.
+XLSX_CONSTANT_MEMORY = os.environ.get('XLSX_CONSTANT_MEMORY', '1') != '0'
+
 # =============================================================================
 # WEATHER ADJUSTMENT PARAMETERS
 # =============================================================================
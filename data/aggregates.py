@@ -13,6 +13,22 @@ avoiding duplicate calculations in export functions.
 from datetime import datetime
 from typing import Optional
 
+from config import settings
+
+
+def _get_inactive_filters(alias: str = "fr") -> str:
+    """Build the inactive store / store-item filter clauses for an aggregate."""
+    filters = ""
+    if settings.INACTIVE_STORES:
+        inactive_stores_str = ','.join(str(s) for s in settings.INACTIVE_STORES)
+        filters += f"AND {alias}.store_no NOT IN ({inactive_stores_str})\n"
+    if getattr(settings, 'INACTIVE_STORE_ITEMS', None):
+        filters += (
+            f"AND NOT EXISTS (SELECT 1 FROM inactive_store_items i "
+            f"WHERE i.store_no = {alias}.store_no AND i.item_no = {alias}.item_no)\n"
+        )
+    return filters
+
 
 def create_waterfall_aggregate_table(conn, force: bool = False) -> None:
     """
@@ -520,6 +536,468 @@ def populate_daily_summary_aggregate(conn, regions: list, start_date: str, end_d
         print(f"Error populating daily_summary_aggregate: {e}")
 
 
+def create_regional_summary_daily_aggregate_table(conn, force: bool = False) -> None:
+    """
+    Create the regional_summary_daily_aggregate table in DuckDB.
+    
+    This table holds the additive region/date totals behind the regional
+    summary "Daily Summary" sheet; the report derives its ratios from them.
+    Column types match what the equivalent GROUP BY over forecast_results
+    returns, so the report sees the same dtypes either way.
+    
+    Args:
+        conn: DuckDB connection object
+        force: If True, drops existing table first
+    """
+    if force:
+        conn.execute('DROP TABLE IF EXISTS regional_summary_daily_aggregate;')
+    
+    create_query = """
+    CREATE TABLE IF NOT EXISTS regional_summary_daily_aggregate (
+        region_code VARCHAR,
+        date_forecast DATE,
+        
+        -- Counts
+        store_count BIGINT,
+        item_count BIGINT,
+        line_count BIGINT,
+        
+        -- Forecast Quantities
+        total_forecast_pre_store_pass DOUBLE,
+        total_store_level_adj DOUBLE,
+        total_forecast_pre_weather DOUBLE,
+        total_forecast_qty DOUBLE,
+        total_weather_adj DOUBLE,
+        total_forecast_average DOUBLE,
+        
+        -- Historical Trend
+        w4_shipped_total HUGEINT,
+        w3_shipped_total HUGEINT,
+        w2_shipped_total HUGEINT,
+        w1_shipped_total HUGEINT,
+        w4_sold_total HUGEINT,
+        w3_sold_total HUGEINT,
+        w2_sold_total HUGEINT,
+        w1_sold_total HUGEINT,
+        
+        -- Weather Severity (line counts by category)
+        severe_count HUGEINT,
+        high_count HUGEINT,
+        moderate_count HUGEINT,
+        low_count HUGEINT,
+        minimal_count HUGEINT,
+        
+        -- Weather Metrics
+        avg_weather_severity DOUBLE,
+        items_weather_adjusted HUGEINT,
+        
+        -- Metadata
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """
+    
+    try:
+        conn.execute(create_query)
+        print("Table 'regional_summary_daily_aggregate' created successfully.")
+    except Exception as e:
+        print(f"Error creating regional_summary_daily_aggregate table: {e}")
+
+
+def create_regional_summary_store_aggregate_table(conn, force: bool = False) -> None:
+    """
+    Create the regional_summary_store_aggregate table in DuckDB.
+    
+    This table holds the additive region/date/store totals behind the regional
+    summary "Store Summary" sheet; the report derives its ratios from them.
+    
+    Args:
+        conn: DuckDB connection object
+        force: If True, drops existing table first
+    """
+    if force:
+        conn.execute('DROP TABLE IF EXISTS regional_summary_store_aggregate;')
+    
+    create_query = """
+    CREATE TABLE IF NOT EXISTS regional_summary_store_aggregate (
+        region_code VARCHAR,
+        date_forecast DATE,
+        store_no BIGINT,
+        
+        -- Counts
+        item_count BIGINT,
+        line_count BIGINT,
+        
+        -- Forecast Quantities
+        total_forecast_pre_store_pass DOUBLE,
+        total_store_level_adj DOUBLE,
+        total_forecast_pre_weather DOUBLE,
+        total_forecast_qty DOUBLE,
+        total_weather_adj DOUBLE,
+        total_forecast_average DOUBLE,
+        
+        -- Historical Trend
+        w4_shipped_total HUGEINT,
+        w3_shipped_total HUGEINT,
+        w2_shipped_total HUGEINT,
+        w1_shipped_total HUGEINT,
+        w4_sold_total HUGEINT,
+        w3_sold_total HUGEINT,
+        w2_sold_total HUGEINT,
+        w1_sold_total HUGEINT,
+        
+        -- Weather Metrics
+        max_weather_severity FLOAT,
+        max_severity_category VARCHAR,
+        weather_condition VARCHAR,
+        avg_weather_severity DOUBLE,
+        items_weather_adjusted HUGEINT,
+        
+        -- Metadata
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """
+    
+    try:
+        conn.execute(create_query)
+        print("Table 'regional_summary_store_aggregate' created successfully.")
+    except Exception as e:
+        print(f"Error creating regional_summary_store_aggregate table: {e}")
+
+
+def create_regional_summary_item_aggregate_table(conn, force: bool = False) -> None:
+    """
+    Create the regional_summary_item_aggregate table in DuckDB.
+    
+    This table holds the additive region/date/item totals behind the regional
+    summary "Item Summary" sheet; the report derives its ratios from them.
+    
+    Args:
+        conn: DuckDB connection object
+        force: If True, drops existing table first
+    """
+    if force:
+        conn.execute('DROP TABLE IF EXISTS regional_summary_item_aggregate;')
+    
+    create_query = """
+    CREATE TABLE IF NOT EXISTS regional_summary_item_aggregate (
+        region_code VARCHAR,
+        date_forecast DATE,
+        item_no BIGINT,
+        item_desc VARCHAR,
+        
+        -- Counts
+        store_count BIGINT,
+        line_count BIGINT,
+        
+        -- Forecast Quantities
+        total_forecast_pre_store_pass DOUBLE,
+        total_store_level_adj DOUBLE,
+        total_forecast_pre_weather DOUBLE,
+        total_forecast_qty DOUBLE,
+        total_weather_adj DOUBLE,
+        total_forecast_average DOUBLE,
+        
+        -- Historical Trend
+        w4_shipped_total HUGEINT,
+        w3_shipped_total HUGEINT,
+        w2_shipped_total HUGEINT,
+        w1_shipped_total HUGEINT,
+        w4_sold_total HUGEINT,
+        w3_sold_total HUGEINT,
+        w2_sold_total HUGEINT,
+        w1_sold_total HUGEINT,
+        
+        -- Weather Metrics
+        severe_count HUGEINT,
+        high_count HUGEINT,
+        moderate_count HUGEINT,
+        low_count HUGEINT,
+        minimal_count HUGEINT,
+        avg_weather_severity DOUBLE,
+        items_weather_adjusted HUGEINT,
+        
+        -- Metadata
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    """
+    
+    try:
+        conn.execute(create_query)
+        print("Table 'regional_summary_item_aggregate' created successfully.")
+    except Exception as e:
+        print(f"Error creating regional_summary_item_aggregate table: {e}")
+
+
+# Additive totals shared by the daily/store/item regional summary aggregates
+REGIONAL_SUMMARY_TOTAL_COLUMNS = [
+    'total_forecast_pre_store_pass', 'total_store_level_adj',
+    'total_forecast_pre_weather', 'total_forecast_qty',
+    'total_weather_adj', 'total_forecast_average',
+    'w4_shipped_total', 'w3_shipped_total', 'w2_shipped_total', 'w1_shipped_total',
+    'w4_sold_total', 'w3_sold_total', 'w2_sold_total', 'w1_sold_total'
+]
+REGIONAL_SUMMARY_CATEGORY_COLUMNS = [
+    'severe_count', 'high_count', 'moderate_count', 'low_count', 'minimal_count'
+]
+
+
+def _get_regional_summary_rollup_query(regions_str: str, start_date: str, end_date: str,
+                                       inactive_filters: str) -> str:
+    """
+    Build the query that rolls forecast_results up to all regional summary grains.
+    
+    One GROUPING SETS scan produces the region/date, region/date/store and
+    region/date/item rows together; store_grouping / item_grouping tell the
+    grains apart. Weather category counts are taken in two stages: rows are
+    counted per (date, item, category) first, and that small result is turned
+    into the five count columns by a PIVOT. NULL categories count as MINIMAL.
+    """
+    return f"""
+    WITH category_counts AS (
+        SELECT
+            GROUPING(item_no, item_desc) AS item_grouping,
+            region_code,
+            date_forecast,
+            item_no,
+            item_desc,
+            SUM(COALESCE("SEVERE", 0)) AS severe_count,
+            SUM(COALESCE("HIGH", 0)) AS high_count,
+            SUM(COALESCE("MODERATE", 0)) AS moderate_count,
+            SUM(COALESCE("LOW", 0)) AS low_count,
+            SUM(COALESCE("MINIMAL", 0)) AS minimal_count
+        FROM (
+            PIVOT (
+                SELECT
+                    fr.region_code,
+                    fr.date_forecast,
+                    fr.item_no,
+                    fr.item_desc,
+                    COALESCE(fr.weather_severity_category, 'MINIMAL') AS category,
+                    COUNT(*) AS line_count
+                FROM forecast_results fr
+                WHERE fr.region_code IN ('{regions_str}')
+                AND fr.date_forecast BETWEEN '{start_date}' AND '{end_date}'
+                {inactive_filters}
+                GROUP BY 1, 2, 3, 4, 5
+            )
+            ON category IN ('SEVERE', 'HIGH', 'MODERATE', 'LOW', 'MINIMAL')
+            USING SUM(line_count)
+        ) per_item
+        GROUP BY GROUPING SETS (
+            (region_code, date_forecast),
+            (region_code, date_forecast, item_no, item_desc)
+        )
+    ),
+    totals AS (
+        SELECT
+            GROUPING(fr.store_no) AS store_grouping,
+            GROUPING(fr.item_no, fr.item_desc) AS item_grouping,
+            fr.region_code,
+            fr.date_forecast,
+            fr.store_no,
+            fr.item_no,
+            fr.item_desc,
+            
+            -- Counts
+            COUNT(DISTINCT fr.store_no) AS store_count,
+            COUNT(DISTINCT fr.item_no) AS item_count,
+            COUNT(*) AS line_count,
+            
+            -- Forecast Quantities
+            SUM(COALESCE(fr.forecast_qty_pre_store_pass, fr.forecast_quantity)) AS total_forecast_pre_store_pass,
+            SUM(COALESCE(fr.store_level_adjustment_qty, 0)) AS total_store_level_adj,
+            SUM(COALESCE(fr.forecast_qty_pre_weather, fr.forecast_quantity)) AS total_forecast_pre_weather,
+            SUM(fr.forecast_quantity) AS total_forecast_qty,
+            SUM(COALESCE(fr.weather_adjustment_qty, 0)) AS total_weather_adj,
+            SUM(fr.forecast_average) AS total_forecast_average,
+            
+            -- Historical Trend
+            SUM(fr.w4_shipped) AS w4_shipped_total,
+            SUM(fr.w3_shipped) AS w3_shipped_total,
+            SUM(fr.w2_shipped) AS w2_shipped_total,
+            SUM(fr.w1_shipped) AS w1_shipped_total,
+            SUM(fr.w4_sold) AS w4_sold_total,
+            SUM(fr.w3_sold) AS w3_sold_total,
+            SUM(fr.w2_sold) AS w2_sold_total,
+            SUM(fr.w1_sold) AS w1_sold_total,
+            
+            -- Weather Metrics
+            MAX(COALESCE(fr.weather_severity_score, 0)) AS max_weather_severity,
+            MAX(fr.weather_severity_category) AS max_severity_category,
+            MAX(fr.weather_day_condition) AS weather_condition,
+            ROUND(AVG(COALESCE(fr.weather_severity_score, 0)), 2) AS avg_weather_severity,
+            SUM(CASE WHEN fr.weather_adjusted = 1 THEN 1 ELSE 0 END) AS items_weather_adjusted
+            
+        FROM forecast_results fr
+        WHERE fr.region_code IN ('{regions_str}')
+        AND fr.date_forecast BETWEEN '{start_date}' AND '{end_date}'
+        {inactive_filters}
+        GROUP BY GROUPING SETS (
+            (fr.region_code, fr.date_forecast),
+            (fr.region_code, fr.date_forecast, fr.store_no),
+            (fr.region_code, fr.date_forecast, fr.item_no, fr.item_desc)
+        )
+    )
+    SELECT
+        t.*,
+        {', '.join(f'cc.{col}' for col in REGIONAL_SUMMARY_CATEGORY_COLUMNS)}
+    FROM totals t
+    LEFT JOIN category_counts cc
+        ON t.store_grouping = 1
+        AND t.item_grouping = cc.item_grouping
+        AND t.region_code = cc.region_code
+        AND t.date_forecast = cc.date_forecast
+        AND t.item_no IS NOT DISTINCT FROM cc.item_no
+        AND t.item_desc IS NOT DISTINCT FROM cc.item_desc
+    """
+
+
+def populate_regional_summary_aggregates(conn, regions: list, start_date: str, end_date: str) -> None:
+    """
+    Populate the regional summary daily, store and item aggregate tables.
+    
+    forecast_results is scanned once into a temporary roll-up holding all
+    three grains, and each table is then filled from that roll-up. Inactive
+    stores and store-item combinations are excluded here, the same way the
+    regional summary report filters them.
+    
+    Args:
+        conn: DuckDB connection object
+        regions: List of region codes
+        start_date: Start date string
+        end_date: End date string
+    """
+    regions_str = "', '".join(regions)
+    inactive_filters = _get_inactive_filters("fr")
+    totals = ', '.join(REGIONAL_SUMMARY_TOTAL_COLUMNS)
+    category_counts = ', '.join(REGIONAL_SUMMARY_CATEGORY_COLUMNS)
+    
+    # Columns per table, in table order; the WHERE picks the matching grain
+    insert_queries = {
+        'regional_summary_daily_aggregate': f"""
+            SELECT
+                region_code, date_forecast,
+                store_count, item_count, line_count,
+                {totals},
+                {category_counts},
+                avg_weather_severity, items_weather_adjusted,
+                CURRENT_TIMESTAMP AS created_at
+            FROM regional_summary_rollup
+            WHERE store_grouping = 1 AND item_grouping = 3
+            ORDER BY region_code, date_forecast
+        """,
+        'regional_summary_store_aggregate': f"""
+            SELECT
+                region_code, date_forecast, store_no,
+                item_count, line_count,
+                {totals},
+                max_weather_severity, max_severity_category, weather_condition,
+                avg_weather_severity, items_weather_adjusted,
+                CURRENT_TIMESTAMP AS created_at
+            FROM regional_summary_rollup
+            WHERE store_grouping = 0
+            ORDER BY region_code, date_forecast, store_no
+        """,
+        'regional_summary_item_aggregate': f"""
+            SELECT
+                region_code, date_forecast, item_no, item_desc,
+                store_count, line_count,
+                {totals},
+                {category_counts},
+                avg_weather_severity, items_weather_adjusted,
+                CURRENT_TIMESTAMP AS created_at
+            FROM regional_summary_rollup
+            WHERE item_grouping = 0
+            ORDER BY region_code, date_forecast, item_no, item_desc
+        """,
+    }
+    
+    try:
+        conn.execute(f"""
+            CREATE OR REPLACE TEMP TABLE regional_summary_rollup AS
+            {_get_regional_summary_rollup_query(regions_str, start_date, end_date, inactive_filters)}
+        """)
+        
+        for table, select_query in insert_queries.items():
+            # First clear existing data for this date range
+            conn.execute(f"""
+                DELETE FROM {table}
+                WHERE region_code IN ('{regions_str}')
+                AND date_forecast BETWEEN '{start_date}' AND '{end_date}'
+            """)
+            conn.execute(f"INSERT INTO {table} {select_query}")
+            count = conn.execute(f"""
+                SELECT COUNT(*) FROM {table}
+                WHERE region_code IN ('{regions_str}')
+                AND date_forecast BETWEEN '{start_date}' AND '{end_date}'
+            """).fetchone()[0]
+            print(f"  {table}: {count} rows populated")
+    except Exception as e:
+        print(f"Error populating regional summary aggregates: {e}")
+    finally:
+        conn.execute("DROP TABLE IF EXISTS regional_summary_rollup")
+
+
+def populate_store_names_by_region(conn) -> None:
+    """
+    Rebuild the store_names_by_region lookup from the shrink table.
+    
+    Holds the latest store name per (region, store) so reports join a small
+    lookup instead of re-deriving the latest posting from shrink per query.
+    Built with CREATE OR REPLACE ... AS so the columns keep shrink's types.
+    
+    Args:
+        conn: DuckDB connection object
+    """
+    # One row per (region, store): arg_max takes the name on the latest
+    # posting in a single grouped pass
+    rebuild_query = """
+    CREATE OR REPLACE TABLE store_names_by_region AS
+    SELECT
+        region_code,
+        store_no,
+        arg_max(store_name, date_posting) AS store_name
+    FROM main.shrink
+    GROUP BY region_code, store_no
+    """
+    
+    try:
+        conn.execute(rebuild_query)
+        count = conn.execute("SELECT COUNT(*) FROM store_names_by_region").fetchone()[0]
+        print(f"  Store names by region: {count} rows populated")
+    except Exception as e:
+        print(f"Error populating store_names_by_region: {e}")
+
+
+def populate_inactive_store_items(conn) -> None:
+    """
+    Rebuild the inactive_store_items lookup from settings.INACTIVE_STORE_ITEMS.
+    
+    The inactive store-item filters anti-join this table instead of expanding
+    the settings list into an OR chain evaluated on every row.
+    
+    Args:
+        conn: DuckDB connection object
+    """
+    inactive_store_items = getattr(settings, 'INACTIVE_STORE_ITEMS', None) or []
+    
+    try:
+        conn.execute("""
+            CREATE OR REPLACE TABLE inactive_store_items (
+                store_no BIGINT,
+                item_no BIGINT
+            )
+        """)
+        if inactive_store_items:
+            conn.executemany(
+                "INSERT INTO inactive_store_items VALUES (?, ?)",
+                [list(pair) for pair in inactive_store_items]
+            )
+        print(f"  Inactive store items: {len(inactive_store_items)} rows populated")
+    except Exception as e:
+        print(f"Error populating inactive_store_items: {e}")
+
+
 def create_all_aggregate_tables(conn, force: bool = False) -> None:
     """
     Create all aggregate tables in DuckDB.
@@ -531,6 +1009,9 @@ def create_all_aggregate_tables(conn, force: bool = False) -> None:
     print("\nCreating aggregate tables...")
     create_waterfall_aggregate_table(conn, force)
     create_daily_summary_aggregate_table(conn, force)
+    create_regional_summary_daily_aggregate_table(conn, force)
+    create_regional_summary_store_aggregate_table(conn, force)
+    create_regional_summary_item_aggregate_table(conn, force)
 
 
 def populate_all_aggregates(conn, regions: list, start_date: str, end_date: str) -> None:
@@ -547,6 +1028,9 @@ def populate_all_aggregates(conn, regions: list, start_date: str, end_date: str)
         end_date: End date string
     """
     print("\nPopulating aggregate tables...")
+    populate_inactive_store_items(conn)
     populate_waterfall_aggregate(conn, regions, start_date, end_date)
     populate_daily_summary_aggregate(conn, regions, start_date, end_date)
+    populate_regional_summary_aggregates(conn, regions, start_date, end_date)
+    populate_store_names_by_region(conn)
     print("Aggregate tables populated successfully.")
@@ -355,8 +355,16 @@ def create_forecast_results_table(conn: duckdb.DuckDBPyConnection, force: bool =
     );
     """
     
+    # Every report and aggregate filters on region + forecast date, and the
+    # per-region/date reruns delete by the same key
+    create_index_query = """
+    CREATE INDEX IF NOT EXISTS idx_forecast_results_region_date
+    ON forecast_results (region_code, date_forecast);
+    """
+    
     try:
         conn.execute(create_table_query)
+        conn.execute(create_index_query)
         print("Table 'forecast_results' created successfully.")
     except Exception as e:
         print(f"Error creating table: {e}")
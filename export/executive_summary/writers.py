@@ -48,15 +48,15 @@ def write_regional_summary_sheet(wb, conn, regions: list,
     ws = wb.add_worksheet('Regional Summary')
     
     # Set column widths
-    ws.set_column('A:A', 10)   # Region
-    ws.set_column('B:B', 12)   # Date
-    ws.set_column('C:C', 10)   # Day
-    ws.set_column('D:E', 8)    # Stores
-    ws.set_column('F:F', 8)    # Items
-    ws.set_column('G:H', 14)   # Forecast Shipped/Sales
-    ws.set_column('I:J', 14)   # LW Shipped/Sold
-    ws.set_column('K:L', 12)   # Delta %
-    ws.set_column('M:N', 12)   # Shrink %
+    ws.set_column(0, 0, 10)    # Region
+    ws.set_column(1, 1, 12)    # Date
+    ws.set_column(2, 2, 10)    # Day
+    ws.set_column(3, 4, 8)     # Stores
+    ws.set_column(5, 5, 8)     # Items
+    ws.set_column(6, 7, 14)    # Forecast Shipped/Sales
+    ws.set_column(8, 9, 14)    # LW Shipped/Sold
+    ws.set_column(10, 11, 12)  # Delta %
+    ws.set_column(12, 13, 12)  # Shrink %
     
     # Title
     ws.merge_range('A1:N1', 'Executive Summary - Regional Overview', formats['title'])
@@ -226,14 +226,14 @@ def write_waterfall_sheet(wb, conn, regions: list,
     ws = wb.add_worksheet('Waterfall Analysis')
     
     # Set column widths
-    ws.set_column('A:A', 10)   # Region
-    ws.set_column('B:B', 12)   # Date
-    ws.set_column('C:C', 10)   # Day
-    ws.set_column('D:D', 35)   # Component
-    ws.set_column('E:E', 14)   # Quantity
-    ws.set_column('F:F', 12)   # % of LW Sales
-    ws.set_column('G:G', 12)   # Items/Stores
-    ws.set_column('H:H', 55)   # Notes/Remarks
+    ws.set_column(0, 0, 10)    # Region
+    ws.set_column(1, 1, 12)    # Date
+    ws.set_column(2, 2, 10)    # Day
+    ws.set_column(3, 3, 35)    # Component
+    ws.set_column(4, 4, 14)    # Quantity
+    ws.set_column(5, 5, 12)    # % of LW Sales
+    ws.set_column(6, 6, 12)    # Items/Stores
+    ws.set_column(7, 7, 55)    # Notes/Remarks
     
     # Title
     ws.merge_range('A1:H1', 'Waterfall Analysis - Forecast Adjustments', formats['title'])
@@ -572,23 +572,23 @@ def write_waterfall_columnar_sheet(wb, conn, regions: list,
     ws = wb.add_worksheet('Waterfall Summary')
     
     # Set column widths for detailed waterfall
-    ws.set_column('A:A', 10)   # Region
-    ws.set_column('B:B', 12)   # Date
-    ws.set_column('C:C', 12)   # LW Sales
-    ws.set_column('D:D', 12)   # Baseline Uplift
-    ws.set_column('E:E', 11)   # Decline Adj
-    ws.set_column('F:F', 11)   # High Shrink
-    ws.set_column('G:G', 12)   # Cover Default
-    ws.set_column('H:H', 12)   # Cover Sold-Out
-    ws.set_column('I:I', 11)   # Safety Stock
-    ws.set_column('J:J', 11)   # Rounding
-    ws.set_column('K:K', 11)   # Store Pass
-    ws.set_column('L:L', 11)   # Promo
-    ws.set_column('M:M', 11)   # Holiday
-    ws.set_column('N:N', 11)   # Cannibalism
-    ws.set_column('O:O', 11)   # Weather
-    ws.set_column('P:P', 12)   # Final Fcst
-    ws.set_column('Q:Q', 10)   # Δ %
+    ws.set_column(0, 0, 10)    # Region
+    ws.set_column(1, 1, 12)    # Date
+    ws.set_column(2, 2, 12)    # LW Sales
+    ws.set_column(3, 3, 12)    # Baseline Uplift
+    ws.set_column(4, 4, 11)    # Decline Adj
+    ws.set_column(5, 5, 11)    # High Shrink
+    ws.set_column(6, 6, 12)    # Cover Default
+    ws.set_column(7, 7, 12)    # Cover Sold-Out
+    ws.set_column(8, 8, 11)    # Safety Stock
+    ws.set_column(9, 9, 11)    # Rounding
+    ws.set_column(10, 10, 11)  # Store Pass
+    ws.set_column(11, 11, 11)  # Promo
+    ws.set_column(12, 12, 11)  # Holiday
+    ws.set_column(13, 13, 11)  # Cannibalism
+    ws.set_column(14, 14, 11)  # Weather
+    ws.set_column(15, 15, 12)  # Final Fcst
+    ws.set_column(16, 16, 10)  # Δ %
     
     # Title
     ws.merge_range('A1:Q1', 'Waterfall Summary - Detailed Component Breakdown', formats['title'])
@@ -721,23 +721,23 @@ def write_weather_summary_sheet(wb, conn, regions: list,
     ws = wb.add_worksheet('Weather Impact')
     
     # Set column widths - expanded for more weather data
-    ws.set_column('A:A', 8)    # Region
-    ws.set_column('B:B', 11)   # Date
-    ws.set_column('C:C', 10)   # Day
-    ws.set_column('D:H', 7)    # Severity store counts
-    ws.set_column('I:I', 8)    # Total Stores
-    ws.set_column('J:K', 8)    # Avg/Max Severity
-    ws.set_column('L:M', 8)    # Impact factors
-    ws.set_column('N:O', 6)    # Rain
-    ws.set_column('P:Q', 6)    # Snow
-    ws.set_column('R:S', 6)    # Snow Depth
-    ws.set_column('T:U', 6)    # Wind
-    ws.set_column('V:W', 6)    # Visibility
-    ws.set_column('X:Y', 6)    # Temp range
-    ws.set_column('Z:Z', 10)   # Items Adjusted
-    ws.set_column('AA:AA', 10) # Weather Adj
-    ws.set_column('AB:AB', 8)  # Reduction %
-    ws.set_column('AC:AC', 16) # Primary Condition
+    ws.set_column(0, 0, 8)     # Region
+    ws.set_column(1, 1, 11)    # Date
+    ws.set_column(2, 2, 10)    # Day
+    ws.set_column(3, 7, 7)     # Severity store counts
+    ws.set_column(8, 8, 8)     # Total Stores
+    ws.set_column(9, 10, 8)    # Avg/Max Severity
+    ws.set_column(11, 12, 8)   # Impact factors
+    ws.set_column(13, 14, 6)   # Rain
+    ws.set_column(15, 16, 6)   # Snow
+    ws.set_column(17, 18, 6)   # Snow Depth
+    ws.set_column(19, 20, 6)   # Wind
+    ws.set_column(21, 22, 6)   # Visibility
+    ws.set_column(23, 24, 6)   # Temp range
+    ws.set_column(25, 25, 10)  # Items Adjusted
+    ws.set_column(26, 26, 10)  # Weather Adj
+    ws.set_column(27, 27, 8)   # Reduction %
+    ws.set_column(28, 28, 16)  # Primary Condition
     
     # Title
     ws.merge_range('A1:AC1', 'Weather Impact Summary - All Weather Variables', formats['title'])
@@ -943,15 +943,15 @@ def write_daily_totals_sheet(wb, conn, regions: list,
     ws = wb.add_worksheet('Daily Totals')
     
     # Set column widths
-    ws.set_column('A:A', 12)   # Date
-    ws.set_column('B:B', 10)   # Day
-    ws.set_column('C:C', 10)   # Regions
-    ws.set_column('D:D', 10)   # Stores
-    ws.set_column('E:E', 10)   # Items
-    ws.set_column('F:G', 14)   # Forecast qty
-    ws.set_column('H:I', 14)   # LW qty
-    ws.set_column('J:K', 14)   # Adjustments
-    ws.set_column('L:M', 12)   # Percentages
+    ws.set_column(0, 0, 12)    # Date
+    ws.set_column(1, 1, 10)    # Day
+    ws.set_column(2, 2, 10)    # Regions
+    ws.set_column(3, 3, 10)    # Stores
+    ws.set_column(4, 4, 10)    # Items
+    ws.set_column(5, 6, 14)    # Forecast qty
+    ws.set_column(7, 8, 14)    # LW qty
+    ws.set_column(9, 10, 14)   # Adjustments
+    ws.set_column(11, 12, 12)  # Percentages
     
     # Title
     ws.merge_range('A1:M1', 'Company-Wide Daily Totals', formats['title'])
@@ -21,6 +21,7 @@ NOTE: This module has been refactored into smaller components:
 
 import os
 import xlsxwriter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 from config import settings
@@ -32,13 +33,22 @@ from .summary_writers import (
     write_store_summary_sheet,
     write_item_summary_sheet,
     write_item_detail_sheet,
-    write_weather_impact_sheet
+    write_weather_impact_sheet,
+    fetch_multi_region_sheet_dfs,
+    prefetch_sheet_data
 )
 
+# Number of worker threads used to run the sheet queries concurrently
+SUMMARY_QUERY_WORKERS = 4
+
+# Number of regions exported concurrently by export_all_regional_summaries
+REGION_EXPORT_WORKERS = 4
+
 
 def export_regional_summary(conn, region: str,
                             start_date: datetime, end_date: datetime,
-                            output_dir: str = None) -> str:
+                            output_dir: str = None,
+                            shared_data: dict = None) -> str:
     """
     Export comprehensive regional summary to Excel.
     
@@ -55,6 +65,8 @@ def export_regional_summary(conn, region: str,
         start_date: Start date
         end_date: End date
         output_dir: Output directory (default: settings.EXCEL_OUTPUT_DIR/excel_summary)
+        shared_data: Sheet DataFrames already fetched for this region
+            (see fetch_multi_region_sheet_dfs)
         
     Returns:
         Path to the created Excel file
@@ -77,18 +89,27 @@ def export_regional_summary(conn, region: str,
     
     print(f"Creating regional summary for {region}: {filepath}")
     
-    # Create workbook
-    wb = xlsxwriter.Workbook(filepath, {'strings_to_numbers': True})
+    # Create workbook (constant_memory flushes each row as soon as the next starts)
+    wb = xlsxwriter.Workbook(filepath, {
+        'strings_to_numbers': True,
+        'constant_memory': settings.XLSX_CONSTANT_MEMORY
+    })
     
     # Create formats
     formats = create_summary_formats(wb)
     
-    # Create worksheets
-    write_daily_summary_sheet(wb, conn, region, start_str, end_str, formats)
-    write_store_summary_sheet(wb, conn, region, start_str, end_str, formats)
-    write_item_summary_sheet(wb, conn, region, start_str, end_str, formats)
-    write_weather_impact_sheet(wb, conn, region, start_str, end_str, formats)
-    write_item_detail_sheet(wb, conn, region, start_str, end_str, formats)
+    # Run all sheet queries on a thread pool; worksheets are still written
+    # serially (and in order) on this thread since xlsxwriter is not thread-safe
+    with ThreadPoolExecutor(max_workers=SUMMARY_QUERY_WORKERS) as executor:
+        prefetched = prefetch_sheet_data(executor, conn, region, start_str, end_str,
+                                         shared_data)
+        
+        # Create worksheets
+        write_daily_summary_sheet(wb, conn, region, start_str, end_str, formats, prefetched)
+        write_store_summary_sheet(wb, conn, region, start_str, end_str, formats, prefetched)
+        write_item_summary_sheet(wb, conn, region, start_str, end_str, formats, prefetched)
+        write_weather_impact_sheet(wb, conn, region, start_str, end_str, formats, prefetched)
+        write_item_detail_sheet(wb, conn, region, start_str, end_str, formats, prefetched)
     
     # Close workbook
     wb.close()
@@ -113,12 +134,45 @@ def export_all_regional_summaries(conn, regions: list,
     Returns:
         List of created file paths
     """
+    # Sheets that support it are queried once for all regions up front
+    try:
+        shared_data = fetch_multi_region_sheet_dfs(
+            conn, regions,
+            start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+        )
+    except Exception as e:
+        print(f"Error fetching multi-region summary data: {e}")
+        shared_data = {}
+    
+    # Each region writes its own workbook, so regions run on a thread pool.
+    # Threads (not processes) because the caller's connection holds the
+    # DuckDB file lock; each region gets its own cursor on that connection.
     filepaths = []
-    for region in regions:
-        try:
-            filepath = export_regional_summary(conn, region, start_date, end_date, output_dir)
-            filepaths.append(filepath)
-        except Exception as e:
-            print(f"Error exporting summary for region {region}: {e}")
+    workers = max(1, min(REGION_EXPORT_WORKERS, len(regions)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            (region, executor.submit(_export_region_on_cursor, conn, region,
+                                     start_date, end_date, output_dir,
+                                     shared_data.get(region)))
+            for region in regions
+        ]
+        for region, future in futures:
+            try:
+                filepaths.append(future.result())
+            except Exception as e:
+                print(f"Error exporting summary for region {region}: {e}")
     
     return filepaths
+
+
+def _export_region_on_cursor(conn, region: str,
+                             start_date: datetime, end_date: datetime,
+                             output_dir: str = None,
+                             shared_data: dict = None) -> str:
+    """Run export_regional_summary on a dedicated cursor of ``conn``."""
+    cursor = conn.cursor()
+    try:
+        return export_regional_summary(cursor, region, start_date, end_date,
+                                       output_dir, shared_data)
+    finally:
+        cursor.close()
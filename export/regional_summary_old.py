@@ -52,6 +52,29 @@ SEVERITY_ICONS = {
     'SEVERE': '🔴'
 }
 
+# Static legend rows for the Weather Impact sheet: (label, format key, description)
+SEVERITY_LEGEND_ITEMS = (
+    (f"{SEVERITY_ICONS['SEVERE']} SEVERE (7-10)", 'severity_severe', 'Dangerous conditions - significant travel hazard'),
+    (f"{SEVERITY_ICONS['HIGH']} HIGH (5-7)", 'severity_high', 'Poor conditions - notable impact on foot traffic'),
+    (f"{SEVERITY_ICONS['MODERATE']} MODERATE (3-5)", 'severity_moderate', 'Fair conditions - some impact expected'),
+    (f"{SEVERITY_ICONS['LOW']} LOW (1.5-3)", 'severity_low', 'Minor conditions - minimal impact'),
+    (f"{SEVERITY_ICONS['MINIMAL']} MINIMAL (0-1.5)", 'severity_minimal', 'Good conditions - no weather impact'),
+)
+
+# Static weather icon legend rows: (icon, description)
+WEATHER_ICON_LEGEND = (
+    (WEATHER_ICONS['severe'], 'Severe/Dangerous'),
+    (WEATHER_ICONS['thunderstorm'], 'Thunderstorm'),
+    (WEATHER_ICONS['snow_heavy'], 'Heavy Snow'),
+    (WEATHER_ICONS['snow'], 'Snow'),
+    (WEATHER_ICONS['rain_heavy'], 'Heavy Rain'),
+    (WEATHER_ICONS['rain'], 'Rain'),
+    (WEATHER_ICONS['fog'], 'Fog/Mist'),
+    (WEATHER_ICONS['wind'], 'High Wind'),
+    (WEATHER_ICONS['extreme_cold'], 'Extreme Cold'),
+    (WEATHER_ICONS['clear'], 'Clear/Sunny'),
+)
+
 
 def get_weather_indicator_icon(condition: str, severity_category: str = None,
                                 snow_amount: float = 0, rain_amount: float = 0,
@@ -125,6 +148,62 @@ def get_weather_indicator_icon(condition: str, severity_category: str = None,
     return SEVERITY_ICONS.get(severity_category, WEATHER_ICONS['clear'])
 
 
+def get_weather_indicator_icon_expr(condition: str, severity_category: str,
+                                    snow_amount: str, rain_amount: str,
+                                    temp_min: str, temp_max: str,
+                                    wind_speed: str, severity_score: str) -> pl.Expr:
+    """
+    Vectorized get_weather_indicator_icon over DataFrame columns.
+    
+    Args are column names. Nulls are treated the way the row-wise callers
+    coerce them: empty condition, MINIMAL category and 0 for the amounts.
+    
+    Returns:
+        Polars expression producing the icon string for every row
+    """
+    cond = pl.col(condition).fill_null('')
+    category = (
+        pl.when(pl.col(severity_category).is_null() | (pl.col(severity_category) == ''))
+        .then(pl.lit('MINIMAL'))
+        .otherwise(pl.col(severity_category))
+    )
+    snow = pl.col(snow_amount).fill_null(0)
+    rain = pl.col(rain_amount).fill_null(0)
+    wind = pl.col(wind_speed).fill_null(0)
+    score = pl.col(severity_score).fill_null(0)
+    
+    def has(*words):
+        # One case-insensitive multi-keyword pass instead of lowercasing the
+        # column and testing each keyword separately
+        return cond.str.contains_any(list(words), ascii_case_insensitive=True)
+    
+    def category_icon(default):
+        expr = pl.when(category == 'SEVERE').then(pl.lit(SEVERITY_ICONS['SEVERE']))
+        for cat in ('HIGH', 'MODERATE', 'LOW', 'MINIMAL'):
+            expr = expr.when(category == cat).then(pl.lit(SEVERITY_ICONS[cat]))
+        return expr.otherwise(pl.lit(default))
+    
+    return (
+        pl.when(cond == '').then(category_icon('❓'))
+        .when((score >= 7) | (category == 'SEVERE')).then(pl.lit(WEATHER_ICONS['severe']))
+        .when((snow >= 6) | has('blizzard')).then(pl.lit(WEATHER_ICONS['snow_heavy']))
+        .when((snow >= 2) | has('snow')).then(pl.lit(WEATHER_ICONS['snow']))
+        .when(snow > 0).then(pl.lit(WEATHER_ICONS['snow_light']))
+        .when(has('thunder', 'storm')).then(pl.lit(WEATHER_ICONS['thunderstorm']))
+        .when(rain >= 1).then(pl.lit(WEATHER_ICONS['rain_heavy']))
+        .when((rain >= 0.25) | has('rain')).then(pl.lit(WEATHER_ICONS['rain']))
+        .when((rain > 0) | has('drizzle', 'shower')).then(pl.lit(WEATHER_ICONS['rain_light']))
+        .when(has('fog', 'mist')).then(pl.lit(WEATHER_ICONS['fog']))
+        .when(wind >= 30).then(pl.lit(WEATHER_ICONS['wind']))
+        .when(pl.col(temp_min) < 20).then(pl.lit(WEATHER_ICONS['extreme_cold']))
+        .when(pl.col(temp_max) > 100).then(pl.lit(WEATHER_ICONS['extreme_heat']))
+        .when(has('clear', 'sunny')).then(pl.lit(WEATHER_ICONS['clear']))
+        .when(has('partly', 'partial')).then(pl.lit(WEATHER_ICONS['partly_cloudy']))
+        .when(has('cloud', 'overcast')).then(pl.lit(WEATHER_ICONS['cloudy']))
+        .otherwise(category_icon(WEATHER_ICONS['clear']))
+    )
+
+
 # =============================================================================
 # COLOR PALETTES FOR CONDITIONAL FORMATTING
 # =============================================================================
@@ -1082,10 +1161,10 @@ def write_daily_summary_sheet(wb, conn, region: str,
     ws.set_column('Z:AA', 12)  # Delta, Delta %
     
     # Title
-    ws.merge_range('A1:AA1', f'Daily Forecast Summary - Region {region}', formats['title'])
-    ws.merge_range('A2:AA2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:AA1', f'Daily Forecast Summary - Region {region}', formats['title'])
+    ws.merge_range('A2:AA2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     # Column headers - reorganized per improvements
     headers = [
@@ -1361,10 +1440,10 @@ def write_store_summary_sheet(wb, conn, region: str,
     ws.set_column('V:W', 12)   # Delta columns
     
     # Title
-    ws.merge_range('A1:W1', f'Store Daily Summary - Region {region}', formats['title'])
-    ws.merge_range('A2:W2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:W1', f'Store Daily Summary - Region {region}', formats['title'])
+    ws.merge_range('A2:W2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     # Column headers
     headers = [
@@ -1531,10 +1610,10 @@ def write_item_summary_sheet(wb, conn, region: str,
     ws.set_column('Y:Z', 12)   # Delta, Delta %
     
     # Title
-    ws.merge_range('A1:Z1', f'Item Daily Summary - Region {region}', formats['title'])
-    ws.merge_range('A2:Z2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:Z1', f'Item Daily Summary - Region {region}', formats['title'])
+    ws.merge_range('A2:Z2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     # Column headers - same metrics as Daily Summary but by item
     headers = [
@@ -1816,10 +1895,10 @@ def write_item_summary_sheet(wb, conn, region: str,
     ws.set_column('Y:Z', 12)   # Delta, Delta %
     
     # Title
-    ws.merge_range('A1:Z1', f'Item Daily Summary - Region {region}', formats['title'])
-    ws.merge_range('A2:Z2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:Z1', f'Item Daily Summary - Region {region}', formats['title'])
+    ws.merge_range('A2:Z2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     # Column headers - same metrics as Daily Summary but by item
     headers = [
@@ -2081,10 +2160,10 @@ def write_item_detail_sheet(wb, conn, region: str,
     ws = wb.add_worksheet('Item Details')
     
     # Title
-    ws.merge_range('A1:AB1', f'Item/Store Details - Region {region}', formats['title'])
-    ws.merge_range('A2:AB2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:AB1', f'Item/Store Details - Region {region}', formats['title'])
+    ws.merge_range('A2:AB2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     # Get data
     query = get_item_detail_query(region, start_date, end_date)
@@ -2215,16 +2294,13 @@ def write_weather_impact_sheet(wb, conn, region: str,
     ws = wb.add_worksheet('Weather Impact')
     
     # Title
-    ws.merge_range('A1:S1', f'Weather Impact Summary - Region {region}', formats['title'])
-    ws.merge_range('A2:S2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:S1', f'Weather Impact Summary - Region {region}', formats['title'])
+    ws.merge_range('A2:S2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     # Get weather database path
-    weather_db_path = os.path.join(
-        os.path.dirname(os.path.dirname(__file__)),
-        'data_store', 'weather.db'
-    )
+    weather_db_path = settings.WEATHER_DB_PATH
     
     # Get store names from forecast database
     store_names_query = f'''
@@ -2254,17 +2330,21 @@ def write_weather_impact_sheet(wb, conn, region: str,
     '''
     
     try:
-        store_names_df = conn.sql(store_names_query).to_df()
-        store_names_dict = dict(zip(
-            store_names_df['store_no'].astype(str),
-            store_names_df['store_name']
-        ))
-        
-        forecast_adj_df = conn.sql(forecast_adj_query).to_df()
+        store_names_dict = {
+            str(store_no): store_name
+            for store_no, store_name in conn.sql(store_names_query).fetchall()
+        }
+        
+        # (store_no, date) -> (total_weather_adj, items_adjusted) for O(1) lookups
+        forecast_adj_map = {
+            (str(store_no), str(date_forecast)): (total_adj, items_adj)
+            for store_no, date_forecast, total_adj, items_adj
+            in conn.sql(forecast_adj_query).fetchall()
+        }
     except Exception as e:
         print(f"Error getting forecast data: {e}")
         store_names_dict = {}
-        forecast_adj_df = None
+        forecast_adj_map = {}
     
     # Get store list for this region
     region_stores_query = f'''
@@ -2275,6 +2355,17 @@ def write_weather_impact_sheet(wb, conn, region: str,
     except:
         region_stores = []
     
+    # Open weather.db once; both sections below reuse this handle
+    weather_conn = None
+    if os.path.exists(weather_db_path) and region_stores:
+        try:
+            weather_conn = duckdb.connect(weather_db_path, read_only=True)
+        except Exception as e:
+            print(f"Error opening weather database: {e}")
+    
+    # Build store list for IN clause
+    store_list = ','.join(f"'{s}'" for s in region_stores)
+    
     # =========================================================================
     # SECTION 1: Daily Weather Summary
     # =========================================================================
@@ -2285,13 +2376,8 @@ def write_weather_impact_sheet(wb, conn, region: str,
     
     # Get daily summary data from weather.db
     daily_df = None
-    if os.path.exists(weather_db_path) and region_stores:
+    if weather_conn is not None:
         try:
-            weather_conn = duckdb.connect(weather_db_path, read_only=True)
-            
-            # Build store list for IN clause
-            store_list = ','.join(f"'{s}'" for s in region_stores)
-            
             daily_query = f'''
                 SELECT
                     date AS "Date",
@@ -2328,8 +2414,7 @@ def write_weather_impact_sheet(wb, conn, region: str,
                 GROUP BY date
                 ORDER BY date
             '''
-            daily_df = pl.from_pandas(weather_conn.sql(daily_query).to_df())
-            weather_conn.close()
+            daily_df = weather_conn.sql(daily_query).pl()
         except Exception as e:
             print(f"Error getting weather daily summary: {e}")
             daily_df = None
@@ -2356,54 +2441,56 @@ def write_weather_impact_sheet(wb, conn, region: str,
         ws.set_column('M:P', 10)  # Temperature
         ws.set_column('Q:S', 10)  # Precipitation
         
-        # Write daily data
-        for d in daily_df.to_dicts():
-            col = 0
-            # Date
-            ws.write(current_row, col, d.get('Date'), formats['date']); col += 1
-            # Day
-            ws.write(current_row, col, d.get('Day'), formats['text']); col += 1
-            # Store Count
-            ws.write(current_row, col, d.get('Store Count'), formats['number']); col += 1
+        # Write daily data. The weather detail rows below already stream as
+        # tuples; here rows(named=True) plus local bindings avoid repeated
+        # attribute and method lookups in the per-cell calls.
+        ws_write = ws.write
+        get_ = dict.get
+        fmt_date = formats['date']
+        fmt_text = formats['text']
+        fmt_number = formats['number']
+        fmt_decimal = formats['decimal']
+        fmt_decimal3 = formats['decimal3']
+        count_formats = (
+            ('Severe', formats['severity_severe']),
+            ('High', formats['severity_high']),
+            ('Moderate', formats['severity_moderate']),
+            ('Low', formats['severity_low']),
+            ('Minimal', formats['severity_minimal']),
+        )
+        
+        for d in daily_df.rows(named=True):
+            ws_write(current_row, 0, get_(d, 'Date'), fmt_date)
+            ws_write(current_row, 1, get_(d, 'Day'), fmt_text)
+            ws_write(current_row, 2, get_(d, 'Store Count'), fmt_number)
             
             # Severity counts with color coding
-            severe_count = d.get('Severe', 0) or 0
-            high_count = d.get('High', 0) or 0
-            moderate_count = d.get('Moderate', 0) or 0
-            low_count = d.get('Low', 0) or 0
-            minimal_count = d.get('Minimal', 0) or 0
-            
-            ws.write(current_row, col, severe_count, 
-                    formats['severity_severe'] if severe_count > 0 else formats['number']); col += 1
-            ws.write(current_row, col, high_count,
-                    formats['severity_high'] if high_count > 0 else formats['number']); col += 1
-            ws.write(current_row, col, moderate_count,
-                    formats['severity_moderate'] if moderate_count > 0 else formats['number']); col += 1
-            ws.write(current_row, col, low_count,
-                    formats['severity_low'] if low_count > 0 else formats['number']); col += 1
-            ws.write(current_row, col, minimal_count,
-                    formats['severity_minimal'] if minimal_count > 0 else formats['number']); col += 1
+            col = 3
+            for key, count_fmt in count_formats:
+                count = get_(d, key, 0) or 0
+                ws_write(current_row, col, count, count_fmt if count > 0 else fmt_number)
+                col += 1
             
             # Severity metrics
-            avg_sev = d.get('Avg Severity', 0) or 0
-            ws.write(current_row, col, avg_sev, get_severity_format(formats, avg_sev)); col += 1
-            max_sev = d.get('Max Severity', 0) or 0
-            ws.write(current_row, col, max_sev, get_severity_format(formats, max_sev)); col += 1
+            avg_sev = get_(d, 'Avg Severity', 0) or 0
+            ws_write(current_row, 8, avg_sev, get_severity_format(formats, avg_sev))
+            max_sev = get_(d, 'Max Severity', 0) or 0
+            ws_write(current_row, 9, max_sev, get_severity_format(formats, max_sev))
             
             # Impact factors
-            ws.write(current_row, col, d.get('Avg Impact Factor'), formats['decimal3']); col += 1
-            ws.write(current_row, col, d.get('Min Impact Factor'), formats['decimal3']); col += 1
+            ws_write(current_row, 10, get_(d, 'Avg Impact Factor'), fmt_decimal3)
+            ws_write(current_row, 11, get_(d, 'Min Impact Factor'), fmt_decimal3)
             
             # Temperature
-            ws.write(current_row, col, d.get('Avg Temp Min'), formats['decimal']); col += 1
-            ws.write(current_row, col, d.get('Avg Temp Max'), formats['decimal']); col += 1
-            ws.write(current_row, col, d.get('Coldest Temp'), formats['decimal']); col += 1
-            ws.write(current_row, col, d.get('Warmest Temp'), formats['decimal']); col += 1
+            ws_write(current_row, 12, get_(d, 'Avg Temp Min'), fmt_decimal)
+            ws_write(current_row, 13, get_(d, 'Avg Temp Max'), fmt_decimal)
+            ws_write(current_row, 14, get_(d, 'Coldest Temp'), fmt_decimal)
+            ws_write(current_row, 15, get_(d, 'Warmest Temp'), fmt_decimal)
             
             # Precipitation
-            ws.write(current_row, col, d.get('Stores w/ Rain'), formats['number']); col += 1
-            ws.write(current_row, col, d.get('Stores w/ Snow'), formats['number']); col += 1
-            ws.write(current_row, col, d.get('Avg Snow Depth'), formats['decimal']); col += 1
+            ws_write(current_row, 16, get_(d, 'Stores w/ Rain'), fmt_number)
+            ws_write(current_row, 17, get_(d, 'Stores w/ Snow'), fmt_number)
+            ws_write(current_row, 18, get_(d, 'Avg Snow Depth'), fmt_decimal)
             
             current_row += 1
     else:
@@ -2422,13 +2509,8 @@ def write_weather_impact_sheet(wb, conn, region: str,
     
     # Get store-level weather data from weather.db
     detail_df = None
-    if os.path.exists(weather_db_path) and region_stores:
+    if weather_conn is not None:
         try:
-            weather_conn = duckdb.connect(weather_db_path, read_only=True)
-            
-            # Build store list for IN clause
-            store_list = ','.join(f"'{s}'" for s in region_stores)
-            
             detail_query = f'''
                 SELECT
                     date AS "Date",
@@ -2467,43 +2549,35 @@ def write_weather_impact_sheet(wb, conn, region: str,
                 FROM weather
                 WHERE store_no IN ({store_list})
                 AND date BETWEEN '{start_date}' AND '{end_date}'
-                ORDER BY severity_score DESC, date, store_no
             '''
             
-            detail_df = pl.from_pandas(weather_conn.sql(detail_query).to_df())
-            weather_conn.close()
-            
-            # Add store names and forecast adjustment data
-            if detail_df is not None and len(detail_df) > 0:
-                detail_dicts = detail_df.to_dicts()
-                for row_dict in detail_dicts:
-                    store_no = str(row_dict.get('Store #', ''))
-                    row_dict['Store Name'] = store_names_dict.get(store_no, '')
-                    
-                    # Get forecast adjustment for this store/date
-                    if forecast_adj_df is not None:
-                        date_val = row_dict.get('Date')
-                        adj_row = forecast_adj_df[
-                            (forecast_adj_df['store_no'].astype(str) == store_no) &
-                            (forecast_adj_df['date_forecast'].astype(str) == str(date_val))
-                        ]
-                        if len(adj_row) > 0:
-                            row_dict['Total Weather Adj'] = adj_row.iloc[0]['total_weather_adj']
-                            row_dict['Items Adjusted'] = adj_row.iloc[0]['items_adjusted']
-                        else:
-                            row_dict['Total Weather Adj'] = 0
-                            row_dict['Items Adjusted'] = 0
-                    else:
-                        row_dict['Total Weather Adj'] = 0
-                        row_dict['Items Adjusted'] = 0
-                
-                detail_df = pl.from_dicts(detail_dicts)
-                
+            detail_df = weather_conn.sql(detail_query).pl()
         except Exception as e:
             print(f"Error getting weather details: {e}")
             detail_df = None
+        finally:
+            weather_conn.close()
     
-    if detail_df is not None and len(detail_df) > 0:
+    # Row count is read once and reused for the presence check and overflow note
+    total_rows = detail_df.height if detail_df is not None else 0
+    if total_rows > 0:
+        # Add store names and forecast adjustment data column-wise (only the
+        # fetch above is guarded; this runs solely on the happy path)
+        store_keys = detail_df['Store #'].cast(pl.Utf8).to_list()
+        # Match on the YYYY-MM-DD part, whether 'Date' arrives as a date or datetime
+        date_keys = detail_df['Date'].cast(pl.Utf8).str.slice(0, 10).to_list()
+        adjustments = [
+            forecast_adj_map.get(key, (0, 0)) for key in zip(store_keys, date_keys)
+        ]
+        detail_df = detail_df.with_columns(
+            pl.Series('Store Name', [store_names_dict.get(s, '') for s in store_keys],
+                      dtype=pl.Utf8),
+            pl.Series('Total Weather Adj', [adj for adj, _ in adjustments],
+                      dtype=pl.Float64, strict=False),
+            pl.Series('Items Adjusted', [items for _, items in adjustments],
+                      dtype=pl.Int64, strict=False)
+        )
+        
         # Filter to show only stores with meaningful weather impact
         # Show all stores but sort by severity
         
@@ -2545,57 +2619,85 @@ def write_weather_impact_sheet(wb, conn, region: str,
             ('Items Adjusted', 'number'),
         ]
         
-        # Limit to top 200 rows for performance (already sorted by severity DESC)
-        data_rows = detail_df.to_dicts()[:200]
-        
-        for d in data_rows:
-            for col, (key, fmt_type) in enumerate(col_mapping):
-                if fmt_type == 'weather_icon':
-                    # Generate weather icon from conditions
-                    condition = d.get('Conditions') or ''
-                    severity_cat = d.get('Severity Category') or 'MINIMAL'
-                    severity_score = d.get('Severity Score') or 0
-                    snow_amount = d.get('Snow (in)') or 0
-                    rain_amount = d.get('Precip (in)') or 0
-                    temp_min = d.get('Temp Min (F)')
-                    temp_max = d.get('Temp Max (F)')
-                    wind_speed = d.get('Wind (mph)') or 0
-                    
-                    icon = get_weather_indicator_icon(
-                        condition=condition,
-                        severity_category=severity_cat,
-                        snow_amount=snow_amount,
-                        rain_amount=rain_amount,
-                        temp_min=temp_min,
-                        temp_max=temp_max,
-                        wind_speed=wind_speed,
-                        severity_score=severity_score
-                    )
-                    ws.write(current_row, col, icon, get_severity_format(formats, severity_score, severity_cat))
-                else:
-                    value = d.get(key)
-                    
-                    if fmt_type == 'date':
-                        ws.write(current_row, col, value, formats['date'])
-                    elif fmt_type == 'text':
-                        ws.write(current_row, col, value or '', formats['text'])
-                    elif fmt_type == 'decimal':
-                        ws.write(current_row, col, value, formats['decimal'])
-                    elif fmt_type == 'decimal3':
-                        ws.write(current_row, col, value, formats['decimal3'])
-                    elif fmt_type == 'severity':
-                        ws.write(current_row, col, value, get_severity_format(formats, value or 0))
-                    elif fmt_type == 'severity_cat':
-                        sev_score = d.get('Severity Score') or 0
-                        ws.write(current_row, col, value or 'MINIMAL', 
-                                get_severity_format(formats, sev_score, value))
-                    else:
-                        ws.write(current_row, col, value, formats['number'])
+        # Limit to the top 200 rows by severity. top_k is a bounded selection
+        # rather than a full sort of every row, so only the 200 selected rows
+        # are then ordered (severity DESC, date, store), decorated and converted
+        sort_keys = ['Severity Score', 'Date', 'Store #']
+        top_rows = detail_df.top_k(200, by=sort_keys, reverse=[False, True, True]).sort(
+            sort_keys, descending=[True, False, False], nulls_last=True
+        )
+        
+        # Weather icons for the written rows in one vectorized pass; text
+        # columns are null-filled here so the row loop needs no `or ''` guard.
+        # Numeric nulls stay null so they are still written as blank cells.
+        top_rows = top_rows.with_columns(
+            get_weather_indicator_icon_expr(
+                'Conditions', 'Severity Category', 'Snow (in)', 'Precip (in)',
+                'Temp Min (F)', 'Temp Max (F)', 'Wind (mph)', 'Severity Score'
+            ).alias('_weather_icon'),
+            *[pl.col(key).fill_null('') for key, fmt_type in col_mapping if fmt_type == 'text']
+        )
+        
+        # Rows come back as tuples in col_mapping order (icon column first),
+        # so cells are read by position rather than by dict key
+        data_keys = [key for key, _ in col_mapping]
+        fmt_types = [fmt_type for _, fmt_type in col_mapping]
+        cat_i = data_keys.index('Severity Category')
+        score_i = data_keys.index('Severity Score')
+        
+        # Bind the writer and formats to locals so the per-cell loop does
+        # fast local loads instead of attribute/dict lookups
+        ws_write = ws.write
+        ws_write_row = ws.write_row
+        fmt_date = formats['date']
+        fmt_text = formats['text']
+        fmt_decimal = formats['decimal']
+        fmt_decimal3 = formats['decimal3']
+        fmt_number = formats['number']
+        
+        # Resolve each column's format once and group contiguous columns that
+        # share a format into (start, stop, format) runs, so each run is one
+        # write_row call. The icon (col 0) and the two severity columns carry
+        # row-dependent formats and are written explicitly.
+        fixed_formats = {
+            'date': fmt_date, 'text': fmt_text, 'decimal': fmt_decimal,
+            'decimal3': fmt_decimal3, 'number': fmt_number
+        }
+        column_runs = []
+        for col, fmt_type in enumerate(fmt_types):
+            fmt = fixed_formats.get(fmt_type)
+            if fmt is None:
+                continue
+            if column_runs and column_runs[-1][1] == col and column_runs[-1][2] is fmt:
+                column_runs[-1][1] = col + 1
+            else:
+                column_runs.append([col, col + 1, fmt])
+        
+        # Severity category -> format, resolved once instead of per cell
+        severity_format_by_category = {
+            category: formats[f'severity_{category.lower()}'] for category in SEVERITY_ICONS
+        }
+        fmt_severity_minimal = formats['severity_minimal']
+        
+        for values in top_rows.select(data_keys).iter_rows():
+            severity_cat = values[cat_i] or 'MINIMAL'
+            severity_score = values[score_i] or 0
+            category_fmt = severity_format_by_category.get(severity_cat.upper(), fmt_severity_minimal)
+            ws_write(current_row, 0, values[0], category_fmt)
+            
+            for start, stop, fmt in column_runs:
+                ws_write_row(current_row, start, values[start:stop], fmt)
+            ws_write(current_row, score_i, values[score_i],
+                     get_severity_format(formats, severity_score))
+            # Uncategorized rows fall back to the score thresholds
+            ws_write(current_row, cat_i, values[cat_i] or 'MINIMAL',
+                     category_fmt if values[cat_i] else get_severity_format(formats, severity_score))
             
             current_row += 1
         
-        if len(detail_df) > 200:
-            ws.write(current_row, 0, f"... and {len(detail_df) - 200} more rows (showing top 200 by severity)", 
+        hidden_rows = total_rows - top_rows.height
+        if hidden_rows > 0:
+            ws.write(current_row, 0, f"... and {hidden_rows} more rows (showing top 200 by severity)", 
                     formats['text'])
     else:
         ws.write(current_row, 0, "No store weather details available", formats['text'])
@@ -2605,17 +2707,12 @@ def write_weather_impact_sheet(wb, conn, region: str,
     ws.merge_range(current_row, 0, current_row, 5, 'Severity Category Legend:', formats['section'])
     current_row += 1
     
-    legend_items = [
-        (f"{SEVERITY_ICONS['SEVERE']} SEVERE (7-10)", 'severity_severe', 'Dangerous conditions - significant travel hazard'),
-        (f"{SEVERITY_ICONS['HIGH']} HIGH (5-7)", 'severity_high', 'Poor conditions - notable impact on foot traffic'),
-        (f"{SEVERITY_ICONS['MODERATE']} MODERATE (3-5)", 'severity_moderate', 'Fair conditions - some impact expected'),
-        (f"{SEVERITY_ICONS['LOW']} LOW (1.5-3)", 'severity_low', 'Minor conditions - minimal impact'),
-        (f"{SEVERITY_ICONS['MINIMAL']} MINIMAL (0-1.5)", 'severity_minimal', 'Good conditions - no weather impact'),
-    ]
-    
-    for label, fmt_key, desc in legend_items:
-        ws.write(current_row, 0, label, formats[fmt_key])
-        ws.write(current_row, 1, desc, formats['text'])
+    # Legend rows are static; only the format lookups are resolved here
+    ws_write = ws.write
+    fmt_text = formats['text']
+    for label, fmt_key, desc in SEVERITY_LEGEND_ITEMS:
+        ws_write(current_row, 0, label, formats[fmt_key])
+        ws_write(current_row, 1, desc, fmt_text)
         current_row += 1
     
     # Add weather icon legend
@@ -2623,22 +2720,10 @@ def write_weather_impact_sheet(wb, conn, region: str,
     ws.merge_range(current_row, 0, current_row, 5, 'Weather Condition Icons:', formats['section'])
     current_row += 1
     
-    icon_legend = [
-        (WEATHER_ICONS['severe'], 'Severe/Dangerous'),
-        (WEATHER_ICONS['thunderstorm'], 'Thunderstorm'),
-        (WEATHER_ICONS['snow_heavy'], 'Heavy Snow'),
-        (WEATHER_ICONS['snow'], 'Snow'),
-        (WEATHER_ICONS['rain_heavy'], 'Heavy Rain'),
-        (WEATHER_ICONS['rain'], 'Rain'),
-        (WEATHER_ICONS['fog'], 'Fog/Mist'),
-        (WEATHER_ICONS['wind'], 'High Wind'),
-        (WEATHER_ICONS['extreme_cold'], 'Extreme Cold'),
-        (WEATHER_ICONS['clear'], 'Clear/Sunny'),
-    ]
-    
-    for icon, desc in icon_legend:
-        ws.write(current_row, 0, icon, formats['text_center'])
-        ws.write(current_row, 1, desc, formats['text'])
+    fmt_text_center = formats['text_center']
+    for icon, desc in WEATHER_ICON_LEGEND:
+        ws_write(current_row, 0, icon, fmt_text_center)
+        ws_write(current_row, 1, desc, fmt_text)
         current_row += 1
     
     # Freeze panes
@@ -2688,7 +2773,10 @@ def export_regional_summary(conn, region: str,
     print(f"Creating regional summary for {region}: {filepath}")
     
     # Create workbook
-    wb = xlsxwriter.Workbook(filepath, {'strings_to_numbers': True})
+    wb = xlsxwriter.Workbook(filepath, {
+        'strings_to_numbers': True,
+        'constant_memory': settings.XLSX_CONSTANT_MEMORY
+    })
     
     # Create formats
     formats = create_summary_formats(wb)
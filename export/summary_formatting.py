@@ -7,6 +7,11 @@ This module contains all formatting-related functions and constants
 used for generating styled Excel reports.
 """
 
+from bisect import bisect_left
+from functools import lru_cache
+
+import polars as pl
+
 # =============================================================================
 # WEATHER INDICATOR ICONS
 # =============================================================================
@@ -38,6 +43,42 @@ SEVERITY_ICONS = {
     'SEVERE': '🔴'
 }
 
+# Severity score from which the weather indicator is always the severe icon
+WEATHER_ICON_SEVERE_SCORE = 7
+
+# Weather indicator measurement thresholds: snow / rain amounts (inches) at
+# which the icon turns to the regular and the heavy variant (any amount
+# above 0 is the light variant), and the wind (mph) / temperature (°F) limits
+WEATHER_ICON_SNOW_THRESHOLDS = (2, 6)
+WEATHER_ICON_RAIN_THRESHOLDS = (0.25, 1)
+WEATHER_ICON_WINDY_MPH = 30
+WEATHER_ICON_COLD_F = 20
+WEATHER_ICON_HOT_F = 100
+
+# Severity format keys ordered by bucket id (see severity_bucket)
+SEVERITY_FORMAT_KEYS = (
+    'severity_minimal',
+    'severity_low',
+    'severity_moderate',
+    'severity_high',
+    'severity_severe'
+)
+
+# Shrink % upper bounds (inclusive) of the good / warning bands; above is bad
+SHRINK_PCT_THRESHOLDS = (0.05, 0.15)
+
+# Growth % within +/- this band is neutral (see growth_pct_band)
+GROWTH_PCT_NEUTRAL_BAND = 0.02
+
+# Severity category -> bucket id; unknown categories fall back to MINIMAL
+SEVERITY_CATEGORY_BUCKETS = {
+    'MINIMAL': 0,
+    'LOW': 1,
+    'MODERATE': 2,
+    'HIGH': 3,
+    'SEVERE': 4
+}
+
 # =============================================================================
 # COLOR PALETTES FOR CONDITIONAL FORMATTING
 # =============================================================================
@@ -80,6 +121,10 @@ def get_weather_indicator_icon(condition: str, severity_category: str = None,
     """
     Get weather indicator icon based on conditions.
     
+    Numeric inputs only matter relative to fixed thresholds, so they are
+    reduced to threshold bands before the (memoized) icon lookup. This keeps
+    the cache small even though the raw measurements are continuous.
+    
     Args:
         condition: Weather condition string
         severity_category: Severity category (SEVERE, HIGH, MODERATE, LOW, MINIMAL)
@@ -93,31 +138,129 @@ def get_weather_indicator_icon(condition: str, severity_category: str = None,
     Returns:
         Weather indicator icon string
     """
+    # Before the banding: without a condition the measurements are unused
+    # and may be None
     if not condition:
         return SEVERITY_ICONS.get(severity_category, '❓')
+    return _weather_icon_from_bands(
+        condition,
+        severity_category,
+        severity_score >= WEATHER_ICON_SEVERE_SCORE,
+        _amount_band(snow_amount, WEATHER_ICON_SNOW_THRESHOLDS),
+        _amount_band(rain_amount, WEATHER_ICON_RAIN_THRESHOLDS),
+        wind_speed >= WEATHER_ICON_WINDY_MPH,
+        temp_min is not None and temp_min < WEATHER_ICON_COLD_F,
+        temp_max is not None and temp_max > WEATHER_ICON_HOT_F
+    )
+
+
+def _amount_band(amount: float, thresholds: tuple) -> int:
+    """Band a snow / rain amount: 0 none, 1 light, 2 regular, 3 heavy."""
+    regular_min, heavy_min = thresholds
+    return 3 if amount >= heavy_min else 2 if amount >= regular_min else 1 if amount > 0 else 0
+
+
+def _amount_band_expr(amount: pl.Expr, thresholds: tuple) -> pl.Expr:
+    """Vectorized _amount_band (nulls and NaNs count as no amount)."""
+    regular_min, heavy_min = thresholds
+    amount = amount.cast(pl.Float64).fill_null(0).fill_nan(0)
+    return (
+        pl.when(amount >= heavy_min).then(3)
+        .when(amount >= regular_min).then(2)
+        .when(amount > 0).then(1)
+        .otherwise(0)
+    )
+
+
+def _weather_icon_from_bands(condition: str, severity_category: str,
+                             is_severe: bool, snow_band: int, rain_band: int,
+                             is_windy: bool, is_cold: bool, is_hot: bool) -> str:
+    """get_weather_indicator_icon on already banded measurements."""
+    if not condition:
+        return SEVERITY_ICONS.get(severity_category, '❓')
+    return _weather_indicator_icon(
+        condition, severity_category, is_severe, snow_band, rain_band,
+        is_windy, is_cold, is_hot
+    )
+
+
+def build_weather_icon_expr(df: pl.DataFrame, condition_col: str,
+                            category_col: str, score_col: str,
+                            snow_col: str = None, rain_col: str = None,
+                            temp_min_col: str = None, temp_max_col: str = None,
+                            wind_col: str = None) -> pl.Expr:
+    """
+    Vectorized get_weather_indicator_icon.
+    
+    The icon only depends on the condition, the category and the banded
+    measurements, so it is resolved once per distinct combination in ``df``
+    and mapped back with a dict replace. Nulls are read the way the writers
+    read them: '' for the condition, 'MINIMAL' for an empty category and 0
+    for the score and amounts. Measurement columns left as None are treated
+    as absent (the get_weather_indicator_icon defaults).
     
+    Args:
+        df: DataFrame the expression will be evaluated on
+        condition_col, category_col, score_col: Weather column names
+        snow_col, rain_col, temp_min_col, temp_max_col, wind_col: Optional
+            measurement column names
+        
+    Returns:
+        String expression with the icon for every row
+    """
+    def measurement(col_name):
+        return pl.col(col_name).cast(pl.Float64).fill_nan(None) if col_name else pl.lit(None, pl.Float64)
+    
+    category = pl.col(category_col)
+    parts = [
+        pl.col(condition_col).fill_null('').alias('condition'),
+        pl.when(category.is_null() | (category == ''))
+        .then(pl.lit('MINIMAL'))
+        .otherwise(category)
+        .alias('category'),
+        (pl.col(score_col).fill_null(0) >= WEATHER_ICON_SEVERE_SCORE).alias('is_severe'),
+        _amount_band_expr(measurement(snow_col), WEATHER_ICON_SNOW_THRESHOLDS).alias('snow_band'),
+        _amount_band_expr(measurement(rain_col), WEATHER_ICON_RAIN_THRESHOLDS).alias('rain_band'),
+        (measurement(wind_col).fill_null(0) >= WEATHER_ICON_WINDY_MPH).alias('is_windy'),
+        (measurement(temp_min_col) < WEATHER_ICON_COLD_F).fill_null(False).alias('is_cold'),
+        (measurement(temp_max_col) > WEATHER_ICON_HOT_F).fill_null(False).alias('is_hot'),
+    ]
+    key = pl.concat_str([part.cast(pl.Utf8) for part in parts], separator='|')
+    
+    icons = {
+        icon_key: _weather_icon_from_bands(*bands)
+        for icon_key, *bands in df.select(key.alias('key'), *parts).unique().iter_rows()
+    }
+    return key.replace(icons)
+
+
+@lru_cache(maxsize=4096)
+def _weather_indicator_icon(condition: str, severity_category: str,
+                            is_severe: bool, snow_band: int, rain_band: int,
+                            is_windy: bool, is_cold: bool, is_hot: bool) -> str:
+    """Resolve the icon from a condition string and pre-banded weather metrics."""
     condition_lower = condition.lower()
     
     # Severe conditions
-    if severity_score >= 7 or severity_category == 'SEVERE':
+    if is_severe or severity_category == 'SEVERE':
         return WEATHER_ICONS['severe']
     
     # Snow
-    if snow_amount >= 6 or 'blizzard' in condition_lower:
+    if snow_band == 3 or 'blizzard' in condition_lower:
         return WEATHER_ICONS['snow_heavy']
-    if snow_amount >= 2 or 'snow' in condition_lower:
+    if snow_band == 2 or 'snow' in condition_lower:
         return WEATHER_ICONS['snow']
-    if snow_amount > 0:
+    if snow_band == 1:
         return WEATHER_ICONS['snow_light']
     
     # Rain/storms
     if 'thunder' in condition_lower or 'storm' in condition_lower:
         return WEATHER_ICONS['thunderstorm']
-    if rain_amount >= 1:
+    if rain_band == 3:
         return WEATHER_ICONS['rain_heavy']
-    if rain_amount >= 0.25 or 'rain' in condition_lower:
+    if rain_band == 2 or 'rain' in condition_lower:
         return WEATHER_ICONS['rain']
-    if rain_amount > 0 or 'drizzle' in condition_lower or 'shower' in condition_lower:
+    if rain_band == 1 or 'drizzle' in condition_lower or 'shower' in condition_lower:
         return WEATHER_ICONS['rain_light']
     
     # Fog
@@ -125,13 +268,13 @@ def get_weather_indicator_icon(condition: str, severity_category: str = None,
         return WEATHER_ICONS['fog']
     
     # Wind
-    if wind_speed >= 30:
+    if is_windy:
         return WEATHER_ICONS['wind']
     
     # Temperature extremes
-    if temp_min is not None and temp_min < 20:
+    if is_cold:
         return WEATHER_ICONS['extreme_cold']
-    if temp_max is not None and temp_max > 100:
+    if is_hot:
         return WEATHER_ICONS['extreme_heat']
     
     # Clear/cloudy
@@ -395,6 +538,24 @@ def create_summary_formats(wb):
         'border': 1
     })
     
+    # Severity formats indexed by bucket id / category for fast lookup in row
+    # loops. All formats are created here; the get_*_format helpers only read
+    # from this dict, so the workbook never gains formats mid-write.
+    formats['severity_by_bucket'] = tuple(formats[key] for key in SEVERITY_FORMAT_KEYS)
+    formats['severity_by_category'] = {
+        category: formats['severity_by_bucket'][bucket]
+        for category, bucket in SEVERITY_CATEGORY_BUCKETS.items()
+    }
+    
+    # Shrink / growth % formats indexed by band id (see shrink_pct_band and
+    # growth_pct_band)
+    formats['shrink_pct_by_band'] = (
+        formats['pct_good'], formats['pct_warning'], formats['pct_bad']
+    )
+    formats['growth_pct_by_band'] = (
+        formats['growth_negative'], formats['growth_neutral'], formats['growth_positive']
+    )
+    
     return formats
 
 
@@ -410,29 +571,67 @@ def get_severity_format(formats: dict, severity_score: float, category: str = No
     Returns:
         Format object
     """
+    severity_formats = formats['severity_by_bucket']
     if category:
-        category = category.upper()
-        if category == 'SEVERE':
-            return formats['severity_severe']
-        elif category == 'HIGH':
-            return formats['severity_high']
-        elif category == 'MODERATE':
-            return formats['severity_moderate']
-        elif category == 'LOW':
-            return formats['severity_low']
-        else:
-            return formats['severity_minimal']
-    
-    if severity_score >= 8:
-        return formats['severity_severe']
-    elif severity_score >= 6:
-        return formats['severity_high']
-    elif severity_score >= 4:
-        return formats['severity_moderate']
-    elif severity_score >= 2:
-        return formats['severity_low']
-    else:
-        return formats['severity_minimal']
+        return formats['severity_by_category'].get(category.upper(), severity_formats[0])
+    return severity_formats[severity_bucket(severity_score)]
+
+
+def severity_bucket(severity_score: float) -> int:
+    """
+    Map a severity score (0-10) to a bucket id 0-4.
+    
+    Buckets follow the 2/4/6/8 thresholds: MINIMAL, LOW, MODERATE, HIGH, SEVERE.
+    A missing (None / NaN) score is MINIMAL.
+    """
+    if severity_score is None or severity_score != severity_score:
+        return 0
+    bucket = int(severity_score) >> 1
+    if bucket > 4:
+        return 4
+    return bucket if bucket > 0 else 0
+
+
+def shrink_pct_band(shrink_pct: float) -> int:
+    """
+    Map a shrink percentage to a band id: 0 good (<= 5%), 1 warning
+    (<= 15%), 2 bad.
+    """
+    return bisect_left(SHRINK_PCT_THRESHOLDS, shrink_pct)
+
+
+def growth_pct_band(growth_pct: float) -> int:
+    """
+    Map a growth percentage to a band id: 0 decline beyond the neutral band
+    (good, conservative), 1 neutral, 2 growth beyond it (warning, may cause
+    shrink).
+    """
+    return (growth_pct > GROWTH_PCT_NEUTRAL_BAND) - (growth_pct < -GROWTH_PCT_NEUTRAL_BAND) + 1
+
+
+def shrink_pct_band_expr(shrink_pct: pl.Expr) -> pl.Expr:
+    """Vectorized shrink_pct_band (nulls fall in the bad band; fill them first)."""
+    good_max, warning_max = SHRINK_PCT_THRESHOLDS
+    return (
+        pl.when(shrink_pct <= good_max).then(0)
+        .when(shrink_pct <= warning_max).then(1)
+        .otherwise(2)
+    )
+
+
+def growth_pct_band_expr(growth_pct: pl.Expr) -> pl.Expr:
+    """Vectorized growth_pct_band (nulls fall in the neutral band)."""
+    return (
+        pl.when(growth_pct > GROWTH_PCT_NEUTRAL_BAND).then(2)
+        .when(growth_pct < -GROWTH_PCT_NEUTRAL_BAND).then(0)
+        .otherwise(1)
+    )
+
+
+def severity_bucket_expr(severity_score: pl.Expr) -> pl.Expr:
+    """Vectorized severity_bucket (nulls and NaNs are MINIMAL)."""
+    severity_score = severity_score.cast(pl.Float64).fill_null(0).fill_nan(0)
+    return (severity_score.cast(pl.Int64) // 2).clip(0, 4)
 
 
 def get_shrink_pct_format(formats: dict, shrink_pct: float):
@@ -448,12 +647,7 @@ def get_shrink_pct_format(formats: dict, shrink_pct: float):
     """
     if shrink_pct is None:
         return formats['pct']
-    if shrink_pct <= 0.05:  # 5% or less = good
-        return formats['pct_good']
-    elif shrink_pct <= 0.15:  # 5-15% = warning
-        return formats['pct_warning']
-    else:  # Over 15% = bad
-        return formats['pct_bad']
+    return formats['shrink_pct_by_band'][shrink_pct_band(shrink_pct)]
 
 
 def get_growth_pct_format(formats: dict, growth_pct: float):
@@ -470,12 +664,7 @@ def get_growth_pct_format(formats: dict, growth_pct: float):
     """
     if growth_pct is None:
         return formats['pct']
-    if growth_pct > 0.02:  # More than 2% growth - warning (may cause shrink)
-        return formats['growth_positive']
-    elif growth_pct < -0.02:  # More than 2% decline - good (conservative)
-        return formats['growth_negative']
-    else:
-        return formats['growth_neutral']
+    return formats['growth_pct_by_band'][growth_pct_band(growth_pct)]
 
 
 def build_sales_trend_string(w4: int, w3: int, w2: int, w1: int) -> str:
@@ -494,3 +683,31 @@ def build_sales_trend_string(w4: int, w3: int, w2: int, w1: int) -> str:
         return f"{int(val):,}"
     
     return f"{fmt(w4)} > {fmt(w3)} > {fmt(w2)} > {fmt(w1)}"
+
+
+def _thousands_expr(col_name: str) -> pl.Expr:
+    """Format an integer column with thousands separators ("-" for nulls)."""
+    digits = pl.col(col_name).cast(pl.Int64, strict=False).cast(pl.Utf8)
+    return (
+        digits.str.reverse()
+        .str.replace_all(r"(\d{3})", "$1,")
+        .str.replace(r",(-?)$", "$1")
+        .str.reverse()
+        .fill_null("-")
+    )
+
+
+def build_sales_trend_expr(metric: str) -> pl.Expr:
+    """
+    Vectorized build_sales_trend_string for a whole DataFrame.
+    
+    Args:
+        metric: 'shipped' or 'sold'; reads w4..w1_<metric>_total columns
+        
+    Returns:
+        Expression producing a '<metric>_trend' string column
+    """
+    return pl.format(
+        "{} > {} > {} > {}",
+        *[_thousands_expr(f'w{week}_{metric}_total') for week in (4, 3, 2, 1)]
+    ).alias(f'{metric}_trend')
@@ -4,9 +4,18 @@ Summary Queries Module
 SQL queries for regional summary reports.
 
 This module contains all SQL queries used for generating
-regional summary Excel reports.
+regional summary Excel reports. Each query builder returns a
+``(sql, params)`` pair; region and dates are bound as named parameters.
+
+The daily/store/item summaries read the regional_summary_*_aggregate
+tables, which populate_all_aggregates materializes once per run from a
+single forecast_results rollup; only the detail and weather queries read
+forecast_results directly (through its region/date index). Queries run on
+separate cursors, so they must not depend on TEMP tables.
 """
 
+from functools import lru_cache, wraps
+
 from config import settings
 
 
@@ -19,350 +28,281 @@ def _get_inactive_stores_filter(alias: str = "fr") -> str:
 
 
 def _get_inactive_store_items_filter(alias: str = "fr") -> str:
-    """Build inactive store-item combinations filter clause."""
-    inactive_store_items = getattr(settings, 'INACTIVE_STORE_ITEMS', None)
-    if inactive_store_items:
-        conditions = [
-            f"({alias}.store_no = {store_no} AND {alias}.item_no = {item_no})"
-            for store_no, item_no in inactive_store_items
-        ]
-        return f"AND NOT ({' OR '.join(conditions)})"
+    """
+    Build inactive store-item combinations filter clause.
+    
+    Anti-joins the inactive_store_items lookup rebuilt by
+    data.aggregates.populate_all_aggregates.
+    """
+    if getattr(settings, 'INACTIVE_STORE_ITEMS', None):
+        return (
+            f"AND NOT EXISTS (SELECT 1 FROM inactive_store_items i "
+            f"WHERE i.store_no = {alias}.store_no AND i.item_no = {alias}.item_no)"
+        )
     return ""
 
 
-def _get_store_name_subquery(region: str) -> str:
-    """Build store name lookup subquery."""
-    return f'''
-        SELECT DISTINCT s.store_no, s.store_name
-        FROM main.shrink s
-        JOIN (
-            SELECT store_no, MAX(date_posting) AS latest_date
-            FROM main.shrink
-            WHERE region_code = '{region}'
-            GROUP BY store_no
-        ) AS latest
-        ON s.store_no = latest.store_no AND s.date_posting = latest.latest_date
-        WHERE s.region_code = '{region}'
+# Day names indexed by DuckDB's dayofweek() (0 = Sunday)
+_DAY_NAMES = ['Sunday', 'Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday']
+
+
+def _day_name_sql(date_column: str) -> str:
+    """
+    Day-of-week name of a date column, as a lookup into a constant list.
+    
+    Indexing a list literal by dayofweek() is a vectorized integer gather,
+    where strftime(..., '%A') formats a string per row.
+    """
+    day_names = ', '.join(f"'{name}'" for name in _DAY_NAMES)
+    # DuckDB lists are 1-based
+    return f"[{day_names}][dayofweek({date_column}) + 1]"
+
+
+def _query_params(region: str, start_date: str, end_date: str) -> dict:
+    """
+    Named parameters bound by every summary query.
+    
+    Region and dates are bound as $region/$start_date/$end_date instead of
+    being interpolated, so the SQL text is identical for every region and
+    date range and only the parameter values change between exports.
+    """
+    return {'region': region, 'start_date': start_date, 'end_date': end_date}
+
+
+# Cache key of the common case with no inactive stores or store-items
+_NO_INACTIVE_SETTINGS = ((), False)
+
+
+def _inactive_settings_key() -> tuple:
+    """
+    Hashable snapshot of the inactive store settings the SQL text depends on.
+    
+    The store-item filter anti-joins the inactive_store_items table, so the
+    SQL only depends on whether that list is set, not on its contents.
+    """
+    inactive_stores = settings.INACTIVE_STORES
+    has_inactive_store_items = bool(getattr(settings, 'INACTIVE_STORE_ITEMS', None))
+    if not inactive_stores and not has_inactive_store_items:
+        return _NO_INACTIVE_SETTINGS
+    return (tuple(inactive_stores or ()), has_inactive_store_items)
+
+
+def _cache_query_sql(query_builder):
+    """
+    Memoize the SQL text of a ``(sql, params)`` query builder.
+    
+    Region and dates are bound parameters, so the SQL only changes with the
+    inactive store settings. The text is built once per settings value and
+    reused with freshly built parameters on every call.
+    """
+    @lru_cache(maxsize=8)
+    def build_sql(inactive_key: tuple) -> str:
+        sql, _ = query_builder(None, None, None)
+        return sql
+    
+    @wraps(query_builder)
+    def cached_query_builder(region: str, start_date: str, end_date: str) -> tuple:
+        return (build_sql(_inactive_settings_key()),
+                _query_params(region, start_date, end_date))
+    
+    return cached_query_builder
+
+
+def _get_store_name_subquery() -> str:
+    """
+    Build store name lookup subquery (binds the $region parameter).
+    
+    Reads the store_names_by_region lookup rebuilt by
+    data.aggregates.populate_all_aggregates.
+    """
+    return '''
+        SELECT store_no, store_name
+        FROM store_names_by_region
+        WHERE region_code = $region
     '''
 
 
-def get_daily_summary_query(region: str, start_date: str, end_date: str) -> str:
-    """Generate query for daily summary metrics with trends and expected shrink."""
-    inactive_stores_filter = _get_inactive_stores_filter("fr")
-    inactive_store_items_filter = _get_inactive_store_items_filter("fr")
+def _aggregate_delta_columns() -> str:
+    """
+    Change-from-last-week column of an ``agg`` aggregate table.
     
-    return f'''
-        SELECT
-            fr.date_forecast AS forecast_date,
-            strftime(fr.date_forecast, '%A') AS day_name,
-            COUNT(DISTINCT fr.store_no) AS store_count,
-            COUNT(DISTINCT fr.item_no) AS item_count,
-            COUNT(*) AS line_count,
-            
+    The growth/shrink/delta ratios are derived from the returned totals in
+    Polars (see summary_writers.SUMMARY_RATIO_COLUMNS), not in SQL.
+    """
+    return '''
+            -- Change from last week
+            agg.total_forecast_qty - agg.w1_shipped_total AS delta_from_lw
+    '''
+
+
+def _aggregate_total_columns() -> str:
+    """Forecast quantity and shipped/sold trend totals of an ``agg`` aggregate table."""
+    return '''
             -- Forecast quantities
-            SUM(COALESCE(fr.forecast_qty_pre_store_pass, fr.forecast_quantity)) AS total_forecast_pre_store_pass,
-            SUM(COALESCE(fr.store_level_adjustment_qty, 0)) AS total_store_level_adj,
-            SUM(COALESCE(fr.forecast_qty_pre_weather, fr.forecast_quantity)) AS total_forecast_pre_weather,
-            SUM(fr.forecast_quantity) AS total_forecast_qty,
-            SUM(COALESCE(fr.weather_adjustment_qty, 0)) AS total_weather_adj,
+            agg.total_forecast_pre_store_pass,
+            agg.total_store_level_adj,
+            agg.total_forecast_pre_weather,
+            agg.total_forecast_qty,
+            agg.total_weather_adj,
             
             -- Forecast Average (Expected Sales)
-            SUM(fr.forecast_average) AS total_forecast_average,
+            agg.total_forecast_average,
             
             -- Shipped Trend (W4 > W3 > W2 > W1)
-            SUM(fr.w4_shipped) AS w4_shipped_total,
-            SUM(fr.w3_shipped) AS w3_shipped_total,
-            SUM(fr.w2_shipped) AS w2_shipped_total,
-            SUM(fr.w1_shipped) AS w1_shipped_total,
+            agg.w4_shipped_total,
+            agg.w3_shipped_total,
+            agg.w2_shipped_total,
+            agg.w1_shipped_total,
             
             -- Sold Qty Trend (W4 > W3 > W2 > W1)
-            SUM(fr.w4_sold) AS w4_sold_total,
-            SUM(fr.w3_sold) AS w3_sold_total,
-            SUM(fr.w2_sold) AS w2_sold_total,
-            SUM(fr.w1_sold) AS w1_sold_total,
-            
-            -- Growth Metrics (Expected Sales vs History)
-            CASE 
-                WHEN SUM(fr.w1_sold) > 0 
-                THEN ROUND((SUM(fr.forecast_average) - SUM(fr.w1_sold))::DOUBLE / SUM(fr.w1_sold), 4)
-                ELSE 0 
-            END AS growth_vs_w1_pct,
-            
-            CASE 
-                WHEN SUM(fr.w2_sold) > 0 
-                THEN ROUND((SUM(fr.forecast_average) - SUM(fr.w2_sold))::DOUBLE / SUM(fr.w2_sold), 4)
-                ELSE 0 
-            END AS growth_vs_w2_pct,
-
-            -- Expected Shrink calculations
-            CASE 
-                WHEN SUM(fr.forecast_quantity) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.forecast_average))::DOUBLE / SUM(fr.forecast_quantity), 4)
-                ELSE 0 
-            END AS expected_shrink_from_avg,
-            
-            CASE 
-                WHEN SUM(fr.forecast_quantity) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.w1_sold))::DOUBLE / SUM(fr.forecast_quantity), 4)
-                ELSE 0 
-            END AS expected_shrink_from_lw,
-            
-            CASE 
-                WHEN SUM(fr.forecast_quantity) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.w2_sold))::DOUBLE / SUM(fr.forecast_quantity), 4)
-                ELSE 0 
-            END AS expected_shrink_from_2w,
-            
-            -- Last week shrink (actual)
-            CASE 
-                WHEN SUM(fr.w1_shipped) > 0 
-                THEN ROUND((SUM(fr.w1_shipped) - SUM(fr.w1_sold))::DOUBLE / SUM(fr.w1_shipped), 4)
-                ELSE 0 
-            END AS lw_shrink_pct,
-            
+            agg.w4_sold_total,
+            agg.w3_sold_total,
+            agg.w2_sold_total,
+            agg.w1_sold_total,
+    '''
+
+
+def _daily_summary_sql(region_filter: str, region_column: str = '') -> str:
+    """
+    Build the daily summary SQL for a region filter clause.
+    
+    Args:
+        region_filter: Condition on agg.region_code
+        region_column: Optional leading select/order column (with trailing comma)
+    """
+    return f'''
+        SELECT
+            {region_column}
+            agg.date_forecast AS forecast_date,
+            {_day_name_sql('agg.date_forecast')} AS day_name,
+            agg.store_count,
+            agg.item_count,
+            agg.line_count,
+            {_aggregate_total_columns()}
             -- Weather severity by category (store counts)
-            SUM(CASE WHEN fr.weather_severity_category = 'SEVERE' THEN 1 ELSE 0 END) AS severe_count,
-            SUM(CASE WHEN fr.weather_severity_category = 'HIGH' THEN 1 ELSE 0 END) AS high_count,
-            SUM(CASE WHEN fr.weather_severity_category = 'MODERATE' THEN 1 ELSE 0 END) AS moderate_count,
-            SUM(CASE WHEN fr.weather_severity_category = 'LOW' THEN 1 ELSE 0 END) AS low_count,
-            SUM(CASE WHEN fr.weather_severity_category = 'MINIMAL' OR fr.weather_severity_category IS NULL THEN 1 ELSE 0 END) AS minimal_count,
+            agg.severe_count,
+            agg.high_count,
+            agg.moderate_count,
+            agg.low_count,
+            agg.minimal_count,
             
             -- Weather metrics
-            ROUND(AVG(COALESCE(fr.weather_severity_score, 0)), 2) AS avg_weather_severity,
-            SUM(CASE WHEN fr.weather_adjusted = 1 THEN 1 ELSE 0 END) AS items_weather_adjusted,
-            
-            -- Change from last week
-            SUM(fr.forecast_quantity) - SUM(fr.w1_shipped) AS delta_from_lw,
-            
-            CASE 
-                WHEN SUM(fr.w1_shipped) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.w1_shipped))::DOUBLE / SUM(fr.w1_shipped), 4)
-                ELSE 0 
-            END AS delta_from_lw_pct
-            
-        FROM forecast_results fr
-        WHERE fr.region_code = '{region}'
-        AND fr.date_forecast BETWEEN '{start_date}' AND '{end_date}'
-        {inactive_stores_filter}
-        {inactive_store_items_filter}
-        GROUP BY fr.date_forecast
-        ORDER BY fr.date_forecast
+            agg.avg_weather_severity,
+            agg.items_weather_adjusted,
+            {_aggregate_delta_columns()}
+        FROM regional_summary_daily_aggregate agg
+        WHERE {region_filter}
+        AND agg.date_forecast BETWEEN $start_date AND $end_date
+        ORDER BY {region_column} agg.date_forecast
     '''
 
 
-def get_store_summary_query(region: str, start_date: str, end_date: str) -> str:
-    """Generate query for store-level summary BY DATE with weather indicators."""
-    inactive_stores_filter = _get_inactive_stores_filter("fr")
-    inactive_store_items_filter = _get_inactive_store_items_filter("fr")
-    store_name_subquery = _get_store_name_subquery(region)
+@_cache_query_sql
+def get_daily_summary_query(region: str, start_date: str, end_date: str) -> tuple:
+    """
+    Generate query for daily summary metrics with trends and expected shrink.
+    
+    Reads the pre-aggregated regional_summary_daily_aggregate table (built by
+    data.aggregates.populate_all_aggregates after the forecast run) instead
+    of re-aggregating forecast_results on every export. The growth/shrink
+    ratios are derived from the returned totals by the sheet preparer.
+    """
+    return (_daily_summary_sql("agg.region_code = $region"),
+            _query_params(region, start_date, end_date))
+
+
+def get_daily_summary_query_multi(regions: list, start_date: str, end_date: str) -> tuple:
+    """
+    Generate the daily summary query for several regions in one pass.
+    
+    Returns the get_daily_summary_query columns with a leading region_code,
+    for the regions bound as the $regions list parameter; callers split the
+    result by region_code.
+    """
+    params = {'regions': list(regions), 'start_date': start_date, 'end_date': end_date}
+    return (_daily_summary_sql("agg.region_code IN (SELECT UNNEST($regions))",
+                               "agg.region_code,"),
+            params)
+
+
+@_cache_query_sql
+def get_store_summary_query(region: str, start_date: str, end_date: str) -> tuple:
+    """
+    Generate query for store-level summary BY DATE with weather indicators.
+    
+    Reads the pre-aggregated regional_summary_store_aggregate table; the
+    ratios are derived from the returned totals by the sheet preparer.
+    """
+    store_name_subquery = _get_store_name_subquery()
     
     return f'''
         SELECT
-            fr.date_forecast AS forecast_date,
-            strftime(fr.date_forecast, '%A') AS day_name,
-            fr.store_no,
+            agg.date_forecast AS forecast_date,
+            {_day_name_sql('agg.date_forecast')} AS day_name,
+            agg.store_no,
             nm.store_name,
-            COUNT(DISTINCT fr.item_no) AS item_count,
-            COUNT(*) AS line_count,
-            
-            -- Forecast quantities
-            SUM(COALESCE(fr.forecast_qty_pre_store_pass, fr.forecast_quantity)) AS total_forecast_pre_store_pass,
-            SUM(COALESCE(fr.store_level_adjustment_qty, 0)) AS total_store_level_adj,
-            SUM(COALESCE(fr.forecast_qty_pre_weather, fr.forecast_quantity)) AS total_forecast_pre_weather,
-            SUM(fr.forecast_quantity) AS total_forecast_qty,
-            SUM(COALESCE(fr.weather_adjustment_qty, 0)) AS total_weather_adj,
-            
-            -- Forecast Average (Expected Sales)
-            SUM(fr.forecast_average) AS total_forecast_average,
-            
-            -- Shipped Trend
-            SUM(fr.w4_shipped) AS w4_shipped_total,
-            SUM(fr.w3_shipped) AS w3_shipped_total,
-            SUM(fr.w2_shipped) AS w2_shipped_total,
-            SUM(fr.w1_shipped) AS w1_shipped_total,
-            
-            -- Sold Qty Trend
-            SUM(fr.w4_sold) AS w4_sold_total,
-            SUM(fr.w3_sold) AS w3_sold_total,
-            SUM(fr.w2_sold) AS w2_sold_total,
-            SUM(fr.w1_sold) AS w1_sold_total,
-            
-            -- Growth Metrics
-            CASE 
-                WHEN SUM(fr.w1_sold) > 0 
-                THEN ROUND((SUM(fr.forecast_average) - SUM(fr.w1_sold))::DOUBLE / SUM(fr.w1_sold), 4)
-                ELSE 0 
-            END AS growth_vs_w1_pct,
-            
-            CASE 
-                WHEN SUM(fr.w2_sold) > 0 
-                THEN ROUND((SUM(fr.forecast_average) - SUM(fr.w2_sold))::DOUBLE / SUM(fr.w2_sold), 4)
-                ELSE 0 
-            END AS growth_vs_w2_pct,
-
-            -- Expected Shrink
-            CASE 
-                WHEN SUM(fr.forecast_quantity) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.forecast_average))::DOUBLE / SUM(fr.forecast_quantity), 4)
-                ELSE 0 
-            END AS expected_shrink_from_avg,
-            
-            CASE 
-                WHEN SUM(fr.forecast_quantity) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.w1_sold))::DOUBLE / SUM(fr.forecast_quantity), 4)
-                ELSE 0 
-            END AS expected_shrink_from_lw,
-            
-            CASE 
-                WHEN SUM(fr.forecast_quantity) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.w2_sold))::DOUBLE / SUM(fr.forecast_quantity), 4)
-                ELSE 0 
-            END AS expected_shrink_from_2w,
-            
-            CASE 
-                WHEN SUM(fr.w1_shipped) > 0 
-                THEN ROUND((SUM(fr.w1_shipped) - SUM(fr.w1_sold))::DOUBLE / SUM(fr.w1_shipped), 4)
-                ELSE 0 
-            END AS lw_shrink_pct,
-            
+            agg.item_count,
+            agg.line_count,
+            {_aggregate_total_columns()}
             -- Weather metrics
-            MAX(COALESCE(fr.weather_severity_score, 0)) AS max_weather_severity,
-            MAX(fr.weather_severity_category) AS max_severity_category,
-            MAX(fr.weather_day_condition) AS weather_condition,
-            ROUND(AVG(COALESCE(fr.weather_severity_score, 0)), 2) AS avg_weather_severity,
-            SUM(CASE WHEN fr.weather_adjusted = 1 THEN 1 ELSE 0 END) AS items_weather_adjusted,
-            
-            -- Change from last week
-            SUM(fr.forecast_quantity) - SUM(fr.w1_shipped) AS delta_from_lw,
-            CASE 
-                WHEN SUM(fr.w1_shipped) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.w1_shipped))::DOUBLE / SUM(fr.w1_shipped), 4)
-                ELSE 0 
-            END AS delta_from_lw_pct
-            
-        FROM forecast_results fr
-        LEFT JOIN ({store_name_subquery}) nm ON fr.store_no = nm.store_no
-        WHERE fr.region_code = '{region}'
-        AND fr.date_forecast BETWEEN '{start_date}' AND '{end_date}'
-        {inactive_stores_filter}
-        {inactive_store_items_filter}
-        GROUP BY fr.date_forecast, fr.store_no, nm.store_name
-        ORDER BY fr.date_forecast, fr.store_no
-    '''
+            agg.max_weather_severity,
+            agg.max_severity_category,
+            agg.weather_condition,
+            agg.avg_weather_severity,
+            agg.items_weather_adjusted,
+            {_aggregate_delta_columns()}
+        FROM regional_summary_store_aggregate agg
+        LEFT JOIN ({store_name_subquery}) nm ON agg.store_no = nm.store_no
+        WHERE agg.region_code = $region
+        AND agg.date_forecast BETWEEN $start_date AND $end_date
+        ORDER BY agg.date_forecast, agg.store_no
+    ''', _query_params(region, start_date, end_date)
 
 
-def get_item_summary_query(region: str, start_date: str, end_date: str) -> str:
-    """Generate query for item-level summary BY DATE."""
-    inactive_stores_filter = _get_inactive_stores_filter("fr")
-    inactive_store_items_filter = _get_inactive_store_items_filter("fr")
+@_cache_query_sql
+def get_item_summary_query(region: str, start_date: str, end_date: str) -> tuple:
+    """
+    Generate query for item-level summary BY DATE.
     
+    Reads the pre-aggregated regional_summary_item_aggregate table; the
+    ratios are derived from the returned totals by the sheet preparer.
+    """
     return f'''
         SELECT
-            fr.date_forecast AS forecast_date,
-            strftime(fr.date_forecast, '%A') AS day_name,
-            fr.item_no,
-            fr.item_desc,
-            COUNT(DISTINCT fr.store_no) AS store_count,
-            COUNT(*) AS line_count,
-            
-            -- Forecast quantities
-            SUM(COALESCE(fr.forecast_qty_pre_store_pass, fr.forecast_quantity)) AS total_forecast_pre_store_pass,
-            SUM(COALESCE(fr.store_level_adjustment_qty, 0)) AS total_store_level_adj,
-            SUM(COALESCE(fr.forecast_qty_pre_weather, fr.forecast_quantity)) AS total_forecast_pre_weather,
-            SUM(fr.forecast_quantity) AS total_forecast_qty,
-            SUM(COALESCE(fr.weather_adjustment_qty, 0)) AS total_weather_adj,
-            
-            -- Forecast Average (Expected Sales)
-            SUM(fr.forecast_average) AS total_forecast_average,
-            
-            -- Shipped Trend
-            SUM(fr.w4_shipped) AS w4_shipped_total,
-            SUM(fr.w3_shipped) AS w3_shipped_total,
-            SUM(fr.w2_shipped) AS w2_shipped_total,
-            SUM(fr.w1_shipped) AS w1_shipped_total,
-            
-            -- Sold Qty Trend
-            SUM(fr.w4_sold) AS w4_sold_total,
-            SUM(fr.w3_sold) AS w3_sold_total,
-            SUM(fr.w2_sold) AS w2_sold_total,
-            SUM(fr.w1_sold) AS w1_sold_total,
-            
-            -- Growth Metrics
-            CASE 
-                WHEN SUM(fr.w1_sold) > 0 
-                THEN ROUND((SUM(fr.forecast_average) - SUM(fr.w1_sold))::DOUBLE / SUM(fr.w1_sold), 4)
-                ELSE 0 
-            END AS growth_vs_w1_pct,
-            
-            CASE 
-                WHEN SUM(fr.w2_sold) > 0 
-                THEN ROUND((SUM(fr.forecast_average) - SUM(fr.w2_sold))::DOUBLE / SUM(fr.w2_sold), 4)
-                ELSE 0 
-            END AS growth_vs_w2_pct,
-
-            -- Expected Shrink
-            CASE 
-                WHEN SUM(fr.forecast_quantity) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.forecast_average))::DOUBLE / SUM(fr.forecast_quantity), 4)
-                ELSE 0 
-            END AS expected_shrink_from_avg,
-            
-            CASE 
-                WHEN SUM(fr.forecast_quantity) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.w1_sold))::DOUBLE / SUM(fr.forecast_quantity), 4)
-                ELSE 0 
-            END AS expected_shrink_from_lw,
-            
-            CASE 
-                WHEN SUM(fr.forecast_quantity) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.w2_sold))::DOUBLE / SUM(fr.forecast_quantity), 4)
-                ELSE 0 
-            END AS expected_shrink_from_2w,
-            
-            CASE 
-                WHEN SUM(fr.w1_shipped) > 0 
-                THEN ROUND((SUM(fr.w1_shipped) - SUM(fr.w1_sold))::DOUBLE / SUM(fr.w1_shipped), 4)
-                ELSE 0 
-            END AS lw_shrink_pct,
-            
+            agg.date_forecast AS forecast_date,
+            {_day_name_sql('agg.date_forecast')} AS day_name,
+            agg.item_no,
+            agg.item_desc,
+            agg.store_count,
+            agg.line_count,
+            {_aggregate_total_columns()}
             -- Weather metrics
-            SUM(CASE WHEN fr.weather_severity_category = 'SEVERE' THEN 1 ELSE 0 END) AS severe_count,
-            SUM(CASE WHEN fr.weather_severity_category = 'HIGH' THEN 1 ELSE 0 END) AS high_count,
-            SUM(CASE WHEN fr.weather_severity_category = 'MODERATE' THEN 1 ELSE 0 END) AS moderate_count,
-            SUM(CASE WHEN fr.weather_severity_category = 'LOW' THEN 1 ELSE 0 END) AS low_count,
-            SUM(CASE WHEN fr.weather_severity_category = 'MINIMAL' OR fr.weather_severity_category IS NULL THEN 1 ELSE 0 END) AS minimal_count,
-            ROUND(AVG(COALESCE(fr.weather_severity_score, 0)), 2) AS avg_weather_severity,
-            SUM(CASE WHEN fr.weather_adjusted = 1 THEN 1 ELSE 0 END) AS items_weather_adjusted,
-            
-            -- Change from last week
-            SUM(fr.forecast_quantity) - SUM(fr.w1_shipped) AS delta_from_lw,
-            
-            CASE 
-                WHEN SUM(fr.w1_shipped) > 0 
-                THEN ROUND((SUM(fr.forecast_quantity) - SUM(fr.w1_shipped))::DOUBLE / SUM(fr.w1_shipped), 4)
-                ELSE 0 
-            END AS delta_from_lw_pct
-            
-        FROM forecast_results fr
-        WHERE fr.region_code = '{region}'
-        AND fr.date_forecast BETWEEN '{start_date}' AND '{end_date}'
-        {inactive_stores_filter}
-        {inactive_store_items_filter}
-        GROUP BY fr.date_forecast, fr.item_no, fr.item_desc
-        ORDER BY fr.date_forecast, fr.item_no
-    '''
+            agg.severe_count,
+            agg.high_count,
+            agg.moderate_count,
+            agg.low_count,
+            agg.minimal_count,
+            agg.avg_weather_severity,
+            agg.items_weather_adjusted,
+            {_aggregate_delta_columns()}
+        FROM regional_summary_item_aggregate agg
+        WHERE agg.region_code = $region
+        AND agg.date_forecast BETWEEN $start_date AND $end_date
+        ORDER BY agg.date_forecast, agg.item_no
+    ''', _query_params(region, start_date, end_date)
 
 
-def get_item_detail_query(region: str, start_date: str, end_date: str) -> str:
+@_cache_query_sql
+def get_item_detail_query(region: str, start_date: str, end_date: str) -> tuple:
     """Generate query for full item/store level detail."""
     inactive_stores_filter = _get_inactive_stores_filter("fr")
     inactive_store_items_filter = _get_inactive_store_items_filter("fr")
-    store_name_subquery = _get_store_name_subquery(region)
+    store_name_subquery = _get_store_name_subquery()
     
     return f'''
         SELECT
             fr.date_forecast AS "Forecast Date",
-            strftime(fr.date_forecast, '%A') AS "Day",
+            {_day_name_sql('fr.date_forecast')} AS "Day",
             fr.store_no AS "Store #",
             nm.store_name AS "Store Name",
             fr.item_no AS "Item #",
@@ -392,25 +332,13 @@ def get_item_detail_query(region: str, start_date: str, end_date: str) -> str:
             fr.w2_sold AS "W2 Sold",
             fr.w1_sold AS "W1 Sold",
             
-            -- Growth Metrics
-            ROUND(CASE WHEN fr.w1_sold > 0 
-                THEN (fr.forecast_average - fr.w1_sold)::DOUBLE / fr.w1_sold 
-                ELSE 0 END * 100, 1) AS "Growth vs W1 %",
-            
-            ROUND(CASE WHEN fr.w2_sold > 0 
-                THEN (fr.forecast_average - fr.w2_sold)::DOUBLE / fr.w2_sold 
-                ELSE 0 END * 100, 1) AS "Growth vs W2 %",
-
-            -- Expected Shrink
-            ROUND(CASE WHEN fr.forecast_quantity > 0 
-                THEN (fr.forecast_quantity - fr.forecast_average)::DOUBLE / fr.forecast_quantity 
-                ELSE 0 END * 100, 1) AS "Exp Shrink (Avg) %",
-            ROUND(CASE WHEN fr.forecast_quantity > 0 
-                THEN (fr.forecast_quantity - fr.w1_sold)::DOUBLE / fr.forecast_quantity 
-                ELSE 0 END * 100, 1) AS "Exp Shrink (LW) %",
-            ROUND(CASE WHEN fr.forecast_quantity > 0 
-                THEN (fr.forecast_quantity - fr.w2_sold)::DOUBLE / fr.forecast_quantity 
-                ELSE 0 END * 100, 1) AS "Exp Shrink (2W) %",
+            -- Growth Metrics / Expected Shrink: placeholders that hold the
+            -- column positions; the item detail preparer fills them in Polars
+            NULL::DOUBLE AS "Growth vs W1 %",
+            NULL::DOUBLE AS "Growth vs W2 %",
+            NULL::DOUBLE AS "Exp Shrink (Avg) %",
+            NULL::DOUBLE AS "Exp Shrink (LW) %",
+            NULL::DOUBLE AS "Exp Shrink (2W) %",
             
             ROUND(fr.w1_shrink_p * 100, 1) AS "W1 Shrink %",
             
@@ -421,30 +349,29 @@ def get_item_detail_query(region: str, start_date: str, end_date: str) -> str:
             COALESCE(fr.weather_status_indicator, '-') AS "Weather Indicator",
             
             fr.delta_from_last_week AS "Delta from LW",
-            ROUND(CASE WHEN fr.w1_shipped > 0 
-                THEN (fr.forecast_quantity - fr.w1_shipped)::DOUBLE / fr.w1_shipped 
-                ELSE 0 END * 100, 1) AS "Delta LW %",
+            NULL::DOUBLE AS "Delta LW %",
             
             fr.base_cover_applied AS "Cover Applied"
             
         FROM forecast_results fr
         LEFT JOIN ({store_name_subquery}) nm ON fr.store_no = nm.store_no
-        WHERE fr.region_code = '{region}'
-        AND fr.date_forecast BETWEEN '{start_date}' AND '{end_date}'
+        WHERE fr.region_code = $region
+        AND fr.date_forecast BETWEEN $start_date AND $end_date
         {inactive_stores_filter}
         {inactive_store_items_filter}
         ORDER BY fr.date_forecast, fr.store_no, fr.item_no
-    '''
+    ''', _query_params(region, start_date, end_date)
 
 
-def get_weather_impact_summary_query(region: str, start_date: str, end_date: str) -> str:
+@_cache_query_sql
+def get_weather_impact_summary_query(region: str, start_date: str, end_date: str) -> tuple:
     """Generate query for weather impact summary by store and date."""
-    store_name_subquery = _get_store_name_subquery(region)
+    store_name_subquery = _get_store_name_subquery()
     
     return f'''
         SELECT
             w.date AS "Date",
-            strftime(w.date, '%A') AS "Day",
+            {_day_name_sql('w.date')} AS "Day",
             w.store_no AS "Store #",
             nm.store_name AS "Store Name",
             
@@ -495,20 +422,21 @@ def get_weather_impact_summary_query(region: str, start_date: str, end_date: str
                 SUM(COALESCE(weather_adjustment_qty, 0)) AS total_weather_adj,
                 SUM(CASE WHEN weather_adjusted = 1 THEN 1 ELSE 0 END) AS items_adjusted
             FROM forecast_results
-            WHERE region_code = '{region}'
-            AND date_forecast BETWEEN '{start_date}' AND '{end_date}'
+            WHERE region_code = $region
+            AND date_forecast BETWEEN $start_date AND $end_date
             GROUP BY store_no, date_forecast
         ) fr ON w.store_no = fr.store_no AND w.date = fr.date_forecast
         WHERE w.store_no IN (
             SELECT DISTINCT store_no FROM forecast_results 
-            WHERE region_code = '{region}'
+            WHERE region_code = $region
         )
-        AND w.date BETWEEN '{start_date}' AND '{end_date}'
+        AND w.date BETWEEN $start_date AND $end_date
         ORDER BY w.severity_score DESC, w.date, w.store_no
-    '''
+    ''', _query_params(region, start_date, end_date)
 
 
-def get_weather_summary_by_date_query(region: str, start_date: str, end_date: str) -> str:
+@_cache_query_sql
+def get_weather_summary_by_date_query(region: str, start_date: str, end_date: str) -> tuple:
     """Generate query for weather summary aggregated by date from forecast_results."""
     inactive_stores_filter = _get_inactive_stores_filter("forecast_results")
     inactive_store_items_filter = _get_inactive_store_items_filter("forecast_results")
@@ -516,15 +444,15 @@ def get_weather_summary_by_date_query(region: str, start_date: str, end_date: st
     return f'''
         SELECT
             date_forecast AS "Date",
-            strftime(date_forecast, '%A') AS "Day",
+            {_day_name_sql('date_forecast')} AS "Day",
             COUNT(DISTINCT store_no) AS "Store Count",
             
             -- Severity category distribution
-            COUNT(DISTINCT CASE WHEN weather_severity_category = 'SEVERE' THEN store_no END) AS "Severe",
-            COUNT(DISTINCT CASE WHEN weather_severity_category = 'HIGH' THEN store_no END) AS "High",
-            COUNT(DISTINCT CASE WHEN weather_severity_category = 'MODERATE' THEN store_no END) AS "Moderate",
-            COUNT(DISTINCT CASE WHEN weather_severity_category = 'LOW' THEN store_no END) AS "Low",
-            COUNT(DISTINCT CASE WHEN weather_severity_category = 'MINIMAL' OR weather_severity_category IS NULL THEN store_no END) AS "Minimal",
+            COUNT(DISTINCT store_no) FILTER (WHERE weather_severity_category = 'SEVERE') AS "Severe",
+            COUNT(DISTINCT store_no) FILTER (WHERE weather_severity_category = 'HIGH') AS "High",
+            COUNT(DISTINCT store_no) FILTER (WHERE weather_severity_category = 'MODERATE') AS "Moderate",
+            COUNT(DISTINCT store_no) FILTER (WHERE weather_severity_category = 'LOW') AS "Low",
+            COUNT(DISTINCT store_no) FILTER (WHERE weather_severity_category = 'MINIMAL' OR weather_severity_category IS NULL) AS "Minimal",
             
             -- Severity scores
             ROUND(AVG(COALESCE(weather_severity_score, 0)), 2) AS "Avg Severity",
@@ -539,10 +467,10 @@ def get_weather_summary_by_date_query(region: str, start_date: str, end_date: st
             ROUND(MAX(weather_temp_max), 1) AS "Warmest Temp",
             
             -- Precipitation counts with actual precip probability
-            COUNT(DISTINCT CASE WHEN COALESCE(weather_precip_probability, 0) > 50 THEN store_no END) AS "Stores w/ Rain Likely",
-            COUNT(DISTINCT CASE WHEN COALESCE(weather_total_rain_expected, 0) > 0.1 THEN store_no END) AS "Stores w/ Rain",
-            COUNT(DISTINCT CASE WHEN COALESCE(weather_snow_amount, 0) > 0 THEN store_no END) AS "Stores w/ Snow",
-            COUNT(DISTINCT CASE WHEN COALESCE(weather_snow_depth, 0) > 2 THEN store_no END) AS "Stores w/ Snow Depth > 2in",
+            COUNT(DISTINCT store_no) FILTER (WHERE COALESCE(weather_precip_probability, 0) > 50) AS "Stores w/ Rain Likely",
+            COUNT(DISTINCT store_no) FILTER (WHERE COALESCE(weather_total_rain_expected, 0) > 0.1) AS "Stores w/ Rain",
+            COUNT(DISTINCT store_no) FILTER (WHERE COALESCE(weather_snow_amount, 0) > 0) AS "Stores w/ Snow",
+            COUNT(DISTINCT store_no) FILTER (WHERE COALESCE(weather_snow_depth, 0) > 2) AS "Stores w/ Snow Depth > 2in",
             
             -- Average metrics for stores with precipitation
             ROUND(AVG(CASE WHEN COALESCE(weather_total_rain_expected, 0) > 0 THEN weather_total_rain_expected END), 2) AS "Avg Rain",
@@ -556,77 +484,69 @@ def get_weather_summary_by_date_query(region: str, start_date: str, end_date: st
             COALESCE(SUM(CASE WHEN weather_adjusted = 1 THEN 1 ELSE 0 END), 0) AS "Total Items Adj"
             
         FROM forecast_results
-        WHERE region_code = '{region}'
-        AND date_forecast BETWEEN '{start_date}' AND '{end_date}'
+        WHERE region_code = $region
+        AND date_forecast BETWEEN $start_date AND $end_date
         {inactive_stores_filter}
         {inactive_store_items_filter}
         GROUP BY date_forecast
         ORDER BY date_forecast
-    '''
+    ''', _query_params(region, start_date, end_date)
 
 
-def get_weather_store_detail_query(region: str, start_date: str, end_date: str) -> str:
+@_cache_query_sql
+def get_weather_store_detail_query(region: str, start_date: str, end_date: str) -> tuple:
     """Generate query for detailed store-level weather data, ranked by severity."""
     inactive_stores_filter = _get_inactive_stores_filter("fr")
     inactive_store_items_filter = _get_inactive_store_items_filter("fr")
-    store_name_subquery = _get_store_name_subquery(region)
+    store_name_subquery = _get_store_name_subquery()
     
     return f'''
         SELECT
             fr.date_forecast AS "Date",
-            strftime(fr.date_forecast, '%A') AS "Day",
+            {_day_name_sql('fr.date_forecast')} AS "Day",
             fr.store_no AS "Store #",
-            COALESCE(nm.store_name, 'Store ' || fr.store_no) AS "Store Name",
-            fr.weather_day_condition AS "Conditions",
-            ROUND(fr.weather_temp_min, 1) AS "Temp Min",
-            ROUND(fr.weather_temp_max, 1) AS "Temp Max",
+            COALESCE(ANY_VALUE(nm.store_name), 'Store ' || fr.store_no) AS "Store Name",
+            ANY_VALUE(fr.weather_day_condition) AS "Conditions",
+            ROUND(ANY_VALUE(fr.weather_temp_min), 1) AS "Temp Min",
+            ROUND(ANY_VALUE(fr.weather_temp_max), 1) AS "Temp Max",
             -- Precipitation details
-            ROUND(COALESCE(fr.weather_total_rain_expected, 0), 2) AS "Precip (in)",
-            ROUND(COALESCE(fr.weather_precip_probability, 0), 0) AS "Precip %",
-            ROUND(COALESCE(fr.weather_precip_cover, 0), 0) AS "Precip Cover %",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_total_rain_expected), 0), 2) AS "Precip (in)",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_precip_probability), 0), 0) AS "Precip %",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_precip_cover), 0), 0) AS "Precip Cover %",
             -- Snow details
-            ROUND(COALESCE(fr.weather_snow_amount, 0), 1) AS "Snow (in)",
-            ROUND(COALESCE(fr.weather_snow_depth, 0), 1) AS "Snow Depth",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_snow_amount), 0), 1) AS "Snow (in)",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_snow_depth), 0), 1) AS "Snow Depth",
             -- Wind details
-            ROUND(COALESCE(fr.weather_wind_speed, 0), 1) AS "Wind (mph)",
-            ROUND(COALESCE(fr.weather_wind_gust, 0), 1) AS "Wind Gust",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_wind_speed), 0), 1) AS "Wind (mph)",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_wind_gust), 0), 1) AS "Wind Gust",
             -- Visibility and atmosphere
-            ROUND(COALESCE(fr.weather_visibility, 10), 1) AS "Visibility",
-            ROUND(COALESCE(fr.weather_humidity, 0), 0) AS "Humidity %",
-            ROUND(COALESCE(fr.weather_cloud_cover, 0), 0) AS "Cloud Cover %",
-            ROUND(COALESCE(fr.weather_severe_risk, 0), 0) AS "Severe Risk",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_visibility), 10), 1) AS "Visibility",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_humidity), 0), 0) AS "Humidity %",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_cloud_cover), 0), 0) AS "Cloud Cover %",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_severe_risk), 0), 0) AS "Severe Risk",
             -- Component severity scores
-            ROUND(COALESCE(fr.weather_rain_severity, 0), 2) AS "Rain Sev",
-            ROUND(COALESCE(fr.weather_snow_severity, 0), 2) AS "Snow Sev",
-            ROUND(COALESCE(fr.weather_wind_severity, 0), 2) AS "Wind Sev",
-            ROUND(COALESCE(fr.weather_visibility_severity, 0), 2) AS "Vis Sev",
-            ROUND(COALESCE(fr.weather_temp_severity, 0), 2) AS "Temp Sev",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_rain_severity), 0), 2) AS "Rain Sev",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_snow_severity), 0), 2) AS "Snow Sev",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_wind_severity), 0), 2) AS "Wind Sev",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_visibility_severity), 0), 2) AS "Vis Sev",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_temp_severity), 0), 2) AS "Temp Sev",
             -- Final severity metrics
-            ROUND(COALESCE(fr.weather_severity_score, 0), 2) AS "Severity Score",
-            COALESCE(fr.weather_severity_category, 'MINIMAL') AS "Category",
-            ROUND(COALESCE(fr.weather_sales_impact_factor, 1.0), 3) AS "Impact Factor",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_severity_score), 0), 2) AS "Severity Score",
+            COALESCE(ANY_VALUE(fr.weather_severity_category), 'MINIMAL') AS "Category",
+            ROUND(COALESCE(ANY_VALUE(fr.weather_sales_impact_factor), 1.0), 3) AS "Impact Factor",
             -- Adjustments
             COALESCE(SUM(fr.weather_adjustment_qty), 0) AS "Qty Adjusted",
             COALESCE(SUM(CASE WHEN fr.weather_adjusted = 1 THEN 1 ELSE 0 END), 0) AS "Items Adj"
         FROM forecast_results fr
         LEFT JOIN ({store_name_subquery}) nm ON fr.store_no = nm.store_no
-        WHERE fr.region_code = '{region}'
-        AND fr.date_forecast BETWEEN '{start_date}' AND '{end_date}'
+        WHERE fr.region_code = $region
+        AND fr.date_forecast BETWEEN $start_date AND $end_date
         {inactive_stores_filter}
         {inactive_store_items_filter}
-        GROUP BY 
-            fr.date_forecast, fr.store_no, nm.store_name,
-            fr.weather_day_condition, fr.weather_temp_min, fr.weather_temp_max,
-            fr.weather_total_rain_expected, fr.weather_precip_probability, fr.weather_precip_cover,
-            fr.weather_snow_amount, fr.weather_snow_depth,
-            fr.weather_wind_speed, fr.weather_wind_gust, fr.weather_visibility,
-            fr.weather_humidity, fr.weather_cloud_cover, fr.weather_severe_risk,
-            fr.weather_rain_severity, fr.weather_snow_severity, fr.weather_wind_severity,
-            fr.weather_visibility_severity, fr.weather_temp_severity,
-            fr.weather_severity_score, fr.weather_severity_category,
-            fr.weather_sales_impact_factor
+        -- Weather columns are constant per store/date, so only the key is grouped
+        GROUP BY fr.date_forecast, fr.store_no
         ORDER BY 
-            COALESCE(fr.weather_severity_score, 0) DESC,
+            COALESCE(ANY_VALUE(fr.weather_severity_score), 0) DESC,
             fr.date_forecast,
             fr.store_no
-    '''
+    ''', _query_params(region, start_date, end_date)
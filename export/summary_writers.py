@@ -5,12 +5,21 @@ Worksheet writing functions for regional summary reports.
 
 This module contains all worksheet creation functions used for 
 generating the multi-sheet Excel summary reports.
+
+Every writer emits its rows strictly top to bottom (merged title rows are
+sized with set_row before they are merged), because the workbook runs in
+xlsxwriter constant_memory mode when settings.XLSX_CONSTANT_MEMORY is on
+and a row is flushed as soon as a later row is started.
 """
 
+from itertools import chain
+from operator import itemgetter
+
 import polars as pl
 
 from .summary_queries import (
     get_daily_summary_query,
+    get_daily_summary_query_multi,
     get_store_summary_query,
     get_item_summary_query,
     get_item_detail_query,
@@ -20,41 +29,562 @@ from .summary_queries import (
 from .summary_formatting import (
     WEATHER_ICONS,
     SEVERITY_ICONS,
-    get_weather_indicator_icon,
-    get_severity_format,
-    get_shrink_pct_format,
-    get_growth_pct_format,
-    build_sales_trend_string
+    build_weather_icon_expr,
+    severity_bucket,
+    shrink_pct_band_expr,
+    growth_pct_band_expr,
+    severity_bucket_expr,
+    build_sales_trend_string,
+    build_sales_trend_expr
+)
+
+
+# Sheet data keys used by prefetch_sheet_data() and the writers below
+SHEET_QUERIES = {
+    'daily_summary': get_daily_summary_query,
+    'store_summary': get_store_summary_query,
+    'item_summary': get_item_summary_query,
+    'weather_daily': get_weather_summary_by_date_query,
+    'weather_store': get_weather_store_detail_query,
+    'item_detail': get_item_detail_query,
+}
+# Sheets fetched once for every region by fetch_multi_region_sheet_dfs()
+SHEET_MULTI_REGION_QUERIES = {
+    'daily_summary': get_daily_summary_query_multi,
+}
+
+# Sheets too large to materialize up front: prefetch_sheet_data() only reads
+# their first batch ahead and their writers stream Arrow batches of
+# SHEET_BATCH_ROWS rows instead
+STREAMED_SHEETS = {'item_detail'}
+SHEET_BATCH_ROWS = 65536
+
+
+# Severity count columns, most to least severe, for the daily/item summaries
+# and the weather daily section
+SEVERITY_COUNT_COLUMNS = (
+    'severe_count', 'high_count', 'moderate_count', 'low_count', 'minimal_count'
+)
+WEATHER_SEVERITY_COUNT_COLUMNS = ('Severe', 'High', 'Moderate', 'Low', 'Minimal')
+
+# Weather Impact severity score columns, written with a severity bucket format
+WEATHER_DAILY_SEVERITY_COLUMNS = ('Avg Severity', 'Max Severity')
+WEATHER_COMPONENT_SEVERITY_COLUMNS = ('Rain Sev', 'Snow Sev', 'Wind Sev', 'Vis Sev', 'Temp Sev')
+WEATHER_STORE_SEVERITY_COLUMNS = (*WEATHER_COMPONENT_SEVERITY_COLUMNS, 'Severity Score')
+
+# Static legend rows for the Weather Impact sheet: (label, format key, description)
+SEVERITY_LEGEND_ITEMS = (
+    (f"{SEVERITY_ICONS['SEVERE']} SEVERE (7-10)", 'severity_severe', 'Dangerous conditions - significant travel hazard'),
+    (f"{SEVERITY_ICONS['HIGH']} HIGH (5-7)", 'severity_high', 'Poor conditions - notable impact on foot traffic'),
+    (f"{SEVERITY_ICONS['MODERATE']} MODERATE (3-5)", 'severity_moderate', 'Fair conditions - some impact expected'),
+    (f"{SEVERITY_ICONS['LOW']} LOW (1.5-3)", 'severity_low', 'Minor conditions - minimal impact'),
+    (f"{SEVERITY_ICONS['MINIMAL']} MINIMAL (0-1.5)", 'severity_minimal', 'Good conditions - no weather impact'),
+)
+
+# Static component severity legend rows: (abbreviation, name, description)
+SEVERITY_COMPONENT_LEGEND = (
+    ('RainSv', 'Rain Severity', 'Based on precip amount × probability (0.05-1.0+ inches)'),
+    ('SnowSv', 'Snow Severity', 'Based on new snow amount + accumulated depth bonus'),
+    ('WindSv', 'Wind Severity', 'Compounds with rain/snow; minimal standalone impact'),
+    ('VisSv', 'Visibility Severity', 'Fog/low visibility (<0.5mi can trigger alone)'),
+    ('TempSv', 'Temperature Severity', 'Extreme cold (<10°F) or heat (>100°F); max 3.0'),
+)
+
+# Static weather icon legend rows: (icon, description)
+WEATHER_ICON_LEGEND = (
+    (WEATHER_ICONS['severe'], 'Severe/Dangerous'),
+    (WEATHER_ICONS['thunderstorm'], 'Thunderstorm'),
+    (WEATHER_ICONS['snow_heavy'], 'Heavy Snow'),
+    (WEATHER_ICONS['snow'], 'Snow'),
+    (WEATHER_ICONS['rain_heavy'], 'Heavy Rain'),
+    (WEATHER_ICONS['rain'], 'Rain'),
+    (WEATHER_ICONS['fog'], 'Fog/Mist'),
+    (WEATHER_ICONS['wind'], 'High Wind'),
+    (WEATHER_ICONS['extreme_cold'], 'Extreme Cold'),
+    (WEATHER_ICONS['clear'], 'Clear/Sunny'),
+)
+
+# Forecast quantity columns, written as one run of number cells (after the
+# sheet's count columns) by the daily/store/item summaries, then the trends
+SUMMARY_QUANTITY_COLUMNS = (
+    'total_forecast_pre_store_pass', 'total_store_level_adj',
+    'total_forecast_pre_weather', 'total_weather_adj',
+    'total_forecast_qty', 'total_forecast_average'
+)
+SUMMARY_TREND_COLUMNS = ('shipped_trend', 'sold_trend')
+
+# Columns the summary sheets treat as 0 / a default label when null
+SUMMARY_ZERO_FILL_COLUMNS = [
+    'growth_vs_w1_pct', 'growth_vs_w2_pct',
+    'expected_shrink_from_avg', 'expected_shrink_from_lw',
+    'expected_shrink_from_2w', 'lw_shrink_pct',
+    'severe_count', 'high_count', 'moderate_count', 'low_count', 'minimal_count',
+    'avg_weather_severity', 'max_weather_severity', 'delta_from_lw_pct'
+]
+SUMMARY_TEXT_DEFAULTS = {
+    'weather_condition': '',
+    'max_severity_category': 'MINIMAL'
+}
+
+# Summary columns that get a '<name>_band' column indexing their format tuple
+SUMMARY_SHRINK_BAND_COLUMNS = (
+    'expected_shrink_from_avg', 'expected_shrink_from_lw',
+    'expected_shrink_from_2w', 'lw_shrink_pct'
 )
+SUMMARY_GROWTH_BAND_COLUMNS = ('growth_vs_w1_pct', 'growth_vs_w2_pct')
+SUMMARY_SEVERITY_BAND_COLUMNS = ('avg_weather_severity', 'max_weather_severity')
+
+# Excel serial day number of 1970-01-01 (1900 date system). Dates are written
+# as serials derived in Polars, so xlsxwriter skips its per-cell conversion.
+EXCEL_UNIX_EPOCH_SERIAL = 25569
+
+# Prefix of the helper columns the Item Details preparer appends (format
+# bands, weather icon); they are read by the writer but not written as columns
+ITEM_DETAIL_HELPER_PREFIX = '__'
+ITEM_DETAIL_ICON_COLUMN = ITEM_DETAIL_HELPER_PREFIX + 'weather_icon'
+
+# Daily Summary totals row: key -> (source column, aggregation)
+DAILY_TOTALS_COLUMNS = {
+    'stores': ('store_count', 'max'),
+    'items': ('item_count', 'max'),
+    'lines': ('line_count', 'sum'),
+    'pre_store_pass': ('total_forecast_pre_store_pass', 'sum'),
+    'store_adj': ('total_store_level_adj', 'sum'),
+    'pre_weather': ('total_forecast_pre_weather', 'sum'),
+    'weather_adj': ('total_weather_adj', 'sum'),
+    'forecast': ('total_forecast_qty', 'sum'),
+    'forecast_avg': ('total_forecast_average', 'sum'),
+    'w4_shipped': ('w4_shipped_total', 'sum'),
+    'w3_shipped': ('w3_shipped_total', 'sum'),
+    'w2_shipped': ('w2_shipped_total', 'sum'),
+    'w1_shipped': ('w1_shipped_total', 'sum'),
+    'w4_sold': ('w4_sold_total', 'sum'),
+    'w3_sold': ('w3_sold_total', 'sum'),
+    'w2_sold': ('w2_sold_total', 'sum'),
+    'w1_sold': ('w1_sold_total', 'sum'),
+    'severe': ('severe_count', 'sum'),
+    'high': ('high_count', 'sum'),
+    'moderate': ('moderate_count', 'sum'),
+    'low': ('low_count', 'sum'),
+    'minimal': ('minimal_count', 'sum'),
+    'weather_adjusted': ('items_weather_adjusted', 'sum'),
+    'delta': ('delta_from_lw', 'sum'),
+}
+
+# Ratio columns derived in Polars from the fetched totals, as
+# name -> (minuend, subtrahend, divisor): (minuend - subtrahend) / divisor
+SUMMARY_RATIO_COLUMNS = {
+    'growth_vs_w1_pct': ('total_forecast_average', 'w1_sold_total', 'w1_sold_total'),
+    'growth_vs_w2_pct': ('total_forecast_average', 'w2_sold_total', 'w2_sold_total'),
+    'expected_shrink_from_avg': ('total_forecast_qty', 'total_forecast_average', 'total_forecast_qty'),
+    'expected_shrink_from_lw': ('total_forecast_qty', 'w1_sold_total', 'total_forecast_qty'),
+    'expected_shrink_from_2w': ('total_forecast_qty', 'w2_sold_total', 'total_forecast_qty'),
+    'lw_shrink_pct': ('w1_shipped_total', 'w1_sold_total', 'w1_shipped_total'),
+    'delta_from_lw_pct': ('total_forecast_qty', 'w1_shipped_total', 'w1_shipped_total'),
+}
+ITEM_DETAIL_RATIO_COLUMNS = {
+    'Growth vs W1 %': ('Fcst Avg (Exp Sales)', 'W1 Sold', 'W1 Sold'),
+    'Growth vs W2 %': ('Fcst Avg (Exp Sales)', 'W2 Sold', 'W2 Sold'),
+    'Exp Shrink (Avg) %': ('Fcst Final', 'Fcst Avg (Exp Sales)', 'Fcst Final'),
+    'Exp Shrink (LW) %': ('Fcst Final', 'W1 Sold', 'Fcst Final'),
+    'Exp Shrink (2W) %': ('Fcst Final', 'W2 Sold', 'Fcst Final'),
+    'Delta LW %': ('Fcst Final', 'W1 Ship', 'W1 Ship'),
+}
+
+
+def _decimals_to_float(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Cast Decimal columns (DuckDB HUGEINT sums arrive as Decimal(38, 0)) to Float64.
+    
+    The writers do plain float arithmetic on these totals, as they did when
+    results went through pandas.
+    """
+    decimal_cols = [name for name, dtype in df.schema.items() if dtype == pl.Decimal]
+    if not decimal_cols:
+        return df
+    return df.with_columns([pl.col(name).cast(pl.Float64) for name in decimal_cols])
+
+
+def fetch_query_df(conn, query: str, params: dict = None) -> pl.DataFrame:
+    """
+    Run a query on its own DuckDB cursor and return a Polars DataFrame.
+    
+    The result is exported straight to Polars through Arrow, without a
+    pandas round-trip. A dedicated cursor makes this safe to call from
+    worker threads while the main thread keeps using ``conn``.
+    """
+    cursor = conn.cursor()
+    try:
+        return _decimals_to_float(cursor.execute(query, params).pl())
+    finally:
+        cursor.close()
+
+
+def fetch_sheet_df(conn, key: str, region: str,
+                   start_date: str, end_date: str) -> pl.DataFrame:
+    """
+    Fetch one sheet's data and apply its Polars preparation step.
+    
+    This is the "fetch" half of each sheet; the writers are the "write" half.
+    Keeping the vectorized preparation here lets it run on a worker thread too.
+    """
+    query, params = SHEET_QUERIES[key](region, start_date, end_date)
+    df = fetch_query_df(conn, query, params)
+    prepare = SHEET_PREPARERS.get(key)
+    return prepare(df) if prepare else df
+
+
+def iter_sheet_batches(conn, key: str, region: str,
+                       start_date: str, end_date: str,
+                       batch_rows: int = SHEET_BATCH_ROWS):
+    """
+    Stream one sheet's data as prepared Polars DataFrames of up to batch_rows rows.
+    
+    The query result is read through a DuckDB Arrow record batch reader, so
+    only one batch is held in memory at a time. Empty batches are skipped,
+    so an empty result yields nothing.
+    """
+    query, params = SHEET_QUERIES[key](region, start_date, end_date)
+    prepare = SHEET_PREPARERS.get(key)
+    cursor = conn.cursor()
+    try:
+        reader = cursor.execute(query, params).fetch_record_batch(batch_rows)
+        for batch in reader:
+            if batch.num_rows == 0:
+                continue
+            df = _decimals_to_float(pl.from_arrow(batch))
+            yield prepare(df) if prepare else df
+    finally:
+        cursor.close()
+
+
+def open_sheet_stream(conn, key: str, region: str,
+                      start_date: str, end_date: str) -> tuple:
+    """
+    Start streaming one sheet and read its first batch.
+    
+    Returns:
+        Tuple of (first prepared DataFrame or None when empty, iterator over
+        the remaining batches)
+    """
+    batches = iter_sheet_batches(conn, key, region, start_date, end_date)
+    return next(batches, None), batches
+
+
+def fetch_multi_region_sheet_dfs(conn, regions: list,
+                                 start_date: str, end_date: str) -> dict:
+    """
+    Fetch the SHEET_MULTI_REGION_QUERIES sheets once for all regions.
+    
+    Each sheet runs as a single query over every region and is prepared once;
+    the result is then split per region so each export skips its own query.
+    
+    Returns:
+        Dictionary of region -> {sheet data key -> prepared Polars DataFrame}
+    """
+    region_data = {region: {} for region in regions}
+    
+    for key, query_builder in SHEET_MULTI_REGION_QUERIES.items():
+        query, params = query_builder(regions, start_date, end_date)
+        df = fetch_query_df(conn, query, params)
+        prepare = SHEET_PREPARERS.get(key)
+        if prepare:
+            df = prepare(df)
+        
+        for region in regions:
+            region_data[region][key] = (
+                df.filter(pl.col('region_code') == region).drop('region_code')
+            )
+    
+    return region_data
+
+
+def prefetch_sheet_data(executor, conn, region: str,
+                        start_date: str, end_date: str,
+                        shared_data: dict = None) -> dict:
+    """
+    Submit every sheet fetch to an executor so they run concurrently.
+    
+    DuckDB and Polars release the GIL while executing, so the queries and
+    their preparation overlap with each other and with the (serial)
+    worksheet writing on the main thread.
+    
+    Sheets in STREAMED_SHEETS are not fetched whole: their query is started
+    and only the first batch read ahead (see open_sheet_stream); the writers
+    stream the rest.
+    Sheets already in shared_data (see fetch_multi_region_sheet_dfs) are
+    used as-is instead of being queried again.
+    
+    Returns:
+        Dictionary of sheet data key -> Polars DataFrame or Future resolving to
+        one (to an open_sheet_stream tuple for streamed sheets)
+    """
+    prefetched = dict(shared_data or {})
+    for key in SHEET_QUERIES:
+        if key not in prefetched:
+            fetch = open_sheet_stream if key in STREAMED_SHEETS else fetch_sheet_df
+            prefetched[key] = executor.submit(
+                fetch, conn, key, region, start_date, end_date
+            )
+    return prefetched
+
+
+def _load_sheet_df(conn, key: str, region: str, start_date: str, end_date: str,
+                   prefetched: dict = None) -> pl.DataFrame:
+    """Return a sheet's DataFrame, waiting on its prefetched future when available."""
+    if prefetched and key in prefetched:
+        data = prefetched.pop(key)
+        return data if isinstance(data, pl.DataFrame) else data.result()
+    return fetch_sheet_df(conn, key, region, start_date, end_date)
+
+
+def _load_sheet_stream(conn, key: str, region: str, start_date: str, end_date: str,
+                       prefetched: dict = None) -> tuple:
+    """Return a streamed sheet's open_sheet_stream tuple, waiting on its prefetched future when available."""
+    if prefetched and key in prefetched:
+        return prefetched.pop(key).result()
+    return open_sheet_stream(conn, key, region, start_date, end_date)
+
+
+def _display_name_expr(name_col: str, key_col: str, label: str) -> pl.Expr:
+    """
+    Use ``name_col`` when present, else '<label> <key>' (e.g. 'Item 12345').
+    
+    Returns:
+        Expression producing a '<name_col>_display' string column
+    """
+    name = pl.col(name_col)
+    return (
+        pl.when(name.is_null() | (name == ''))
+        .then(pl.format(f'{label} {{}}', pl.col(key_col)))
+        .otherwise(name)
+        .alias(f'{name_col}_display')
+    )
+
+
+def _severity_count_columns(formats: dict, columns: tuple) -> tuple:
+    """Pair severity count columns (most severe first) with their highlight format."""
+    return tuple(zip(columns, reversed(formats['severity_by_bucket'])))
+
+
+def _round_half_away(expr: pl.Expr, decimals: int) -> pl.Expr:
+    """Round like DuckDB's ROUND(x, n): half away from zero on x * 10^n."""
+    scale = 10 ** decimals
+    scaled = expr * scale
+    return (scaled.abs() + 0.5).floor() * scaled.sign() / scale
+
+
+def _ratio_exprs(ratio_columns: dict, scale: int = 1, decimals: int = 4) -> list:
+    """
+    Build the ratio columns as vectorized Polars expressions.
+    
+    Each ratio is (minuend - subtrahend) / divisor when the divisor is
+    positive and 0 otherwise, times ``scale`` and rounded to ``decimals``.
+    This mirrors the CASE/ROUND expressions the queries used to evaluate.
+    """
+    exprs = []
+    for name, (minuend, subtrahend, divisor) in ratio_columns.items():
+        divisor_col = pl.col(divisor)
+        ratio = (
+            pl.when(divisor_col > 0)
+            .then((pl.col(minuend) - pl.col(subtrahend)) / divisor_col)
+            .otherwise(0.0)
+        )
+        exprs.append(_round_half_away(ratio * scale, decimals).alias(name))
+    return exprs
+
+
+def _fill_summary_nulls(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Fill nulls in the summary sheet columns once, in Polars.
+    
+    Numeric columns get 0 and text columns get their default label (empty
+    strings included), matching the ``value or default`` reads they replace.
+    """
+    exprs = [pl.col(c).fill_null(0) for c in SUMMARY_ZERO_FILL_COLUMNS if c in df.columns]
+    for c, default in SUMMARY_TEXT_DEFAULTS.items():
+        if c in df.columns:
+            exprs.append(
+                pl.when(pl.col(c).is_null() | (pl.col(c) == ''))
+                .then(pl.lit(default))
+                .otherwise(pl.col(c))
+                .alias(c)
+            )
+    return df.with_columns(exprs) if exprs else df
+
+
+def _summary_band_exprs(columns: list) -> list:
+    """
+    Build the '<name>_band' format index columns for the summary sheets.
+    
+    The values must already be null-filled (see _fill_summary_nulls).
+    """
+    band_builders = (
+        (SUMMARY_SHRINK_BAND_COLUMNS, shrink_pct_band_expr),
+        (SUMMARY_GROWTH_BAND_COLUMNS, growth_pct_band_expr),
+        (SUMMARY_SEVERITY_BAND_COLUMNS, severity_bucket_expr),
+    )
+    return [
+        build(pl.col(c)).alias(f'{c}_band')
+        for band_columns, build in band_builders
+        for c in band_columns if c in columns
+    ]
+
+
+def _excel_date_serial_expr(column: str) -> pl.Expr:
+    """Excel serial day number of a Date (or midnight Datetime) column."""
+    return pl.col(column).cast(pl.Date).cast(pl.Int32) + EXCEL_UNIX_EPOCH_SERIAL
+
+
+def _prepare_daily_summary(df: pl.DataFrame) -> pl.DataFrame:
+    """Derive the ratios, fill nulls and build the trend strings, date serials and format bands for the Daily Summary sheet."""
+    df = _fill_summary_nulls(df.with_columns(_ratio_exprs(SUMMARY_RATIO_COLUMNS)))
+    return df.with_columns(
+        build_sales_trend_expr('shipped'),
+        build_sales_trend_expr('sold'),
+        _excel_date_serial_expr('forecast_date').alias('forecast_date_serial'),
+        *_summary_band_exprs(df.columns)
+    )
+
+
+def _prepare_store_summary(df: pl.DataFrame) -> pl.DataFrame:
+    """Daily Summary preparation plus the store display name and weather icon."""
+    df = _prepare_daily_summary(df)
+    return df.with_columns(
+        _display_name_expr('store_name', 'store_no', 'Store'),
+        build_weather_icon_expr(
+            df, 'weather_condition', 'max_severity_category', 'max_weather_severity'
+        ).alias('weather_icon')
+    )
+
+
+def _prepare_item_summary(df: pl.DataFrame) -> pl.DataFrame:
+    """Daily Summary preparation plus the item display name."""
+    return _prepare_daily_summary(df).with_columns(
+        _display_name_expr('item_desc', 'item_no', 'Item')
+    )
+
+
+def _prepare_item_detail(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Fill the item detail ratio columns (percent, one decimal) in place and
+    append the helper columns: a format band for each shrink / growth %
+    column, a serial for each date column and the weather indicator icon.
+    """
+    df = df.with_columns(_ratio_exprs(ITEM_DETAIL_RATIO_COLUMNS, scale=100, decimals=1))
+    band_builders = {'shrink_pct': shrink_pct_band_expr, 'growth_pct': growth_pct_band_expr}
+    helper_exprs = [
+        build_weather_icon_expr(
+            df, 'Weather Condition', 'Severity Category', 'Weather Severity'
+        ).alias(ITEM_DETAIL_ICON_COLUMN)
+    ]
+    for c in df.columns:
+        kind = _item_detail_cell_kind(c)
+        if kind in band_builders:
+            helper_exprs.append(
+                band_builders[kind](pl.col(c).fill_null(0) / 100).alias(_item_detail_helper_column(c))
+            )
+        elif kind == 'date':
+            helper_exprs.append(_excel_date_serial_expr(c).alias(_item_detail_helper_column(c)))
+    return df.with_columns(helper_exprs)
+
+
+def _weather_band_column(name: str) -> str:
+    """Name of the severity bucket column of a Weather Impact severity score column."""
+    return f'{name} Band'
+
+
+def _prepare_weather_section(df: pl.DataFrame, severity_columns: tuple) -> pl.DataFrame:
+    """
+    Fill a Weather Impact section's severity score columns with 0 and append
+    their severity buckets (see _weather_band_column) and the 'Date Serial'
+    of the Date column.
+    """
+    df = df.with_columns(pl.col(c).fill_null(0) for c in severity_columns)
+    return df.with_columns(
+        _excel_date_serial_expr('Date').alias('Date Serial'),
+        *(
+            severity_bucket_expr(pl.col(c)).alias(_weather_band_column(c))
+            for c in severity_columns
+        )
+    )
+
+
+def _prepare_weather_daily(df: pl.DataFrame) -> pl.DataFrame:
+    """Zero-filled severity counts, severity buckets and date serials for the Daily Weather Summary section."""
+    df = df.with_columns(pl.col(c).fill_null(0) for c in WEATHER_SEVERITY_COUNT_COLUMNS)
+    return _prepare_weather_section(df, WEATHER_DAILY_SEVERITY_COLUMNS)
+
+
+def _prepare_weather_store(df: pl.DataFrame) -> pl.DataFrame:
+    """
+    Weather section preparation for the Store-Level Weather Details, with the
+    condition ('' when null) and category ('MINIMAL' when empty) filled in
+    place, plus the store weather indicator icon.
+    """
+    category = pl.col('Category')
+    df = _prepare_weather_section(df, WEATHER_STORE_SEVERITY_COLUMNS).with_columns(
+        pl.col('Conditions').fill_null(''),
+        pl.when(category.is_null() | (category == ''))
+        .then(pl.lit('MINIMAL'))
+        .otherwise(category)
+        .alias('Category')
+    )
+    return df.with_columns(
+        build_weather_icon_expr(
+            df, 'Conditions', 'Category', 'Severity Score',
+            snow_col='Snow (in)', rain_col='Precip (in)',
+            temp_min_col='Temp Min', temp_max_col='Temp Max', wind_col='Wind (mph)'
+        ).alias('Weather Icon')
+    )
+
+
+def _item_detail_helper_column(header: str) -> str:
+    """Name of the helper column (format band or date serial) of an Item Details column."""
+    return f'{ITEM_DETAIL_HELPER_PREFIX}{header}'
+
+
+# Per-sheet Polars preparation applied right after the fetch (and to every
+# streamed batch). Null fills, ratios and trend strings are derived here as
+# whole-column expressions, so the writers never format or default per row
+# and the queries stay plain aggregate reads.
+SHEET_PREPARERS = {
+    'daily_summary': _prepare_daily_summary,
+    'store_summary': _prepare_store_summary,
+    'item_summary': _prepare_item_summary,
+    'item_detail': _prepare_item_detail,
+    'weather_daily': _prepare_weather_daily,
+    'weather_store': _prepare_weather_store,
+}
 
 
 def write_daily_summary_sheet(wb, conn, region: str, 
                                start_date: str, end_date: str,
-                               formats: dict):
+                               formats: dict, prefetched: dict = None):
     """
     Create the Daily Summary worksheet with trends, growth %, expected shrink, and weather.
     """
     ws = wb.add_worksheet('Daily Summary')
     
     # Set column widths
-    ws.set_column('A:A', 12)   # Date
-    ws.set_column('B:B', 10)   # Day
-    ws.set_column('C:E', 8)    # Stores, Items, Lines
-    ws.set_column('F:K', 12)   # Forecast quantities
-    ws.set_column('L:L', 14)   # Fcst Avg
-    ws.set_column('M:M', 26)   # Shipped Trend
-    ws.set_column('N:N', 26)   # Sold Trend
-    ws.set_column('O:P', 11)   # Growth %
-    ws.set_column('Q:T', 11)   # Expected Shrink columns
-    ws.set_column('U:Y', 8)    # Weather severity counts
-    ws.set_column('Z:Z', 11)   # Avg Weather
-    ws.set_column('AA:AB', 12) # Delta, Delta %
+    ws.set_column(0, 0, 12)    # Date
+    ws.set_column(1, 1, 10)    # Day
+    ws.set_column(2, 4, 8)     # Stores, Items, Lines
+    ws.set_column(5, 10, 12)   # Forecast quantities
+    ws.set_column(11, 11, 14)  # Fcst Avg
+    ws.set_column(12, 12, 26)  # Shipped Trend
+    ws.set_column(13, 13, 26)  # Sold Trend
+    ws.set_column(14, 15, 11)  # Growth %
+    ws.set_column(16, 19, 11)  # Expected Shrink columns
+    ws.set_column(20, 24, 8)   # Weather severity counts
+    ws.set_column(25, 25, 11)  # Avg Weather
+    ws.set_column(26, 27, 12)  # Delta, Delta %
     
     # Title
-    ws.merge_range('A1:AB1', f'Daily Forecast Summary - Region {region}', formats['title'])
-    ws.merge_range('A2:AB2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:AB1', f'Daily Forecast Summary - Region {region}', formats['title'])
+    ws.merge_range('A2:AB2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     # Column headers
     headers = [
@@ -75,157 +605,100 @@ def write_daily_summary_sheet(wb, conn, region: str,
     ws.set_row(3, 40)
     
     # Get data
-    query = get_daily_summary_query(region, start_date, end_date)
     try:
-        df = pl.from_pandas(conn.sql(query).to_df())
-        data = df.to_dicts()
+        df = _load_sheet_df(conn, 'daily_summary', region, start_date, end_date, prefetched)
+        col_idx = {name: i for i, name in enumerate(df.columns)}
+        data = df.rows()
+        
+        # Same-format cell runs, picked out of each row tuple (see the loop)
+        quantity_values = itemgetter(*(
+            col_idx[c] for c in ('store_count', 'item_count', 'line_count', *SUMMARY_QUANTITY_COLUMNS)
+        ))
+        trend_values = itemgetter(*(col_idx[c] for c in SUMMARY_TREND_COLUMNS))
     except Exception as e:
         print(f"Error getting daily summary: {e}")
+        df = None
         data = []
     
     # Write data rows
     row = 4
-    totals = {
-        'stores': 0, 'items': 0, 'lines': 0,
-        'pre_store_pass': 0, 'store_adj': 0, 'pre_weather': 0,
-        'weather_adj': 0, 'forecast': 0, 'forecast_avg': 0,
-        'w4_shipped': 0, 'w3_shipped': 0, 'w2_shipped': 0, 'w1_shipped': 0,
-        'w4_sold': 0, 'w3_sold': 0, 'w2_sold': 0, 'w1_sold': 0,
-        'severe': 0, 'high': 0, 'moderate': 0, 'low': 0, 'minimal': 0,
-        'weather_adjusted': 0, 'delta': 0
-    }
+    
+    # Bind per-row lookups to locals for the hot loop
+    ws_write = ws.write
+    ws_write_number = ws.write_number
+    ws_write_row = ws.write_row
+    fmt_date = formats['date']
+    fmt_text_center = formats['text_center']
+    fmt_number = formats['number']
+    fmt_trend = formats['trend']
+    severity_count_cols = _severity_count_columns(formats, SEVERITY_COUNT_COLUMNS)
+    fmt_pct = formats['pct']
+    shrink_formats = formats['shrink_pct_by_band']
+    growth_formats = formats['growth_pct_by_band']
+    severity_formats = formats['severity_by_bucket']
     
     for d in data:
         col = 0
         # Basic info
-        ws.write(row, col, d.get('forecast_date'), formats['date'])
-        col += 1
-        ws.write(row, col, d.get('day_name'), formats['text_center'])
-        col += 1
-        ws.write(row, col, d.get('store_count'), formats['number'])
+        ws_write_number(row, col, d[col_idx['forecast_date_serial']], fmt_date)
         col += 1
-        ws.write(row, col, d.get('item_count'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('line_count'), formats['number'])
+        ws_write(row, col, d[col_idx['day_name']], fmt_text_center)
         col += 1
         
-        # Forecast quantities
-        ws.write(row, col, d.get('total_forecast_pre_store_pass'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_store_level_adj'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_forecast_pre_weather'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_weather_adj'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_forecast_qty'), formats['number'])
-        col += 1
-        
-        # Forecast Average
-        ws.write(row, col, d.get('total_forecast_average'), formats['number'])
-        col += 1
-        
-        # Shipped Trend
-        shipped_trend = build_sales_trend_string(
-            d.get('w4_shipped_total'), d.get('w3_shipped_total'),
-            d.get('w2_shipped_total'), d.get('w1_shipped_total')
-        )
-        ws.write(row, col, shipped_trend, formats['trend'])
-        col += 1
-        
-        # Sold Trend
-        sold_trend = build_sales_trend_string(
-            d.get('w4_sold_total'), d.get('w3_sold_total'),
-            d.get('w2_sold_total'), d.get('w1_sold_total')
-        )
-        ws.write(row, col, sold_trend, formats['trend'])
-        col += 1
+        # Counts, forecast quantities and Fcst Avg, then the two trends
+        quantities = quantity_values(d)
+        ws_write_row(row, col, quantities, fmt_number)
+        col += len(quantities)
+        ws_write_row(row, col, trend_values(d), fmt_trend)
+        col += 2
         
         # Growth % (NEW COLUMNS)
-        growth_w1 = d.get('growth_vs_w1_pct') or 0
-        growth_w2 = d.get('growth_vs_w2_pct') or 0
-        ws.write(row, col, growth_w1, get_growth_pct_format(formats, growth_w1))
+        growth_w1 = d[col_idx['growth_vs_w1_pct']]
+        growth_w2 = d[col_idx['growth_vs_w2_pct']]
+        ws_write(row, col, growth_w1, growth_formats[d[col_idx['growth_vs_w1_pct_band']]])
         col += 1
-        ws.write(row, col, growth_w2, get_growth_pct_format(formats, growth_w2))
+        ws_write(row, col, growth_w2, growth_formats[d[col_idx['growth_vs_w2_pct_band']]])
         col += 1
         
         # Expected Shrink with conditional formatting
-        exp_shrink_avg = d.get('expected_shrink_from_avg') or 0
-        exp_shrink_lw = d.get('expected_shrink_from_lw') or 0
-        exp_shrink_2w = d.get('expected_shrink_from_2w') or 0
-        lw_shrink = d.get('lw_shrink_pct') or 0
+        exp_shrink_avg = d[col_idx['expected_shrink_from_avg']]
+        exp_shrink_lw = d[col_idx['expected_shrink_from_lw']]
+        exp_shrink_2w = d[col_idx['expected_shrink_from_2w']]
+        lw_shrink = d[col_idx['lw_shrink_pct']]
         
-        ws.write(row, col, exp_shrink_avg, get_shrink_pct_format(formats, exp_shrink_avg))
+        ws_write(row, col, exp_shrink_avg, shrink_formats[d[col_idx['expected_shrink_from_avg_band']]])
         col += 1
-        ws.write(row, col, exp_shrink_lw, get_shrink_pct_format(formats, exp_shrink_lw))
+        ws_write(row, col, exp_shrink_lw, shrink_formats[d[col_idx['expected_shrink_from_lw_band']]])
         col += 1
-        ws.write(row, col, exp_shrink_2w, get_shrink_pct_format(formats, exp_shrink_2w))
+        ws_write(row, col, exp_shrink_2w, shrink_formats[d[col_idx['expected_shrink_from_2w_band']]])
         col += 1
-        ws.write(row, col, lw_shrink, get_shrink_pct_format(formats, lw_shrink))
+        ws_write(row, col, lw_shrink, shrink_formats[d[col_idx['lw_shrink_pct_band']]])
         col += 1
         
-        # Weather severity counts
-        severe = d.get('severe_count', 0) or 0
-        high = d.get('high_count', 0) or 0
-        moderate = d.get('moderate_count', 0) or 0
-        low = d.get('low_count', 0) or 0
-        minimal = d.get('minimal_count', 0) or 0
-        
-        ws.write(row, col, severe, formats['severity_severe'] if severe > 0 else formats['number'])
-        col += 1
-        ws.write(row, col, high, formats['severity_high'] if high > 0 else formats['number'])
-        col += 1
-        ws.write(row, col, moderate, formats['severity_moderate'] if moderate > 0 else formats['number'])
-        col += 1
-        ws.write(row, col, low, formats['severity_low'] if low > 0 else formats['number'])
-        col += 1
-        ws.write(row, col, minimal, formats['severity_minimal'] if minimal > 0 else formats['number'])
-        col += 1
+        # Weather severity counts (highlighted when non-zero)
+        for count_key, count_fmt in severity_count_cols:
+            count = d[col_idx[count_key]]
+            ws_write(row, col, count, count_fmt if count > 0 else fmt_number)
+            col += 1
         
         # Avg weather
-        avg_sev = d.get('avg_weather_severity') or 0
-        ws.write(row, col, avg_sev, get_severity_format(formats, avg_sev))
+        avg_sev = d[col_idx['avg_weather_severity']]
+        ws_write(row, col, avg_sev, severity_formats[d[col_idx['avg_weather_severity_band']]])
         col += 1
-        ws.write(row, col, d.get('items_weather_adjusted'), formats['number'])
+        ws_write(row, col, d[col_idx['items_weather_adjusted']], fmt_number)
         col += 1
         
         # Delta from LW
-        ws.write(row, col, d.get('delta_from_lw'), formats['number'])
+        ws_write(row, col, d[col_idx['delta_from_lw']], fmt_number)
         col += 1
-        delta_pct = d.get('delta_from_lw_pct') or 0
-        ws.write(row, col, delta_pct, formats['pct'])
+        delta_pct = d[col_idx['delta_from_lw_pct']]
+        ws_write(row, col, delta_pct, fmt_pct)
         col += 1
         
-        # Accumulate totals
-        totals['stores'] = max(totals['stores'], d.get('store_count') or 0)
-        totals['items'] = max(totals['items'], d.get('item_count') or 0)
-        totals['lines'] += d.get('line_count') or 0
-        totals['pre_store_pass'] += d.get('total_forecast_pre_store_pass') or 0
-        totals['store_adj'] += d.get('total_store_level_adj') or 0
-        totals['pre_weather'] += d.get('total_forecast_pre_weather') or 0
-        totals['weather_adj'] += d.get('total_weather_adj') or 0
-        totals['forecast'] += d.get('total_forecast_qty') or 0
-        totals['forecast_avg'] += d.get('total_forecast_average') or 0
-        totals['w4_shipped'] += d.get('w4_shipped_total') or 0
-        totals['w3_shipped'] += d.get('w3_shipped_total') or 0
-        totals['w2_shipped'] += d.get('w2_shipped_total') or 0
-        totals['w1_shipped'] += d.get('w1_shipped_total') or 0
-        totals['w4_sold'] += d.get('w4_sold_total') or 0
-        totals['w3_sold'] += d.get('w3_sold_total') or 0
-        totals['w2_sold'] += d.get('w2_sold_total') or 0
-        totals['w1_sold'] += d.get('w1_sold_total') or 0
-        totals['severe'] += severe
-        totals['high'] += high
-        totals['moderate'] += moderate
-        totals['low'] += low
-        totals['minimal'] += minimal
-        totals['weather_adjusted'] += d.get('items_weather_adjusted') or 0
-        totals['delta'] += d.get('delta_from_lw') or 0
-        
         row += 1
     
     # Write totals row
-    _write_daily_totals_row(ws, row, totals, formats)
+    _write_daily_totals_row(ws, row, _daily_totals(df), formats)
     
     # Freeze panes
     ws.freeze_panes(4, 2)
@@ -234,6 +707,21 @@ def write_daily_summary_sheet(wb, conn, region: str,
     ws.autofilter(3, 0, row - 1, len(headers) - 1)
 
 
+def _daily_totals(df: pl.DataFrame) -> dict:
+    """
+    Aggregate the Daily Summary totals row in a single Polars select.
+    
+    Returns:
+        Dict keyed like DAILY_TOTALS_COLUMNS (all 0 when there is no data)
+    """
+    if df is None or df.is_empty():
+        return dict.fromkeys(DAILY_TOTALS_COLUMNS, 0)
+    return df.select([
+        getattr(pl.col(column), agg)().fill_null(0).alias(key)
+        for key, (column, agg) in DAILY_TOTALS_COLUMNS.items()
+    ]).row(0, named=True)
+
+
 def _write_daily_totals_row(ws, row, totals, formats):
     """Write the totals row for daily summary."""
     col = 0
@@ -321,31 +809,31 @@ def _write_daily_totals_row(ws, row, totals, formats):
 
 def write_store_summary_sheet(wb, conn, region: str,
                                start_date: str, end_date: str,
-                               formats: dict):
+                               formats: dict, prefetched: dict = None):
     """Create the Store Summary worksheet BY DATE."""
     ws = wb.add_worksheet('Store Summary')
     
     # Set column widths
-    ws.set_column('A:A', 12)   # Date
-    ws.set_column('B:B', 10)   # Day
-    ws.set_column('C:C', 10)   # Store #
-    ws.set_column('D:D', 22)   # Store name
-    ws.set_column('E:E', 8)    # Weather Icon
-    ws.set_column('F:G', 8)    # Items, Lines
-    ws.set_column('H:L', 12)   # Forecast quantities
-    ws.set_column('M:M', 14)   # Fcst Avg
-    ws.set_column('N:N', 26)   # Shipped Trend
-    ws.set_column('O:O', 26)   # Sold Trend
-    ws.set_column('P:Q', 11)   # Growth %
-    ws.set_column('R:U', 11)   # Expected Shrink columns
-    ws.set_column('V:W', 11)   # Weather severity
-    ws.set_column('X:Y', 12)   # Delta columns
+    ws.set_column(0, 0, 12)    # Date
+    ws.set_column(1, 1, 10)    # Day
+    ws.set_column(2, 2, 10)    # Store #
+    ws.set_column(3, 3, 22)    # Store name
+    ws.set_column(4, 4, 8)     # Weather Icon
+    ws.set_column(5, 6, 8)     # Items, Lines
+    ws.set_column(7, 11, 12)   # Forecast quantities
+    ws.set_column(12, 12, 14)  # Fcst Avg
+    ws.set_column(13, 13, 26)  # Shipped Trend
+    ws.set_column(14, 14, 26)  # Sold Trend
+    ws.set_column(15, 16, 11)  # Growth %
+    ws.set_column(17, 20, 11)  # Expected Shrink columns
+    ws.set_column(21, 22, 11)  # Weather severity
+    ws.set_column(23, 24, 12)  # Delta columns
     
     # Title
-    ws.merge_range('A1:Y1', f'Store Daily Summary - Region {region}', formats['title'])
-    ws.merge_range('A2:Y2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:Y1', f'Store Daily Summary - Region {region}', formats['title'])
+    ws.merge_range('A2:Y2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     # Column headers
     headers = [
@@ -366,114 +854,102 @@ def write_store_summary_sheet(wb, conn, region: str,
     ws.set_row(3, 40)
     
     # Get data
-    query = get_store_summary_query(region, start_date, end_date)
     try:
-        df = pl.from_pandas(conn.sql(query).to_df())
-        data = df.to_dicts()
+        df = _load_sheet_df(conn, 'store_summary', region, start_date, end_date, prefetched)
+        col_idx = {name: i for i, name in enumerate(df.columns)}
+        data = df.rows()
+        
+        # Same-format cell runs, picked out of each row tuple (see the loop)
+        quantity_values = itemgetter(*(
+            col_idx[c] for c in ('item_count', 'line_count', *SUMMARY_QUANTITY_COLUMNS)
+        ))
+        trend_values = itemgetter(*(col_idx[c] for c in SUMMARY_TREND_COLUMNS))
     except Exception as e:
         print(f"Error getting store summary: {e}")
         data = []
     
     # Write data rows
     row = 4
+    
+    # Bind per-row lookups to locals for the hot loop
+    ws_write = ws.write
+    ws_write_number = ws.write_number
+    ws_write_row = ws.write_row
+    fmt_date = formats['date']
+    fmt_text_center = formats['text_center']
+    fmt_number = formats['number']
+    fmt_text = formats['text']
+    fmt_trend = formats['trend']
+    fmt_pct = formats['pct']
+    shrink_formats = formats['shrink_pct_by_band']
+    growth_formats = formats['growth_pct_by_band']
+    severity_formats = formats['severity_by_bucket']
+    severity_by_category = formats['severity_by_category']
+    
     for d in data:
         col = 0
         
         # Date and Day
-        ws.write(row, col, d.get('forecast_date'), formats['date'])
+        ws_write_number(row, col, d[col_idx['forecast_date_serial']], fmt_date)
         col += 1
-        ws.write(row, col, d.get('day_name'), formats['text_center'])
+        ws_write(row, col, d[col_idx['day_name']], fmt_text_center)
         col += 1
         
         # Store info
-        ws.write(row, col, d.get('store_no'), formats['number'])
+        ws_write(row, col, d[col_idx['store_no']], fmt_number)
         col += 1
-        ws.write(row, col, d.get('store_name') or f"Store {d.get('store_no')}", formats['text'])
+        ws_write(row, col, d[col_idx['store_name_display']], fmt_text)
         col += 1
         
         # Weather indicator icon
-        weather_condition = d.get('weather_condition') or ''
-        severity_cat = d.get('max_severity_category') or 'MINIMAL'
-        severity_score = d.get('max_weather_severity') or 0
-        weather_icon = get_weather_indicator_icon(
-            condition=weather_condition,
-            severity_category=severity_cat,
-            severity_score=severity_score
-        )
-        ws.write(row, col, f"{weather_icon} {severity_cat}", get_severity_format(formats, severity_score, severity_cat))
-        col += 1
-        
-        # Counts
-        ws.write(row, col, d.get('item_count'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('line_count'), formats['number'])
-        col += 1
-        
-        # Forecast quantities
-        ws.write(row, col, d.get('total_forecast_pre_store_pass'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_store_level_adj'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_forecast_pre_weather'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_weather_adj'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_forecast_qty'), formats['number'])
-        col += 1
-        
-        # Forecast Average
-        ws.write(row, col, d.get('total_forecast_average'), formats['number'])
+        severity_cat = d[col_idx['max_severity_category']]
+        severity_score = d[col_idx['max_weather_severity']]
+        weather_icon = d[col_idx['weather_icon']]
+        severity_cat_fmt = severity_by_category.get(severity_cat.upper(), severity_formats[0])
+        ws_write(row, col, f"{weather_icon} {severity_cat}", severity_cat_fmt)
         col += 1
         
-        # Trends
-        shipped_trend = build_sales_trend_string(
-            d.get('w4_shipped_total'), d.get('w3_shipped_total'),
-            d.get('w2_shipped_total'), d.get('w1_shipped_total')
-        )
-        ws.write(row, col, shipped_trend, formats['trend'])
-        col += 1
-        
-        sold_trend = build_sales_trend_string(
-            d.get('w4_sold_total'), d.get('w3_sold_total'),
-            d.get('w2_sold_total'), d.get('w1_sold_total')
-        )
-        ws.write(row, col, sold_trend, formats['trend'])
-        col += 1
+        # Counts, forecast quantities and Fcst Avg, then the two trends
+        quantities = quantity_values(d)
+        ws_write_row(row, col, quantities, fmt_number)
+        col += len(quantities)
+        ws_write_row(row, col, trend_values(d), fmt_trend)
+        col += 2
         
         # Growth %
-        growth_w1 = d.get('growth_vs_w1_pct') or 0
-        growth_w2 = d.get('growth_vs_w2_pct') or 0
-        ws.write(row, col, growth_w1, get_growth_pct_format(formats, growth_w1))
+        growth_w1 = d[col_idx['growth_vs_w1_pct']]
+        growth_w2 = d[col_idx['growth_vs_w2_pct']]
+        ws_write(row, col, growth_w1, growth_formats[d[col_idx['growth_vs_w1_pct_band']]])
         col += 1
-        ws.write(row, col, growth_w2, get_growth_pct_format(formats, growth_w2))
+        ws_write(row, col, growth_w2, growth_formats[d[col_idx['growth_vs_w2_pct_band']]])
         col += 1
         
         # Expected Shrink
-        exp_shrink_avg = d.get('expected_shrink_from_avg') or 0
-        exp_shrink_lw = d.get('expected_shrink_from_lw') or 0
-        exp_shrink_2w = d.get('expected_shrink_from_2w') or 0
-        lw_shrink = d.get('lw_shrink_pct') or 0
+        exp_shrink_avg = d[col_idx['expected_shrink_from_avg']]
+        exp_shrink_lw = d[col_idx['expected_shrink_from_lw']]
+        exp_shrink_2w = d[col_idx['expected_shrink_from_2w']]
+        lw_shrink = d[col_idx['lw_shrink_pct']]
         
-        ws.write(row, col, exp_shrink_avg, get_shrink_pct_format(formats, exp_shrink_avg))
+        ws_write(row, col, exp_shrink_avg, shrink_formats[d[col_idx['expected_shrink_from_avg_band']]])
         col += 1
-        ws.write(row, col, exp_shrink_lw, get_shrink_pct_format(formats, exp_shrink_lw))
+        ws_write(row, col, exp_shrink_lw, shrink_formats[d[col_idx['expected_shrink_from_lw_band']]])
         col += 1
-        ws.write(row, col, exp_shrink_2w, get_shrink_pct_format(formats, exp_shrink_2w))
+        ws_write(row, col, exp_shrink_2w, shrink_formats[d[col_idx['expected_shrink_from_2w_band']]])
         col += 1
-        ws.write(row, col, lw_shrink, get_shrink_pct_format(formats, lw_shrink))
+        ws_write(row, col, lw_shrink, shrink_formats[d[col_idx['lw_shrink_pct_band']]])
         col += 1
         
         # Weather severity
-        ws.write(row, col, severity_score, get_severity_format(formats, severity_score))
+        ws_write(row, col, severity_score, severity_formats[d[col_idx['max_weather_severity_band']]])
         col += 1
-        ws.write(row, col, severity_cat, get_severity_format(formats, severity_score, severity_cat))
+        ws_write(row, col, severity_cat, severity_cat_fmt)
         col += 1
         
         # Delta
-        ws.write(row, col, d.get('delta_from_lw'), formats['number'])
+        ws_write(row, col, d[col_idx['delta_from_lw']], fmt_number)
         col += 1
-        delta_pct = d.get('delta_from_lw_pct') or 0
-        ws.write(row, col, delta_pct, formats['pct'])
+        delta_pct = d[col_idx['delta_from_lw_pct']]
+        ws_write(row, col, delta_pct, fmt_pct)
         col += 1
         
         row += 1
@@ -487,31 +963,31 @@ def write_store_summary_sheet(wb, conn, region: str,
 
 def write_item_summary_sheet(wb, conn, region: str,
                               start_date: str, end_date: str,
-                              formats: dict):
+                              formats: dict, prefetched: dict = None):
     """Create the Item Summary worksheet BY DATE."""
     ws = wb.add_worksheet('Item Summary')
     
     # Set column widths
-    ws.set_column('A:A', 12)   # Date
-    ws.set_column('B:B', 10)   # Day
-    ws.set_column('C:C', 12)   # Item #
-    ws.set_column('D:D', 35)   # Item Description
-    ws.set_column('E:F', 8)    # Stores, Lines
-    ws.set_column('G:K', 12)   # Forecast quantities
-    ws.set_column('L:L', 14)   # Fcst Avg
-    ws.set_column('M:M', 26)   # Shipped Trend
-    ws.set_column('N:N', 26)   # Sold Trend
-    ws.set_column('O:P', 11)   # Growth %
-    ws.set_column('Q:T', 11)   # Expected Shrink columns
-    ws.set_column('U:Y', 8)    # Weather severity counts
-    ws.set_column('Z:Z', 11)   # Avg Weather
-    ws.set_column('AA:AB', 12) # Delta, Delta %
+    ws.set_column(0, 0, 12)    # Date
+    ws.set_column(1, 1, 10)    # Day
+    ws.set_column(2, 2, 12)    # Item #
+    ws.set_column(3, 3, 35)    # Item Description
+    ws.set_column(4, 5, 8)     # Stores, Lines
+    ws.set_column(6, 10, 12)   # Forecast quantities
+    ws.set_column(11, 11, 14)  # Fcst Avg
+    ws.set_column(12, 12, 26)  # Shipped Trend
+    ws.set_column(13, 13, 26)  # Sold Trend
+    ws.set_column(14, 15, 11)  # Growth %
+    ws.set_column(16, 19, 11)  # Expected Shrink columns
+    ws.set_column(20, 24, 8)   # Weather severity counts
+    ws.set_column(25, 25, 11)  # Avg Weather
+    ws.set_column(26, 27, 12)  # Delta, Delta %
     
     # Title
-    ws.merge_range('A1:AB1', f'Item Daily Summary - Region {region}', formats['title'])
-    ws.merge_range('A2:AB2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:AB1', f'Item Daily Summary - Region {region}', formats['title'])
+    ws.merge_range('A2:AB2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     # Column headers
     headers = [
@@ -533,115 +1009,97 @@ def write_item_summary_sheet(wb, conn, region: str,
     ws.set_row(3, 40)
     
     # Get data
-    query = get_item_summary_query(region, start_date, end_date)
     try:
-        df = pl.from_pandas(conn.sql(query).to_df())
-        data = df.to_dicts()
+        df = _load_sheet_df(conn, 'item_summary', region, start_date, end_date, prefetched)
+        col_idx = {name: i for i, name in enumerate(df.columns)}
+        data = df.rows()
+        
+        # Same-format cell runs, picked out of each row tuple (see the loop)
+        quantity_values = itemgetter(*(
+            col_idx[c] for c in ('store_count', 'line_count', *SUMMARY_QUANTITY_COLUMNS)
+        ))
+        trend_values = itemgetter(*(col_idx[c] for c in SUMMARY_TREND_COLUMNS))
     except Exception as e:
         print(f"Error getting item summary: {e}")
         data = []
     
     # Write data rows
     row = 4
+    
+    # Bind per-row lookups to locals for the hot loop
+    ws_write = ws.write
+    ws_write_number = ws.write_number
+    ws_write_row = ws.write_row
+    fmt_date = formats['date']
+    fmt_text_center = formats['text_center']
+    fmt_number = formats['number']
+    fmt_text = formats['text']
+    fmt_trend = formats['trend']
+    severity_count_cols = _severity_count_columns(formats, SEVERITY_COUNT_COLUMNS)
+    fmt_pct = formats['pct']
+    shrink_formats = formats['shrink_pct_by_band']
+    growth_formats = formats['growth_pct_by_band']
+    severity_formats = formats['severity_by_bucket']
+    
     for d in data:
         col = 0
         
         # Basic info
-        ws.write(row, col, d.get('forecast_date'), formats['date'])
-        col += 1
-        ws.write(row, col, d.get('day_name'), formats['text_center'])
-        col += 1
-        ws.write(row, col, d.get('item_no'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('item_desc') or f"Item {d.get('item_no')}", formats['text'])
+        ws_write_number(row, col, d[col_idx['forecast_date_serial']], fmt_date)
         col += 1
-        ws.write(row, col, d.get('store_count'), formats['number'])
+        ws_write(row, col, d[col_idx['day_name']], fmt_text_center)
         col += 1
-        ws.write(row, col, d.get('line_count'), formats['number'])
+        ws_write(row, col, d[col_idx['item_no']], fmt_number)
         col += 1
-        
-        # Forecast quantities
-        ws.write(row, col, d.get('total_forecast_pre_store_pass'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_store_level_adj'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_forecast_pre_weather'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_weather_adj'), formats['number'])
-        col += 1
-        ws.write(row, col, d.get('total_forecast_qty'), formats['number'])
+        ws_write(row, col, d[col_idx['item_desc_display']], fmt_text)
         col += 1
         
-        # Forecast Average
-        ws.write(row, col, d.get('total_forecast_average'), formats['number'])
-        col += 1
-        
-        # Trends
-        shipped_trend = build_sales_trend_string(
-            d.get('w4_shipped_total'), d.get('w3_shipped_total'),
-            d.get('w2_shipped_total'), d.get('w1_shipped_total')
-        )
-        ws.write(row, col, shipped_trend, formats['trend'])
-        col += 1
-        
-        sold_trend = build_sales_trend_string(
-            d.get('w4_sold_total'), d.get('w3_sold_total'),
-            d.get('w2_sold_total'), d.get('w1_sold_total')
-        )
-        ws.write(row, col, sold_trend, formats['trend'])
-        col += 1
+        # Counts, forecast quantities and Fcst Avg, then the two trends
+        quantities = quantity_values(d)
+        ws_write_row(row, col, quantities, fmt_number)
+        col += len(quantities)
+        ws_write_row(row, col, trend_values(d), fmt_trend)
+        col += 2
         
         # Growth %
-        growth_w1 = d.get('growth_vs_w1_pct') or 0
-        growth_w2 = d.get('growth_vs_w2_pct') or 0
-        ws.write(row, col, growth_w1, get_growth_pct_format(formats, growth_w1))
+        growth_w1 = d[col_idx['growth_vs_w1_pct']]
+        growth_w2 = d[col_idx['growth_vs_w2_pct']]
+        ws_write(row, col, growth_w1, growth_formats[d[col_idx['growth_vs_w1_pct_band']]])
         col += 1
-        ws.write(row, col, growth_w2, get_growth_pct_format(formats, growth_w2))
+        ws_write(row, col, growth_w2, growth_formats[d[col_idx['growth_vs_w2_pct_band']]])
         col += 1
         
         # Expected Shrink
-        exp_shrink_avg = d.get('expected_shrink_from_avg') or 0
-        exp_shrink_lw = d.get('expected_shrink_from_lw') or 0
-        exp_shrink_2w = d.get('expected_shrink_from_2w') or 0
-        lw_shrink = d.get('lw_shrink_pct') or 0
+        exp_shrink_avg = d[col_idx['expected_shrink_from_avg']]
+        exp_shrink_lw = d[col_idx['expected_shrink_from_lw']]
+        exp_shrink_2w = d[col_idx['expected_shrink_from_2w']]
+        lw_shrink = d[col_idx['lw_shrink_pct']]
         
-        ws.write(row, col, exp_shrink_avg, get_shrink_pct_format(formats, exp_shrink_avg))
+        ws_write(row, col, exp_shrink_avg, shrink_formats[d[col_idx['expected_shrink_from_avg_band']]])
         col += 1
-        ws.write(row, col, exp_shrink_lw, get_shrink_pct_format(formats, exp_shrink_lw))
+        ws_write(row, col, exp_shrink_lw, shrink_formats[d[col_idx['expected_shrink_from_lw_band']]])
         col += 1
-        ws.write(row, col, exp_shrink_2w, get_shrink_pct_format(formats, exp_shrink_2w))
+        ws_write(row, col, exp_shrink_2w, shrink_formats[d[col_idx['expected_shrink_from_2w_band']]])
         col += 1
-        ws.write(row, col, lw_shrink, get_shrink_pct_format(formats, lw_shrink))
+        ws_write(row, col, lw_shrink, shrink_formats[d[col_idx['lw_shrink_pct_band']]])
         col += 1
         
-        # Weather severity counts
-        severe = d.get('severe_count', 0) or 0
-        high = d.get('high_count', 0) or 0
-        moderate = d.get('moderate_count', 0) or 0
-        low = d.get('low_count', 0) or 0
-        minimal = d.get('minimal_count', 0) or 0
-        
-        ws.write(row, col, severe, formats['severity_severe'] if severe > 0 else formats['number'])
-        col += 1
-        ws.write(row, col, high, formats['severity_high'] if high > 0 else formats['number'])
-        col += 1
-        ws.write(row, col, moderate, formats['severity_moderate'] if moderate > 0 else formats['number'])
-        col += 1
-        ws.write(row, col, low, formats['severity_low'] if low > 0 else formats['number'])
-        col += 1
-        ws.write(row, col, minimal, formats['severity_minimal'] if minimal > 0 else formats['number'])
-        col += 1
+        # Weather severity counts (highlighted when non-zero)
+        for count_key, count_fmt in severity_count_cols:
+            count = d[col_idx[count_key]]
+            ws_write(row, col, count, count_fmt if count > 0 else fmt_number)
+            col += 1
         
         # Avg weather
-        avg_sev = d.get('avg_weather_severity') or 0
-        ws.write(row, col, avg_sev, get_severity_format(formats, avg_sev))
+        avg_sev = d[col_idx['avg_weather_severity']]
+        ws_write(row, col, avg_sev, severity_formats[d[col_idx['avg_weather_severity_band']]])
         col += 1
         
         # Delta
-        ws.write(row, col, d.get('delta_from_lw'), formats['number'])
+        ws_write(row, col, d[col_idx['delta_from_lw']], fmt_number)
         col += 1
-        delta_pct = d.get('delta_from_lw_pct') or 0
-        ws.write(row, col, delta_pct, formats['pct'])
+        delta_pct = d[col_idx['delta_from_lw_pct']]
+        ws_write(row, col, delta_pct, fmt_pct)
         col += 1
         
         row += 1
@@ -653,32 +1111,107 @@ def write_item_summary_sheet(wb, conn, region: str,
     ws.autofilter(3, 0, row - 1, len(headers) - 1)
 
 
+def _item_detail_cell_kind(header: str) -> str:
+    """Classify an Item Details column by how its cells are formatted."""
+    if 'Date' in header:
+        return 'date'
+    if 'Shrink' in header and '%' in header:
+        return 'shrink_pct'
+    if 'Growth vs W' in header:
+        return 'growth_pct'
+    if header == 'Severity Category':
+        return 'severity_category'
+    if header == 'Weather Indicator':
+        return 'weather_indicator'
+    if header == 'Weather Severity':
+        return 'weather_severity'
+    if header in ('Day', 'Store Name', 'Item Description', 'Weather Condition'):
+        return 'text'
+    if 'Delta LW %' in header:
+        return 'pct'
+    if 'Cover' in header:
+        return 'cover'
+    return 'number'
+
+
+def _item_detail_segments(columns: list, col_idx: dict, formats: dict) -> list:
+    """
+    Plan the Item Details row layout once per sheet.
+    
+    Each column's cell kind is resolved to a writer step and its format up
+    front, so the row loop only dispatches on the step:
+    
+    - 'number': a run of adjacent plain number columns (one write_row call)
+    - 'write': a single cell with a fixed format (text, cover)
+    - 'serial': a date cell written as its serial helper column
+    - 'band_pct': a % cell whose format tuple is indexed by its band column
+    - 'pct': a % cell with a fixed format
+    - any other kind: the weather cells, handled by name
+    
+    Returns:
+        List of (step, start, stop, format, helper_col) column spans, where
+        helper_col is the position of the band / serial helper column
+    """
+    fixed_formats = {
+        'text': formats['text'],
+        'cover': formats['decimal2'],
+    }
+    band_formats = {
+        'shrink_pct': formats['shrink_pct_by_band'],
+        'growth_pct': formats['growth_pct_by_band'],
+    }
+    fmt_number = formats['number']
+    
+    segments = []
+    for col, header in enumerate(columns):
+        kind = _item_detail_cell_kind(header)
+        if kind == 'number':
+            if segments and segments[-1][0] == 'number' and segments[-1][2] == col:
+                segments[-1] = ('number', segments[-1][1], col + 1, fmt_number, None)
+            else:
+                segments.append(('number', col, col + 1, fmt_number, None))
+        elif kind in fixed_formats:
+            segments.append(('write', col, col + 1, fixed_formats[kind], None))
+        elif kind == 'date':
+            helper_col = col_idx[_item_detail_helper_column(header)]
+            segments.append(('serial', col, col + 1, formats['date'], helper_col))
+        elif kind in band_formats:
+            helper_col = col_idx[_item_detail_helper_column(header)]
+            segments.append(('band_pct', col, col + 1, band_formats[kind], helper_col))
+        elif kind == 'pct':
+            segments.append(('pct', col, col + 1, formats['pct'], None))
+        else:
+            segments.append((kind, col, col + 1, None, None))
+    return segments
+
+
 def write_item_detail_sheet(wb, conn, region: str,
                             start_date: str, end_date: str,
-                            formats: dict):
+                            formats: dict, prefetched: dict = None):
     """Create the Item Details worksheet with full detail."""
     ws = wb.add_worksheet('Item Details')
     
     # Title
-    ws.merge_range('A1:AD1', f'Item/Store Details - Region {region}', formats['title'])
-    ws.merge_range('A2:AD2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:AD1', f'Item/Store Details - Region {region}', formats['title'])
+    ws.merge_range('A2:AD2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
-    # Get data
-    query = get_item_detail_query(region, start_date, end_date)
+    # Get data: the detail is streamed in batches rather than fetched whole
     try:
-        df = pl.from_pandas(conn.sql(query).to_df())
+        df, batches = _load_sheet_stream(conn, 'item_detail', region, start_date, end_date,
+                                         prefetched)
     except Exception as e:
         print(f"Error getting item details: {e}")
         return
     
-    if len(df) == 0:
+    if df is None:
         ws.write(4, 0, "No data available", formats['text'])
         return
     
-    # Get column names
-    columns = df.columns
+    # Get column names (the trailing helper columns are not written)
+    col_idx = {name: i for i, name in enumerate(df.columns)}
+    columns = [c for c in df.columns if not c.startswith(ITEM_DETAIL_HELPER_PREFIX)]
     
     # Write headers
     for col, header in enumerate(columns):
@@ -708,54 +1241,53 @@ def write_item_detail_sheet(wb, conn, region: str,
     
     # Write data
     row = 4
-    data = df.to_dicts()
     
-    for d in data:
-        for col, header in enumerate(columns):
-            value = d.get(header)
+    # Bind per-row lookups to locals for the hot loop. Cells with a known type
+    # call xlsxwriter's typed writers directly to skip write()'s type dispatch
+    # (for the composed icon strings, also its number/URL/formula sniffing).
+    ws_write = ws.write
+    ws_write_number = ws.write_number
+    ws_write_string = ws.write_string
+    ws_write_row = ws.write_row
+    severity_formats = formats['severity_by_bucket']
+    severity_by_category = formats['severity_by_category']
+    
+    segments = _item_detail_segments(columns, col_idx, formats)
+    icon_col = col_idx[ITEM_DETAIL_ICON_COLUMN]
+    severity_col = col_idx['Weather Severity']
+    category_col = col_idx['Severity Category']
+    condition_col = col_idx['Weather Condition']
+    
+    for batch_df in chain((df,), batches):
+        for d in batch_df.iter_rows():
+            for step, col, stop, fmt, helper_col in segments:
+                # The most frequent steps are tested first
+                if step == 'number':
+                    ws_write_row(row, col, d[col:stop], fmt)
+                elif step == 'write':
+                    ws_write(row, col, d[col], fmt)
+                elif step == 'band_pct':
+                    ws_write_number(row, col, (d[col] or 0) / 100, fmt[d[helper_col]])
+                elif step == 'pct':
+                    ws_write_number(row, col, (d[col] or 0) / 100, fmt)
+                elif step == 'serial':
+                    ws_write_number(row, col, d[helper_col], fmt)
+                elif step == 'weather_severity':
+                    value = d[col]
+                    ws_write(row, col, value, severity_formats[severity_bucket(value or 0)])
+                elif step == 'severity_category':
+                    value = d[col]
+                    if value:
+                        severity_fmt = severity_by_category.get(value.upper(), severity_formats[0])
+                    else:
+                        severity_fmt = severity_formats[severity_bucket(d[severity_col] or 0)]
+                    ws_write_string(row, col, f"{d[icon_col]} {value or 'MINIMAL'}", severity_fmt)
+                else:
+                    severity_cat = d[category_col] or 'MINIMAL'
+                    weather_condition = d[condition_col] or ''
+                    ws_write_string(row, col, f"{d[icon_col]} {weather_condition}", severity_by_category.get(severity_cat.upper(), severity_formats[0]))
             
-            # Apply appropriate format
-            if 'Date' in header:
-                ws.write(row, col, value, formats['date'])
-            elif 'Shrink' in header and '%' in header:
-                pct_val = (value or 0) / 100
-                ws.write(row, col, pct_val, get_shrink_pct_format(formats, pct_val))
-            elif 'Growth vs W' in header:
-                pct_val = (value or 0) / 100
-                ws.write(row, col, pct_val, get_growth_pct_format(formats, pct_val))
-            elif header == 'Severity Category':
-                severity_score = d.get('Weather Severity') or 0
-                weather_condition = d.get('Weather Condition') or ''
-                severity_cat = value or 'MINIMAL'
-                icon = get_weather_indicator_icon(
-                    condition=weather_condition,
-                    severity_category=severity_cat,
-                    severity_score=severity_score
-                )
-                ws.write(row, col, f"{icon} {severity_cat}", get_severity_format(formats, severity_score, value))
-            elif header == 'Weather Indicator':
-                severity_score = d.get('Weather Severity') or 0
-                severity_cat = d.get('Severity Category') or 'MINIMAL'
-                weather_condition = d.get('Weather Condition') or ''
-                icon = get_weather_indicator_icon(
-                    condition=weather_condition,
-                    severity_category=severity_cat,
-                    severity_score=severity_score
-                )
-                ws.write(row, col, f"{icon} {weather_condition}", get_severity_format(formats, severity_score, severity_cat))
-            elif header == 'Weather Severity':
-                ws.write(row, col, value, get_severity_format(formats, value or 0))
-            elif header in ('Day', 'Store Name', 'Item Description', 'Weather Condition'):
-                ws.write(row, col, value, formats['text'])
-            elif 'Delta LW %' in header:
-                pct_val = (value or 0) / 100
-                ws.write(row, col, pct_val, formats['pct'])
-            elif 'Cover' in header:
-                ws.write(row, col, value, formats['decimal2'])
-            else:
-                ws.write(row, col, value, formats['number'])
-        
-        row += 1
+            row += 1
     
     # Freeze panes
     ws.freeze_panes(4, 6)
@@ -766,15 +1298,15 @@ def write_item_detail_sheet(wb, conn, region: str,
 
 def write_weather_impact_sheet(wb, conn, region: str,
                                start_date: str, end_date: str,
-                               formats: dict):
+                               formats: dict, prefetched: dict = None):
     """Create the Weather Impact Summary worksheet with comprehensive weather data."""
     ws = wb.add_worksheet('Weather Impact')
     
     # Title
-    ws.merge_range('A1:AD1', f'Weather Impact Summary - Region {region}', formats['title'])
-    ws.merge_range('A2:AD2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     ws.set_row(0, 30)
     ws.set_row(1, 25)
+    ws.merge_range('A1:AD1', f'Weather Impact Summary - Region {region}', formats['title'])
+    ws.merge_range('A2:AD2', f'Forecast Period: {start_date} to {end_date}', formats['subtitle'])
     
     current_row = 4
     
@@ -782,10 +1314,10 @@ def write_weather_impact_sheet(wb, conn, region: str,
     ws.merge_range(current_row, 0, current_row, 20, 'Daily Weather Summary', formats['section'])
     current_row += 1
     
-    query = get_weather_summary_by_date_query(region, start_date, end_date)
     try:
-        df = pl.from_pandas(conn.sql(query).to_df())
-        data = df.to_dicts()
+        df = _load_sheet_df(conn, 'weather_daily', region, start_date, end_date, prefetched)
+        col_idx = {name: i for i, name in enumerate(df.columns)}
+        data = df.rows()
     except Exception as e:
         print(f"Error getting weather summary: {e}")
         data = []
@@ -800,91 +1332,89 @@ def write_weather_impact_sheet(wb, conn, region: str,
                   'Avg Rain"', 'Avg Snow"', 'Avg Depth"', 'Avg Wind', 'Max Gust',
                   'Qty Adj', 'Items Adj']
         
-        for col, header in enumerate(headers):
-            ws.write(current_row, col, header, formats['col_header'])
+        ws.write_row(current_row, 0, headers, formats['col_header'])
         current_row += 1
         
+        # Bind per-row lookups to locals for the hot loop. Column positions
+        # are resolved once; runs of same-format cells are picked out of each
+        # row tuple with itemgetters and written with write_row. The date
+        # (as its precomputed serial) and count cells are never null, so they
+        # call write_number directly; nullable cells keep write()'s formatted
+        # blanks so the table borders stay intact.
+        ws_write = ws.write
+        ws_write_number = ws.write_number
+        ws_write_row = ws.write_row
+        fmt_date = formats['date']
+        fmt_text = formats['text']
+        fmt_number = formats['number']
+        severity_count_cols = tuple(
+            (col_idx[count_key], count_fmt)
+            for count_key, count_fmt in _severity_count_columns(formats, WEATHER_SEVERITY_COUNT_COLUMNS)
+        )
+        severity_formats = formats['severity_by_bucket']
+        fmt_decimal3 = formats['decimal3']
+        fmt_decimal = formats['decimal']
+        fmt_decimal2 = formats['decimal2']
+        
+        i_date_serial = col_idx['Date Serial']
+        i_day = col_idx['Day']
+        i_store_count = col_idx['Store Count']
+        severity_cols = tuple(
+            (col_idx[c], col_idx[_weather_band_column(c)]) for c in WEATHER_DAILY_SEVERITY_COLUMNS
+        )
+        i_avg_rain = col_idx['Avg Rain']
+        impact_values = itemgetter(col_idx['Avg Impact Factor'], col_idx['Min Impact Factor'])
+        temp_values = itemgetter(*(
+            col_idx[c] for c in ('Avg Temp Min', 'Avg Temp Max', 'Coldest Temp', 'Warmest Temp')
+        ))
+        precip_count_values = itemgetter(*(
+            col_idx[c] for c in ('Stores w/ Rain Likely', 'Stores w/ Rain',
+                                 'Stores w/ Snow', 'Stores w/ Snow Depth > 2in')
+        ))
+        metric_values = itemgetter(*(
+            col_idx[c] for c in ('Avg Snow', 'Avg Snow Depth', 'Avg Wind', 'Max Wind Gust')
+        ))
+        adjustment_values = itemgetter(col_idx['Total Qty Adj'], col_idx['Total Items Adj'])
+        
         for d in data:
             col = 0
-            ws.write(current_row, col, d.get('Date'), formats['date'])
+            ws_write_number(current_row, col, d[i_date_serial], fmt_date)
             col += 1
-            ws.write(current_row, col, d.get('Day'), formats['text'])
+            ws_write(current_row, col, d[i_day], fmt_text)
             col += 1
-            ws.write(current_row, col, d.get('Store Count'), formats['number'])
+            ws_write_number(current_row, col, d[i_store_count], fmt_number)
             col += 1
             
             # Severity counts with conditional formatting
-            severe_count = d.get('Severe', 0) or 0
-            high_count = d.get('High', 0) or 0
-            moderate_count = d.get('Moderate', 0) or 0
-            low_count = d.get('Low', 0) or 0
-            minimal_count = d.get('Minimal', 0) or 0
-            
-            ws.write(current_row, col, severe_count, 
-                    formats['severity_severe'] if severe_count > 0 else formats['number'])
-            col += 1
-            ws.write(current_row, col, high_count,
-                    formats['severity_high'] if high_count > 0 else formats['number'])
-            col += 1
-            ws.write(current_row, col, moderate_count,
-                    formats['severity_moderate'] if moderate_count > 0 else formats['number'])
-            col += 1
-            ws.write(current_row, col, low_count,
-                    formats['severity_low'] if low_count > 0 else formats['number'])
-            col += 1
-            ws.write(current_row, col, minimal_count,
-                    formats['severity_minimal'] if minimal_count > 0 else formats['number'])
-            col += 1
+            for count_i, count_fmt in severity_count_cols:
+                count = d[count_i]
+                ws_write(current_row, col, count, count_fmt if count > 0 else fmt_number)
+                col += 1
             
             # Severity scores
-            avg_sev = d.get('Avg Severity') or 0
-            max_sev = d.get('Max Severity') or 0
-            ws.write(current_row, col, avg_sev, get_severity_format(formats, avg_sev))
-            col += 1
-            ws.write(current_row, col, max_sev, get_severity_format(formats, max_sev))
-            col += 1
+            for sev_i, band_i in severity_cols:
+                ws_write(current_row, col, d[sev_i], severity_formats[d[band_i]])
+                col += 1
             
-            ws.write(current_row, col, d.get('Avg Impact Factor'), formats['decimal3'])
-            col += 1
-            ws.write(current_row, col, d.get('Min Impact Factor'), formats['decimal3'])
-            col += 1
+            ws_write_row(current_row, col, impact_values(d), fmt_decimal3)
+            col += 2
             
             # Temperatures
-            ws.write(current_row, col, d.get('Avg Temp Min'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Avg Temp Max'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Coldest Temp'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Warmest Temp'), formats['decimal'])
-            col += 1
+            ws_write_row(current_row, col, temp_values(d), fmt_decimal)
+            col += 4
             
             # Precipitation counts
-            ws.write(current_row, col, d.get('Stores w/ Rain Likely'), formats['number'])
-            col += 1
-            ws.write(current_row, col, d.get('Stores w/ Rain'), formats['number'])
-            col += 1
-            ws.write(current_row, col, d.get('Stores w/ Snow'), formats['number'])
-            col += 1
-            ws.write(current_row, col, d.get('Stores w/ Snow Depth > 2in'), formats['number'])
-            col += 1
+            ws_write_row(current_row, col, precip_count_values(d), fmt_number)
+            col += 4
             
             # Average weather metrics
-            ws.write(current_row, col, d.get('Avg Rain'), formats['decimal2'])
-            col += 1
-            ws.write(current_row, col, d.get('Avg Snow'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Avg Snow Depth'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Avg Wind'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Max Wind Gust'), formats['decimal'])
+            ws_write(current_row, col, d[i_avg_rain], fmt_decimal2)
             col += 1
+            ws_write_row(current_row, col, metric_values(d), fmt_decimal)
+            col += 4
             
             # Adjustment impact
-            ws.write(current_row, col, d.get('Total Qty Adj'), formats['number'])
-            col += 1
-            ws.write(current_row, col, d.get('Total Items Adj'), formats['number'])
+            ws_write_row(current_row, col, adjustment_values(d), fmt_number)
             
             current_row += 1
     
@@ -893,10 +1423,10 @@ def write_weather_impact_sheet(wb, conn, region: str,
     ws.merge_range(current_row, 0, current_row, 29, 'Store-Level Weather Details (Ranked by Severity)', formats['section'])
     current_row += 1
     
-    store_query = get_weather_store_detail_query(region, start_date, end_date)
     try:
-        store_df = pl.from_pandas(conn.sql(store_query).to_df())
-        store_data = store_df.to_dicts()
+        store_df = _load_sheet_df(conn, 'weather_store', region, start_date, end_date, prefetched)
+        store_col_idx = {name: i for i, name in enumerate(store_df.columns)}
+        store_data = store_df.rows()
     except Exception as e:
         print(f"Error getting store weather details: {e}")
         store_data = []
@@ -913,126 +1443,125 @@ def write_weather_impact_sheet(wb, conn, region: str,
                         'Score', 'Category', 'Impact',
                         'QtyAdj', 'Items']
         
-        # Set column widths for store detail section
-        col_widths = {
-            0: 4, 1: 11, 2: 10, 3: 8, 4: 20, 5: 18,
-            6: 6, 7: 6, 8: 7, 9: 7, 10: 7,
-            11: 6, 12: 6, 13: 6, 14: 6,
-            15: 7, 16: 7, 17: 7, 18: 7,
-            19: 7, 20: 7, 21: 7, 22: 6, 23: 7,
-            24: 6, 25: 10, 26: 7,
-            27: 8, 28: 6
-        }
-        for c, w in col_widths.items():
-            ws.set_column(c, c, w)
+        # Set column widths for store detail section (one call per run of
+        # equal widths)
+        ws.set_column(0, 0, 4)     # Indicator
+        ws.set_column(1, 1, 11)    # Date
+        ws.set_column(2, 2, 10)    # Day
+        ws.set_column(3, 3, 8)     # Store #
+        ws.set_column(4, 4, 20)    # Store Name
+        ws.set_column(5, 5, 18)    # Conditions
+        ws.set_column(6, 7, 6)     # Min/Max °F
+        ws.set_column(8, 10, 7)    # Precip", Precip%, Cover%
+        ws.set_column(11, 14, 6)   # Snow", Depth", Wind, Gust
+        ws.set_column(15, 21, 7)   # Vis(mi) through WindSv
+        ws.set_column(22, 22, 6)   # VisSv
+        ws.set_column(23, 23, 7)   # TempSv
+        ws.set_column(24, 24, 6)   # Score
+        ws.set_column(25, 25, 10)  # Category
+        ws.set_column(26, 26, 7)   # Impact
+        ws.set_column(27, 27, 8)   # QtyAdj
+        ws.set_column(28, 28, 6)   # Items
         
-        for col, header in enumerate(store_headers):
-            ws.write(current_row, col, header, formats['col_header'])
+        ws.write_row(current_row, 0, store_headers, formats['col_header'])
         current_row += 1
         
         # Write store detail rows
+        severity_formats = formats['severity_by_bucket']
+        severity_by_category = formats['severity_by_category']
+        
+        # Bind per-row lookups to locals for the hot loop. As in the daily
+        # section, column positions are resolved once and same-format runs
+        # are written with write_row.
+        ws_write = ws.write
+        ws_write_number = ws.write_number
+        ws_write_row = ws.write_row
+        fmt_date = formats['date']
+        fmt_text_center = formats['text_center']
+        fmt_number = formats['number']
+        fmt_text = formats['text']
+        fmt_decimal = formats['decimal']
+        fmt_decimal2 = formats['decimal2']
+        fmt_decimal3 = formats['decimal3']
+        
+        i_score = store_col_idx['Severity Score']
+        i_score_band = store_col_idx[_weather_band_column('Severity Score')]
+        i_category = store_col_idx['Category']
+        i_icon = store_col_idx['Weather Icon']
+        i_precip = store_col_idx['Precip (in)']
+        temp_values = itemgetter(store_col_idx['Temp Min'], store_col_idx['Temp Max'])
+        i_date_serial = store_col_idx['Date Serial']
+        i_day = store_col_idx['Day']
+        i_store_no = store_col_idx['Store #']
+        name_condition_values = itemgetter(store_col_idx['Store Name'], store_col_idx['Conditions'])
+        i_impact = store_col_idx['Impact Factor']
+        precip_pct_values = itemgetter(store_col_idx['Precip %'], store_col_idx['Precip Cover %'])
+        snow_wind_values = itemgetter(*(
+            store_col_idx[c] for c in ('Snow (in)', 'Snow Depth', 'Wind (mph)', 'Wind Gust')
+        ))
+        i_visibility = store_col_idx['Visibility']
+        atmosphere_values = itemgetter(*(
+            store_col_idx[c] for c in ('Humidity %', 'Cloud Cover %', 'Severe Risk')
+        ))
+        component_sev_cols = tuple(
+            (store_col_idx[c], store_col_idx[_weather_band_column(c)])
+            for c in WEATHER_COMPONENT_SEVERITY_COLUMNS
+        )
+        adjustment_values = itemgetter(store_col_idx['Qty Adjusted'], store_col_idx['Items Adj'])
+        
         for d in store_data:
             col = 0
             
-            # Weather indicator icon
-            severity_score = d.get('Severity Score') or 0
-            category = d.get('Category') or 'MINIMAL'
-            condition = d.get('Conditions') or ''
-            snow_amt = d.get('Snow (in)') or 0
-            rain_amt = d.get('Precip (in)') or 0
-            temp_min = d.get('Temp Min')
-            temp_max = d.get('Temp Max')
-            wind_speed = d.get('Wind (mph)') or 0
-            
-            weather_icon = get_weather_indicator_icon(
-                condition=condition,
-                severity_category=category,
-                snow_amount=snow_amt,
-                rain_amount=rain_amt,
-                temp_min=temp_min,
-                temp_max=temp_max,
-                wind_speed=wind_speed,
-                severity_score=severity_score
-            )
-            ws.write(current_row, col, weather_icon, get_severity_format(formats, severity_score, category))
+            # Weather indicator icon (precomputed in _prepare_weather_store)
+            severity_score = d[i_score]
+            category = d[i_category]
+            category_fmt = severity_by_category.get(category.upper(), severity_formats[0])
+            ws_write(current_row, col, d[i_icon], category_fmt)
             col += 1
             
-            ws.write(current_row, col, d.get('Date'), formats['date'])
-            col += 1
-            ws.write(current_row, col, d.get('Day'), formats['text_center'])
-            col += 1
-            ws.write(current_row, col, d.get('Store #'), formats['number'])
-            col += 1
-            ws.write(current_row, col, d.get('Store Name'), formats['text'])
+            ws_write_number(current_row, col, d[i_date_serial], fmt_date)
             col += 1
-            ws.write(current_row, col, d.get('Conditions') or '', formats['text'])
+            ws_write(current_row, col, d[i_day], fmt_text_center)
             col += 1
-            ws.write(current_row, col, d.get('Temp Min'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Temp Max'), formats['decimal'])
+            ws_write_number(current_row, col, d[i_store_no], fmt_number)
             col += 1
+            ws_write_row(current_row, col, name_condition_values(d), fmt_text)
+            col += 2
+            ws_write_row(current_row, col, temp_values(d), fmt_decimal)
+            col += 2
             
             # Precipitation details
-            ws.write(current_row, col, d.get('Precip (in)'), formats['decimal2'])
-            col += 1
-            ws.write(current_row, col, d.get('Precip %'), formats['number'])
-            col += 1
-            ws.write(current_row, col, d.get('Precip Cover %'), formats['number'])
+            ws_write(current_row, col, d[i_precip], fmt_decimal2)
             col += 1
+            ws_write_row(current_row, col, precip_pct_values(d), fmt_number)
+            col += 2
             
-            # Snow details
-            ws.write(current_row, col, d.get('Snow (in)'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Snow Depth'), formats['decimal'])
-            col += 1
-            
-            # Wind details
-            ws.write(current_row, col, d.get('Wind (mph)'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Wind Gust'), formats['decimal'])
-            col += 1
+            # Snow and wind details
+            ws_write_row(current_row, col, snow_wind_values(d), fmt_decimal)
+            col += 4
             
             # Atmosphere
-            ws.write(current_row, col, d.get('Visibility'), formats['decimal'])
-            col += 1
-            ws.write(current_row, col, d.get('Humidity %'), formats['number'])
-            col += 1
-            ws.write(current_row, col, d.get('Cloud Cover %'), formats['number'])
-            col += 1
-            ws.write(current_row, col, d.get('Severe Risk'), formats['number'])
+            ws_write(current_row, col, d[i_visibility], fmt_decimal)
             col += 1
+            ws_write_row(current_row, col, atmosphere_values(d), fmt_number)
+            col += 3
             
             # Component severity scores
-            rain_sev = d.get('Rain Sev') or 0
-            snow_sev = d.get('Snow Sev') or 0
-            wind_sev = d.get('Wind Sev') or 0
-            vis_sev = d.get('Vis Sev') or 0
-            temp_sev = d.get('Temp Sev') or 0
-            
-            ws.write(current_row, col, rain_sev, get_severity_format(formats, rain_sev))
-            col += 1
-            ws.write(current_row, col, snow_sev, get_severity_format(formats, snow_sev))
-            col += 1
-            ws.write(current_row, col, wind_sev, get_severity_format(formats, wind_sev))
-            col += 1
-            ws.write(current_row, col, vis_sev, get_severity_format(formats, vis_sev))
-            col += 1
-            ws.write(current_row, col, temp_sev, get_severity_format(formats, temp_sev))
-            col += 1
+            for sev_i, band_i in component_sev_cols:
+                ws_write(current_row, col, d[sev_i], severity_formats[d[band_i]])
+                col += 1
             
             # Severity Score with conditional formatting
-            ws.write(current_row, col, severity_score, get_severity_format(formats, severity_score))
+            ws_write(current_row, col, severity_score, severity_formats[d[i_score_band]])
             col += 1
             
             # Category with conditional formatting
-            ws.write(current_row, col, category, get_severity_format(formats, severity_score, category))
+            ws_write(current_row, col, category, category_fmt)
             col += 1
             
-            ws.write(current_row, col, d.get('Impact Factor'), formats['decimal3'])
-            col += 1
-            ws.write(current_row, col, d.get('Qty Adjusted'), formats['number'])
+            ws_write(current_row, col, d[i_impact], fmt_decimal3)
             col += 1
-            ws.write(current_row, col, d.get('Items Adj'), formats['number'])
+            ws_write_row(current_row, col, adjustment_values(d), fmt_number)
             
             current_row += 1
     
@@ -1041,17 +1570,12 @@ def write_weather_impact_sheet(wb, conn, region: str,
     ws.merge_range(current_row, 0, current_row, 5, 'Severity Category Legend:', formats['section'])
     current_row += 1
     
-    legend_items = [
-        (f"{SEVERITY_ICONS['SEVERE']} SEVERE (7-10)", 'severity_severe', 'Dangerous conditions - significant travel hazard'),
-        (f"{SEVERITY_ICONS['HIGH']} HIGH (5-7)", 'severity_high', 'Poor conditions - notable impact on foot traffic'),
-        (f"{SEVERITY_ICONS['MODERATE']} MODERATE (3-5)", 'severity_moderate', 'Fair conditions - some impact expected'),
-        (f"{SEVERITY_ICONS['LOW']} LOW (1.5-3)", 'severity_low', 'Minor conditions - minimal impact'),
-        (f"{SEVERITY_ICONS['MINIMAL']} MINIMAL (0-1.5)", 'severity_minimal', 'Good conditions - no weather impact'),
-    ]
-    
-    for label, fmt_key, desc in legend_items:
-        ws.write(current_row, 0, label, formats[fmt_key])
-        ws.merge_range(current_row, 1, current_row, 5, desc, formats['text'])
+    # Legend rows are static; only the format lookups are resolved here
+    ws_write = ws.write
+    fmt_text = formats['text']
+    for label, fmt_key, desc in SEVERITY_LEGEND_ITEMS:
+        ws_write(current_row, 0, label, formats[fmt_key])
+        ws.merge_range(current_row, 1, current_row, 5, desc, fmt_text)
         current_row += 1
     
     # Add component severity explanation
@@ -1059,18 +1583,11 @@ def write_weather_impact_sheet(wb, conn, region: str,
     ws.merge_range(current_row, 0, current_row, 8, 'Component Severity Scores (0-10 scale):', formats['section'])
     current_row += 1
     
-    severity_components = [
-        ('RainSv', 'Rain Severity', 'Based on precip amount × probability (0.05-1.0+ inches)'),
-        ('SnowSv', 'Snow Severity', 'Based on new snow amount + accumulated depth bonus'),
-        ('WindSv', 'Wind Severity', 'Compounds with rain/snow; minimal standalone impact'),
-        ('VisSv', 'Visibility Severity', 'Fog/low visibility (<0.5mi can trigger alone)'),
-        ('TempSv', 'Temperature Severity', 'Extreme cold (<10°F) or heat (>100°F); max 3.0'),
-    ]
-    
-    for abbrev, name, desc in severity_components:
-        ws.write(current_row, 0, abbrev, formats['col_header'])
-        ws.write(current_row, 1, name, formats['text'])
-        ws.merge_range(current_row, 2, current_row, 8, desc, formats['text'])
+    fmt_col_header = formats['col_header']
+    for abbrev, name, desc in SEVERITY_COMPONENT_LEGEND:
+        ws_write(current_row, 0, abbrev, fmt_col_header)
+        ws_write(current_row, 1, name, fmt_text)
+        ws.merge_range(current_row, 2, current_row, 8, desc, fmt_text)
         current_row += 1
     
     # Add weather icon legend
@@ -1078,22 +1595,10 @@ def write_weather_impact_sheet(wb, conn, region: str,
     ws.merge_range(current_row, 0, current_row, 5, 'Weather Condition Icons:', formats['section'])
     current_row += 1
     
-    icon_legend = [
-        (WEATHER_ICONS['severe'], 'Severe/Dangerous'),
-        (WEATHER_ICONS['thunderstorm'], 'Thunderstorm'),
-        (WEATHER_ICONS['snow_heavy'], 'Heavy Snow'),
-        (WEATHER_ICONS['snow'], 'Snow'),
-        (WEATHER_ICONS['rain_heavy'], 'Heavy Rain'),
-        (WEATHER_ICONS['rain'], 'Rain'),
-        (WEATHER_ICONS['fog'], 'Fog/Mist'),
-        (WEATHER_ICONS['wind'], 'High Wind'),
-        (WEATHER_ICONS['extreme_cold'], 'Extreme Cold'),
-        (WEATHER_ICONS['clear'], 'Clear/Sunny'),
-    ]
-    
-    for icon, desc in icon_legend:
-        ws.write(current_row, 0, icon, formats['text_center'])
-        ws.write(current_row, 1, desc, formats['text'])
+    fmt_text_center = formats['text_center']
+    for icon, desc in WEATHER_ICON_LEGEND:
+        ws_write(current_row, 0, icon, fmt_text_center)
+        ws_write(current_row, 1, desc, fmt_text)
         current_row += 1
     
     # Freeze panes
@@ -11,6 +11,7 @@ Modules:
 """
 
 from .engine import (
+    calculate_sales_metrics,
     calculate_base_forecast,
     apply_decline_adjustment,
     apply_high_shrink_adjustment
@@ -24,6 +25,7 @@ from .weather_adjustment import (
 )
 
 __all__ = [
+    'calculate_sales_metrics',
     'calculate_base_forecast',
     'apply_decline_adjustment',
     'apply_high_shrink_adjustment',
@@ -10,8 +10,14 @@ This module handles:
 - Sales volatility metrics
 """
 
+import math
 import numpy as np
-from typing import Tuple
+from typing import List, Tuple
+
+
+# Week offsets of (W1, W2, W3, W4) relative to the forecast week, as used by
+# calculate_sales_velocity
+WEEK_OFFSETS = np.array([0.0, -1.0, -2.0, -3.0])
 
 
 def calculate_sales_velocity(w4_sold: float, w3_sold: float, 
@@ -32,21 +38,26 @@ def calculate_sales_velocity(w4_sold: float, w3_sold: float,
         Slope of the best-fit line (weekly sales velocity)
         Returns 0.0 if insufficient data points
     """
-    # Time points relative to forecast date
-    weeks = np.array([-3, -2, -1, 0])
-    sales = np.array([w4_sold, w3_sold, w2_sold, w1_sold], dtype=float)
-    
-    # Only use valid (non-null/NaN) data points
-    valid_points = ~np.isnan(sales)
+    # Time points relative to forecast date; only valid (non-null/NaN) data
+    # points are used
+    points = [
+        (week, float(sold))
+        for week, sold in ((-3, w4_sold), (-2, w3_sold), (-1, w2_sold), (0, w1_sold))
+        if sold is not None and not math.isnan(sold)
+    ]
     
     # Need at least 2 points to calculate trend
-    if np.sum(valid_points) < 2:
+    if len(points) < 2:
         return 0.0
     
-    # polyfit returns coefficients [slope, intercept] for degree 1
-    slope = np.polyfit(weeks[valid_points], sales[valid_points], 1)[0]
+    # Closed-form least-squares slope: sum((x - x̄)(y - ȳ)) / sum((x - x̄)²).
+    # The weeks are distinct, so the denominator is never 0.
+    mean_week = sum(week for week, _ in points) / len(points)
+    mean_sold = sum(sold for _, sold in points) / len(points)
+    covariance = sum((week - mean_week) * (sold - mean_sold) for week, sold in points)
+    variance = sum((week - mean_week) ** 2 for week, _ in points)
     
-    return float(slope)
+    return covariance / variance
 
 
 def calculate_average_sold(w1_sold: float, w2_sold: float, 
@@ -136,7 +147,83 @@ def calculate_sales_volatility(w1_sold: float, w2_sold: float,
     return float(np.std(sold_arr[valid_mask]))
 
 
-def calculate_base_forecast(row: dict, weights: Tuple[float, float, float, float]) -> dict:
+def calculate_sales_metrics(rows: List[dict],
+                            weights: Tuple[float, float, float, float]) -> List[dict]:
+    """
+    Calculate the sales metrics of a batch of item-store rows in one pass.
+    
+    Vectorized equivalent of calculate_sales_velocity, calculate_average_sold,
+    calculate_ema and calculate_sales_volatility on every row's (cleaned)
+    weekly sales: the rows' W1-W4 sales are stacked into one array and each
+    metric is a handful of column operations instead of per-row NumPy calls
+    on four-element arrays. The slope uses the closed-form least-squares
+    formula over the valid weeks.
+    
+    Args:
+        rows: List of item-store row dictionaries with weekly sales
+        weights: Tuple of EMA weights (W1, W2, W3, W4)
+        
+    Returns:
+        The same rows, each updated with sales_velocity, average_sold, ema
+        and sales_volatility
+    """
+    if not rows:
+        return rows
+    
+    sold = np.array([
+        (row.get('w1_sold', 0) or 0, row.get('w2_sold', 0) or 0,
+         row.get('w3_sold', 0) or 0, row.get('w4_sold', 0) or 0)
+        for row in rows
+    ], dtype=float)
+    
+    # Only valid (non-NaN) weeks take part, as in the per-row functions
+    valid = ~np.isnan(sold)
+    valid_count = valid.sum(axis=1)
+    x = np.where(valid, WEEK_OFFSETS, 0.0)
+    y = np.where(valid, sold, 0.0)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Sales velocity: least-squares slope, 0 with fewer than 2 points
+        sum_x = x.sum(axis=1)
+        sum_y = y.sum(axis=1)
+        slope_num = valid_count * (x * y).sum(axis=1) - sum_x * sum_y
+        slope_den = valid_count * (x * x).sum(axis=1) - sum_x * sum_x
+        sales_velocity = np.where(valid_count >= 2, slope_num / slope_den, 0.0)
+        
+        # Average of the weeks with sales
+        has_sales = sold > 0
+        sales_weeks = has_sales.sum(axis=1)
+        average_sold = np.where(
+            sales_weeks > 0, np.where(has_sales, sold, 0.0).sum(axis=1) / sales_weeks, 0.0
+        )
+        
+        # EMA: weights normalized over the valid weeks
+        valid_weights = np.where(valid, np.array(weights, dtype=float), 0.0)
+        ema = np.where(
+            valid_count > 0, (valid_weights * y).sum(axis=1) / valid_weights.sum(axis=1), 0.0
+        )
+        
+        # Volatility: population standard deviation, 0 with fewer than 2 points
+        mean = sum_y / valid_count
+        squared_dev = np.where(valid, (sold - mean[:, None]) ** 2, 0.0)
+        sales_volatility = np.where(
+            valid_count >= 2, np.sqrt(squared_dev.sum(axis=1) / valid_count), 0.0
+        )
+    
+    for row, velocity, average, row_ema, volatility in zip(
+        rows, sales_velocity.tolist(), average_sold.tolist(),
+        ema.tolist(), sales_volatility.tolist()
+    ):
+        row['sales_velocity'] = velocity
+        row['average_sold'] = average
+        row['ema'] = row_ema
+        row['sales_volatility'] = volatility
+    
+    return rows
+
+
+def calculate_base_forecast(row: dict, weights: Tuple[float, float, float, float],
+                            metrics_calculated: bool = False) -> dict:
     """
     Calculate the base forecast metrics for a single item-store combination.
     
@@ -152,6 +239,8 @@ def calculate_base_forecast(row: dict, weights: Tuple[float, float, float, float
     Args:
         row: Dictionary containing item-store data with weekly sales
         weights: Tuple of EMA weights (W1, W2, W3, W4)
+        metrics_calculated: True when calculate_sales_metrics already set the
+            sales metrics on the row (batch pipeline); they are then reused
         
     Returns:
         Updated row dictionary with calculated metrics:
@@ -171,17 +260,19 @@ def calculate_base_forecast(row: dict, weights: Tuple[float, float, float, float
     w2_sold = row.get('w2_sold', 0) or 0
     w1_sold = row.get('w1_sold', 0) or 0
     
-    # Calculate metrics
-    sales_velocity = calculate_sales_velocity(w4_sold, w3_sold, w2_sold, w1_sold)
-    average_sold = calculate_average_sold(w1_sold, w2_sold, w3_sold, w4_sold)
-    ema = calculate_ema(w1_sold, w2_sold, w3_sold, w4_sold, weights)
-    sales_volatility = calculate_sales_volatility(w1_sold, w2_sold, w3_sold, w4_sold)
-    
-    # Store calculated values
-    row['sales_velocity'] = sales_velocity
-    row['average_sold'] = average_sold
-    row['ema'] = ema
-    row['sales_volatility'] = sales_volatility
+    # Calculate metrics (unless calculate_sales_metrics already did)
+    if metrics_calculated:
+        average_sold = row['average_sold']
+        ema = row['ema']
+    else:
+        average_sold = calculate_average_sold(w1_sold, w2_sold, w3_sold, w4_sold)
+        ema = calculate_ema(w1_sold, w2_sold, w3_sold, w4_sold, weights)
+        
+        # Store calculated values
+        row['sales_velocity'] = calculate_sales_velocity(w4_sold, w3_sold, w2_sold, w1_sold)
+        row['average_sold'] = average_sold
+        row['ema'] = ema
+        row['sales_volatility'] = calculate_sales_volatility(w1_sold, w2_sold, w3_sold, w4_sold)
     
     # Initialize baseline tracking fields
     row['baseline_source'] = 'lw_sales'
@@ -42,6 +42,7 @@ Usage:
 
 from typing import Dict, List, Tuple
 from copy import deepcopy
+from functools import lru_cache
 
 
 # =============================================================================
@@ -228,12 +229,16 @@ def build_weather_status_indicator(row: dict) -> str:
     return " | ".join(parts)
 
 
+@lru_cache(maxsize=65536)
 def build_sales_trend_string(w4_sold, w3_sold, w2_sold, w1_sold) -> str:
     """
     Build a visual sales trend string showing 4 weeks of data.
     
     Format: W4 → W3 → W2 → W1 (oldest to newest)
     
+    Cached on the four weekly values: the same store-item usually repeats
+    its tuple across forecast dates, as do all-zero / missing histories.
+    
     Args:
         w4_sold: Week 4 sales (oldest)
         w3_sold: Week 3 sales
@@ -26,7 +26,6 @@ import os
 import sys
 import math
 from datetime import datetime, timedelta
-from copy import deepcopy
 from decimal import Decimal
 import concurrent.futures
 
@@ -50,6 +49,7 @@ from data.aggregates import (
     populate_all_aggregates
 )
 from forecasting.engine import (
+    calculate_sales_metrics,
     calculate_base_forecast,
     apply_decline_adjustment,
     apply_high_shrink_adjustment
@@ -162,6 +162,9 @@ def process_forecast_row(row: dict, params: dict, current_date: datetime,
     """
     Process a single forecast row through all pipeline steps.
     
+    The row's sales metrics must already be calculated for the whole batch
+    with calculate_sales_metrics.
+    
     Args:
         row: Raw data row
         params: Forecast parameters
@@ -186,7 +189,7 @@ def process_forecast_row(row: dict, params: dict, current_date: datetime,
     row = enrich_row_with_weather(row, vc_weather, accu_weather, owm_weather)
     
     # Step 2: Calculate base forecast (velocity, EMA, etc.)
-    row = calculate_base_forecast(row, params['WEEK_WEIGHTS'])
+    row = calculate_base_forecast(row, params['WEEK_WEIGHTS'], metrics_calculated=True)
     
     # Step 3: Apply decline adjustment
     row = apply_decline_adjustment(row)
@@ -323,9 +326,14 @@ def main():
             
             # Process each scenario
             for params in param_sets:
-                data = deepcopy(source_data)
+                # Rows only hold scalars from the query, so a shallow copy per
+                # row isolates scenarios without deepcopy's recursive walk
+                data = [dict(row) for row in source_data]
                 forecast_results = []
                 
+                # Sales metrics (velocity, EMA, ...) for all rows in one vectorized pass
+                calculate_sales_metrics(data, params['WEEK_WEIGHTS'])
+                
                 # Process each row through base forecast pipeline
                 for row in data:
                     # Skip inactive stores